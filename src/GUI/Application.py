@@ -1,5 +1,6 @@
 """Representa um GUI."""
 
+from itertools import islice
 from tkinter.ttk import Style
 from tkinter import Tk, PhotoImage
 
@@ -8,6 +9,8 @@ from tkinter import Tk, PhotoImage
 from structs.Pagina import Pagina
 from structs.Tabela import Tabela
 from structs.Bucket import BucketManager
+from structs.IndiceArquivo import IndiceArquivo
+from structs.FuncaoHash import FuncaoHash
 from GUI.containers.Master import Master
 
 class Application(Tk):
@@ -16,6 +19,8 @@ class Application(Tk):
     Args:
         Tk (Tk): Aplicação top-level.
     """
+    # Qntd. máxima de chaves listadas na saída do Table Scan.
+    MAX_SCAN_LISTING: int = 1000
     # Comprimento e Largura da aplicação.
     width: int
     height: int
@@ -26,14 +31,28 @@ class Application(Tk):
     # Variáveis referentes ao funcionamento do índice hash.
     page: Pagina
     table: Tabela
-    bucket: BucketManager
-
-    def __init__(self, title: str, table: Tabela, width: int = 800, height: int = 600) -> None:
+    # Arquivo em disco para as Páginas e o seu Buffer Pool (opcionais).
+    page_file: str
+    buffer_frames: int
+    buffer_policy: str
+    bucket: BucketManager | IndiceArquivo
+
+    def __init__(self, title: str, table: Tabela, width: int = 800, height: int = 600,
+                 hash_strategy: str = FuncaoHash.ESTRATEGIA_PADRAO,
+                 page_file: str = None, buffer_frames: int = None,
+                 buffer_policy: str = "lru", index: IndiceArquivo = None) -> None:
         super().__init__()
         # Configura as variáveis do índice hash.
         self.table = table
-        self.bucket = BucketManager(self.table.get_size())
-        self.bucket.insert_data_from_table(self.table)
+        self.page_file = page_file
+        self.buffer_frames = buffer_frames
+        self.buffer_policy = buffer_policy
+        # Usa o Arquivo de Índice, se informado, em vez de construir os Buckets.
+        if index is not None:
+            self.bucket = index
+        else:
+            self.bucket = BucketManager(self.table.get_size(), hash_strategy)
+            self.bucket.insert_data_from_table(self.table)
         # Define o título da aplicação.
         self.title(title)
         # Define a resolução da aplicação.
@@ -97,6 +116,9 @@ class Application(Tk):
         """
         self.page = Pagina(new_page_size)
         self.page.insert(self.table)
+        # Grava as Páginas em disco, caso um arquivo tenha sido definido.
+        if self.page_file is not None:
+            self.page.write_to_file(self.page_file, self.buffer_frames, self.buffer_policy)
         # Exibe na saída a quantidade de páginas criadas e o tamanho fixo.
         self.master_container.render_to_output(
             "1. O tamanho das páginas foi modificado!\n" +
@@ -123,11 +145,17 @@ class Application(Tk):
         # Faz o Table Scan nos 'N' primeiros registros.
         tuples_range = self.table.table_scan(key, count)
         if tuples_range:
+            # Lista somente as primeiras chaves, o intervalo não é copiado.
+            omitted = len(tuples_range) - self.MAX_SCAN_LISTING
             self.master_container.render_to_output(
                 f"1. O registro com a chave '{key}' foi encontrado!\n" +
                 f"2. Estimativa de custo de acesso é de '{tuples_range[-1].get_page_index()}'\n" +
                 "3. Listagem das chaves do Table Scan:\n" +
-                '\n'.join(f"Chave: '{k.get_data()}'" for k in tuples_range)
+                '\n'.join(
+                    f"Chave: '{k.get_data()}'"
+                    for k in islice(tuples_range, self.MAX_SCAN_LISTING)
+                ) +
+                (f"\n... e mais '{omitted}' chaves." if omitted > 0 else "")
             )
         else:
             # Exibe na saída que nenhum registro com determinada chave foi encontrada.
@@ -2,37 +2,60 @@
 
 # pylint: disable=import-error
 
-from structs.Tupla import Tupla
 from structs.Tabela import Tabela
+from structs.TabelaColunar import TabelaColunar
+from structs.Bucket import BucketManager
+from structs.LeitorArquivo import LeitorArquivo
+from structs.IndiceArquivo import IndiceArquivo
 from GUI.Application import Application
 
-def read_input(path: str) -> Tabela:
+def read_input(path: str, bucket: BucketManager = None) -> Tabela:
     """Faz a leitura de dados de um arquivo,
     criando Tuplas e armazenando-as em Tabelas.
 
     Args:
         path (str): O caminho do arquivo.
+        bucket (BucketManager, optional): Os Buckets preenchidos
+        durante a leitura.
+        Valor padrão 'None'.
 
     Returns:
         Tabela: A Tabela com todas as Tuplas
         registradas.
     """
-    # Cria uma Tabela temporária.
-    _tabela: Tabela = Tabela()
-    # Lê o arquivo de entrada.
-    with open(path, 'r', encoding='UTF-8') as file:
-        for line in file:
-            # Remove espaços no começo e final da linha.
-            line = line.strip()
-            # Insere uma nova Tupla na Tabela.
-            _tabela.insert(Tupla(dado=line))
-    # Retorna a Tabela com todas as Tuplas registradas.
-    return _tabela
+    # Lê o arquivo de entrada (em lotes) em uma Tabela colunar,
+    # inserindo cada lote nos Buckets enquanto o próximo é lido.
+    return LeitorArquivo(path).load(TabelaColunar(), bucket=bucket)
+
+def open_index(path: str, index_path: str) -> IndiceArquivo:
+    """Abre o Arquivo de Índice de um arquivo de entrada,
+    construindo-o (e gravando-o) somente se ele não existir,
+    estiver corrompido ou se o arquivo de entrada tiver mudado.
+
+    Args:
+        path (str): O caminho do arquivo de entrada.
+        index_path (str): O caminho do Arquivo de Índice.
+
+    Returns:
+        IndiceArquivo: O Arquivo de Índice aberto.
+    """
+    if IndiceArquivo.is_up_to_date(index_path, path):
+        try:
+            return IndiceArquivo(index_path)
+        except ValueError:
+            # Corpo corrompido ou truncado, reconstrói o índice.
+            pass
+    # Os Buckets são dimensionados pela qntd. (exata) de linhas.
+    bucket = BucketManager(LeitorArquivo(path).count_lines())
+    table = read_input(path, bucket)
+    IndiceArquivo.write(index_path, bucket, table, path)
+    return IndiceArquivo(index_path)
 
 def main() -> None:
     """Função Principal."""
+    index = open_index("words.txt", "words.idx")
     # Inicializa a aplicação.
-    Application("Índice Hash", read_input("words.txt"))
+    Application("Índice Hash", index.get_table(), index=index)
 
 if __name__ == "__main__":
     main()
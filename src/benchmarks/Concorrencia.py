@@ -0,0 +1,128 @@
+"""Benchmark de estresse do BucketManager concorrente.
+Mede a vazão (operações por segundo) de várias threads
+leitoras (buscas) enquanto threads escritoras inserem
+Tuplas, aumentando a quantidade de threads.
+
+Uso (a partir de 'src'):
+    python -m benchmarks.Concorrencia words.txt --threads 1 2 4 8
+"""
+
+from argparse import ArgumentParser
+from random import Random
+from threading import Barrier, Thread
+from time import perf_counter
+from typing import Dict, List
+
+# pylint: disable=import-error
+
+from structs.Tupla import Tupla
+from structs.Tabela import Tabela
+from structs.Bucket import BucketManager
+from structs.LeitorArquivo import LeitorArquivo
+from structs.TabelaColunar import TabelaColunar
+
+def run_stress(tabela: Tabela, quantidade_threads: int, duracao: float = 2.0,
+               threads_escritoras: int = 1, modo_linear: bool = False,
+               quantidade_travas: int = 16) -> Dict[str, float]:
+    """Executa uma rodada do benchmark: metade das chaves é carregada
+    antes, as threads leitoras buscam essas chaves e as escritoras
+    inserem a outra metade até o fim da duração.
+
+    Ao final, todas as Tuplas inseridas são procuradas novamente,
+    verificando que nenhuma inserção concorrente foi perdida.
+
+    Args:
+        tabela (Tabela): A Tabela com as chaves.
+        quantidade_threads (int): A qntd. de threads leitoras.
+        duracao (float, optional): A duração (em segundos) da rodada.
+        Valor padrão '2.0'.
+        threads_escritoras (int, optional): A qntd. de threads escritoras.
+        Valor padrão '1'.
+        modo_linear (bool, optional): Usa o Hash Linear (com splits).
+        Valor padrão 'False'.
+        quantidade_travas (int, optional): A qntd. de faixas (Travas).
+        Valor padrão '16'.
+
+    Returns:
+        Dict[str, float]: A vazão de buscas ('buscas_por_segundo') e de
+        inserções ('insercoes_por_segundo') e a qntd. de inserções.
+
+    Raises:
+        ValueError: Caso alguma Tupla inserida não seja encontrada.
+    """
+    chaves: List[str] = [tupla.get_data() for tupla in tabela.get_tuples()]
+    metade: int = len(chaves) // 2
+    bucket = BucketManager(len(chaves), modo_linear=modo_linear,
+                           concorrente=True, quantidade_travas=quantidade_travas)
+    bucket.insert_data_batch([Tupla(chave) for chave in chaves[:metade]])
+    pendentes: List[str] = chaves[metade:]
+
+    buscas: List[int] = [0] * quantidade_threads
+    insercoes: List[List[Tupla]] = [[] for _ in range(0, threads_escritoras)]
+    barreira = Barrier(quantidade_threads + threads_escritoras + 1)
+    fim: List[float] = [0.0]
+
+    def reader(indice: int) -> None:
+        aleatorio = Random(indice)
+        barreira.wait()
+        total: int = 0
+        while perf_counter() < fim[0]:
+            for _ in range(0, 64):
+                bucket.search_data(chaves[aleatorio.randrange(0, metade)])
+            total += 64
+        buscas[indice] = total
+
+    def writer(indice: int) -> None:
+        barreira.wait()
+        for posicao in range(indice, len(pendentes), threads_escritoras):
+            if perf_counter() >= fim[0]:
+                break
+            tupla = Tupla(pendentes[posicao])
+            bucket.insert_data(tupla)
+            insercoes[indice].append(tupla)
+
+    threads: List[Thread] = [Thread(target=reader, args=(i,)) for i in range(0, quantidade_threads)]
+    threads.extend(Thread(target=writer, args=(i,)) for i in range(0, threads_escritoras))
+    for thread in threads:
+        thread.start()
+    fim[0] = perf_counter() + duracao
+    barreira.wait()
+    inicio: float = perf_counter()
+    for thread in threads:
+        thread.join()
+    tempo: float = perf_counter() - inicio
+
+    inseridas: List[Tupla] = [tupla for grupo in insercoes for tupla in grupo]
+    for tupla in inseridas:
+        if bucket.search_data(tupla.get_data())[0] is None:
+            raise ValueError(f"Inserção concorrente perdida: '{tupla.get_data()}'.")
+    return {
+        "buscas_por_segundo": sum(buscas) / tempo,
+        "insercoes_por_segundo": len(inseridas) / tempo,
+        "insercoes": float(len(inseridas))
+    }
+
+def main() -> None:
+    """Executa o benchmark para cada qntd. de threads e imprime a vazão."""
+    parser = ArgumentParser(description="Benchmark de estresse do BucketManager concorrente.")
+    parser.add_argument("arquivo", help="O arquivo de entrada (uma chave por linha).")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16],
+                        help="As qntds. de threads leitoras.")
+    parser.add_argument("--escritoras", type=int, default=1, help="A qntd. de threads escritoras.")
+    parser.add_argument("--duracao", type=float, default=2.0, help="A duração de cada rodada.")
+    parser.add_argument("--travas", type=int, default=16, help="A qntd. de faixas (Travas).")
+    parser.add_argument("--linear", action="store_true", help="Usa o Hash Linear.")
+    argumentos = parser.parse_args()
+
+    tabela: Tabela = LeitorArquivo(argumentos.arquivo).load(TabelaColunar())
+    print(f"{'threads':>8} {'buscas/s':>12} {'insercoes/s':>12}")
+    for quantidade_threads in argumentos.threads:
+        resultado: Dict[str, float] = run_stress(
+            tabela, quantidade_threads, argumentos.duracao, argumentos.escritoras,
+            argumentos.linear, argumentos.travas
+        )
+        print(f"{quantidade_threads:>8} {resultado['buscas_por_segundo']:>12.0f} "
+              f"{resultado['insercoes_por_segundo']:>12.0f}")
+
+if __name__ == "__main__":
+    main()
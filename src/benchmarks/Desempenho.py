@@ -0,0 +1,214 @@
+"""Benchmark de desempenho do Índice Hash.
+Para cada gerador de chaves e tamanho, mede a construção
+(Tabela, Paginas e Buckets), as buscas com e sem sucesso nos
+Buckets (e nos Buckets Compactos), a leitura da Pagina e o
+Table Scan, emitindo os resultados em JSON e uma tabela resumo.
+
+Uso (a partir de 'src'):
+    python -m benchmarks.Desempenho --tamanhos 1000 10000 100000 --saida resultados.json
+"""
+
+import json
+from argparse import ArgumentParser
+from random import Random
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Sequence
+
+# pylint: disable=import-error
+
+from structs.Pagina import Pagina
+from structs.Bucket import BucketManager
+from structs.BucketCompacto import BucketCompacto
+from structs.FuncaoHash import FuncaoHash
+from structs.TabelaColunar import TabelaColunar
+from benchmarks.Geradores import GERADORES
+
+# Colunas da tabela resumo: (título, chave do resultado, largura, formato).
+COLUNAS_RESUMO: Sequence[tuple] = (
+    ("gerador", "gerador", 10, ""),
+    ("tamanho", "tamanho", 9, ""),
+    ("build(s)", "construcao_total", 9, ".3f"),
+    ("hit(us)", "busca_sucesso_us", 9, ".2f"),
+    ("miss(us)", "busca_falha_us", 9, ".2f"),
+    ("csr(s)", "construcao_compacto", 9, ".3f"),
+    ("csr(us)", "busca_compacto_us", 9, ".2f"),
+    ("page(us)", "pagina_us", 9, ".2f"),
+    ("scan(ms)", "table_scan_ms", 9, ".2f"),
+    ("cadeia", "maior_cadeia", 7, "")
+)
+
+def time_per_operation(operacao: Callable[[Any], Any], argumentos: Sequence[Any]) -> float:
+    """Mede o tempo médio (em segundos) de uma operação.
+
+    Args:
+        operacao (Callable[[Any], Any]): A operação.
+        argumentos (Sequence[Any]): O argumento de cada execução.
+
+    Returns:
+        float: O tempo médio por execução ou '0.0' se não houver argumentos.
+    """
+    if not argumentos:
+        return 0.0
+    inicio: float = perf_counter()
+    for argumento in argumentos:
+        operacao(argumento)
+    return (perf_counter() - inicio) / len(argumentos)
+
+def run_configuration(gerador: str, tamanho: int, consultas: int = 2000,
+                      varreduras: int = 20, tamanho_pagina: int = 100,
+                      estrategia_hash: str = FuncaoHash.ESTRATEGIA_PADRAO,
+                      semente: int = 0) -> Dict[str, Any]:
+    """Executa o benchmark de uma configuração (gerador e tamanho).
+
+    Args:
+        gerador (str): O nome do gerador de chaves (ver 'GERADORES').
+        tamanho (int): A qntd. de chaves.
+        consultas (int, optional): A qntd. de buscas com e sem sucesso.
+        Valor padrão '2000'.
+        varreduras (int, optional): A qntd. de Table Scans.
+        Valor padrão '20'.
+        tamanho_pagina (int, optional): O tamanho das Paginas.
+        Valor padrão '100'.
+        estrategia_hash (str, optional): O nome da estratégia de hash.
+        Valor padrão 'FuncaoHash.ESTRATEGIA_PADRAO'.
+        semente (int, optional): A semente aleatória.
+        Valor padrão '0'.
+
+    Returns:
+        Dict[str, Any]: Os tempos (construção em segundos, buscas e
+        leitura da Pagina em microssegundos, Table Scan em milissegundos)
+        e as estatísticas dos Buckets. A construção dos Buckets Compactos
+        fica fora de 'construcao_total'.
+
+    Raises:
+        ValueError: Caso o gerador não exista ou alguma busca falhe.
+    """
+    if gerador not in GERADORES:
+        raise ValueError(f"Gerador '{gerador}' inexistente.")
+    chaves: List[str] = GERADORES[gerador](tamanho, semente)
+    resultado: Dict[str, Any] = {
+        "gerador": gerador, "tamanho": tamanho, "estrategia_hash": estrategia_hash
+    }
+
+    # Construção: Tabela, Paginas e Buckets.
+    inicio: float = perf_counter()
+    tabela = TabelaColunar()
+    tabela.insert_keys(chave.encode("UTF-8") for chave in chaves)
+    resultado["construcao_tabela"] = perf_counter() - inicio
+    inicio = perf_counter()
+    pagina = Pagina(tamanho_pagina)
+    pagina.insert(tabela)
+    resultado["construcao_paginas"] = perf_counter() - inicio
+    inicio = perf_counter()
+    bucket = BucketManager(tabela.get_size(), estrategia_hash)
+    bucket.insert_data_from_table(tabela)
+    resultado["construcao_buckets"] = perf_counter() - inicio
+    resultado["construcao_total"] = (
+        resultado["construcao_tabela"] + resultado["construcao_paginas"]
+        + resultado["construcao_buckets"]
+    )
+
+    # Buscas com sucesso, sem sucesso e leitura da Pagina das Tuplas encontradas.
+    aleatorio = Random(semente)
+    presentes: List[str] = [aleatorio.choice(chaves) for _ in range(0, consultas)]
+    ausentes: List[str] = [f"{chave}#ausente" for chave in presentes]
+    resultado["busca_sucesso_us"] = time_per_operation(bucket.search_data, presentes) * 1e6
+    resultado["busca_falha_us"] = time_per_operation(bucket.search_data, ausentes) * 1e6
+    tuplas = [bucket.search_data(chave)[0] for chave in presentes]
+    if any(tupla is None for tupla in tuplas):
+        raise ValueError(f"Busca sem sucesso de uma chave existente ({gerador}, {tamanho}).")
+    resultado["pagina_us"] = time_per_operation(
+        lambda tupla: pagina.search(tupla, tupla.get_page_index()), tuplas
+    ) * 1e6
+
+    # Os mesmos Buckets em um único vetor contíguo (Buckets Compactos).
+    inicio = perf_counter()
+    compacto = BucketCompacto(tabela.get_size(), estrategia_hash)
+    compacto.insert_data_from_table(tabela)
+    resultado["construcao_compacto"] = perf_counter() - inicio
+    resultado["busca_compacto_us"] = time_per_operation(compacto.search_data, presentes) * 1e6
+    if any(compacto.search_data(chave)[0] is None for chave in presentes[:100]):
+        raise ValueError(f"Busca sem sucesso nos Buckets Compactos ({gerador}, {tamanho}).")
+
+    # Table Scan até as chaves sorteadas e, sem sucesso, até o fim da Tabela.
+    resultado["table_scan_ms"] = time_per_operation(
+        tabela.table_scan, presentes[:varreduras]
+    ) * 1e3
+    resultado["table_scan_falha_ms"] = time_per_operation(
+        tabela.table_scan, ausentes[:max(varreduras // 10, 1)]
+    ) * 1e3
+
+    # Estatísticas dos Buckets.
+    resultado["buckets"] = bucket.get_bucket_count()
+    resultado["capacidade_buckets"] = bucket.get_bucket_capacity()
+    resultado["dispersao"] = bucket.get_dispersion_percentage()
+    resultado["maior_cadeia"] = max(
+        bucket.get_chain_length(id_bucket) for id_bucket in range(0, bucket.get_bucket_count())
+    )
+    return resultado
+
+def run_suite(geradores: Sequence[str], tamanhos: Sequence[int],
+              **opcoes: Any) -> List[Dict[str, Any]]:
+    """Executa o benchmark de todas as configurações.
+
+    Args:
+        geradores (Sequence[str]): Os nomes dos geradores.
+        tamanhos (Sequence[int]): As qntds. de chaves.
+        opcoes (Any): As opções de 'run_configuration()'.
+
+    Returns:
+        List[Dict[str, Any]]: O resultado de cada configuração.
+    """
+    return [
+        run_configuration(gerador, tamanho, **opcoes)
+        for tamanho in tamanhos for gerador in geradores
+    ]
+
+def format_summary(resultados: Sequence[Dict[str, Any]]) -> str:
+    """Monta a tabela resumo dos resultados.
+
+    Args:
+        resultados (Sequence[Dict[str, Any]]): Os resultados.
+
+    Returns:
+        str: A tabela resumo.
+    """
+    linhas: List[str] = [" ".join(
+        f"{titulo:>{largura}}" for titulo, _, largura, _ in COLUNAS_RESUMO
+    )]
+    for resultado in resultados:
+        linhas.append(" ".join(
+            f"{resultado[chave]:>{largura}{formato}}"
+            for _, chave, largura, formato in COLUNAS_RESUMO
+        ))
+    return "\n".join(linhas)
+
+def main() -> None:
+    """Executa o benchmark e emite os resultados."""
+    parser = ArgumentParser(description="Benchmark de desempenho do Índice Hash.")
+    parser.add_argument("--geradores", nargs="+", default=list(GERADORES),
+                        choices=list(GERADORES), help="Os geradores de chaves.")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="As qntds. de chaves (até 10^7).")
+    parser.add_argument("--consultas", type=int, default=2000, help="A qntd. de buscas.")
+    parser.add_argument("--varreduras", type=int, default=20, help="A qntd. de Table Scans.")
+    parser.add_argument("--pagina", type=int, default=100, help="O tamanho das Paginas.")
+    parser.add_argument("--hash", default=FuncaoHash.ESTRATEGIA_PADRAO,
+                        choices=FuncaoHash.get_strategies(), help="A estratégia de hash.")
+    parser.add_argument("--saida", default=None, help="O arquivo JSON dos resultados.")
+    argumentos = parser.parse_args()
+
+    resultados: List[Dict[str, Any]] = run_suite(
+        argumentos.geradores, argumentos.tamanhos, consultas=argumentos.consultas,
+        varreduras=argumentos.varreduras, tamanho_pagina=argumentos.pagina,
+        estrategia_hash=argumentos.hash
+    )
+    if argumentos.saida is not None:
+        with open(argumentos.saida, "w", encoding="UTF-8") as arquivo:
+            json.dump(resultados, arquivo, indent=2)
+    else:
+        print(json.dumps(resultados, indent=2))
+    print(format_summary(resultados))
+
+if __name__ == "__main__":
+    main()
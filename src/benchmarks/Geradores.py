@@ -0,0 +1,99 @@
+"""Geradores de chaves sintéticas para os benchmarks.
+Todos são determinísticos (dada a semente) e retornam
+a lista de chaves na ordem de inserção na Tabela.
+"""
+
+from itertools import accumulate
+from random import Random
+from string import ascii_lowercase
+from typing import Callable, Dict, List
+
+def uniform_keys(quantidade: int, semente: int = 0) -> List[str]:
+    """Gera chaves aleatórias (letras minúsculas) de 4 a 12 caracteres.
+
+    Args:
+        quantidade (int): A qntd. de chaves.
+        semente (int, optional): A semente aleatória.
+        Valor padrão '0'.
+
+    Returns:
+        List[str]: As chaves.
+    """
+    aleatorio = Random(semente)
+    return [
+        "".join(aleatorio.choices(ascii_lowercase, k=aleatorio.randint(4, 12)))
+        for _ in range(0, quantidade)
+    ]
+
+def skewed_keys(quantidade: int, semente: int = 0, expoente: float = 1.1) -> List[str]:
+    """Gera chaves repetidas seguindo uma distribuição de Zipf sobre
+    um vocabulário de 'quantidade / 10' chaves, ou seja, poucas chaves
+    muito frequentes (cadeias longas nos seus Buckets).
+
+    Args:
+        quantidade (int): A qntd. de chaves.
+        semente (int, optional): A semente aleatória.
+        Valor padrão '0'.
+        expoente (float, optional): O expoente da distribuição de Zipf.
+        Valor padrão '1.1'.
+
+    Returns:
+        List[str]: As chaves.
+    """
+    vocabulario: List[str] = uniform_keys(max(quantidade // 10, 1), semente)
+    pesos: List[float] = list(accumulate(
+        1 / (posicao ** expoente) for posicao in range(1, len(vocabulario) + 1)
+    ))
+    return Random(semente).choices(vocabulario, cum_weights=pesos, k=quantidade)
+
+def anagram_keys(quantidade: int, semente: int = 0, tamanho_grupo: int = 64) -> List[str]:
+    """Gera grupos de anagramas (permutações das mesmas letras), que
+    colidem em funções hash que ignoram a ordem dos caracteres ('soma').
+
+    Args:
+        quantidade (int): A qntd. de chaves.
+        semente (int, optional): A semente aleatória.
+        Valor padrão '0'.
+        tamanho_grupo (int, optional): A qntd. de anagramas por grupo.
+        Valor padrão '64'.
+
+    Returns:
+        List[str]: As chaves.
+    """
+    aleatorio = Random(semente)
+    chaves: List[str] = []
+    while len(chaves) < quantidade:
+        letras: List[str] = aleatorio.choices(ascii_lowercase, k=10)
+        for _ in range(0, min(tamanho_grupo, quantidade - len(chaves))):
+            aleatorio.shuffle(letras)
+            chaves.append("".join(letras))
+    return chaves
+
+def long_keys(quantidade: int, semente: int = 0, tamanho: int = 256) -> List[str]:
+    """Gera chaves longas que compartilham um prefixo comum de metade
+    do tamanho, tornando cada comparação de chaves mais cara.
+
+    Args:
+        quantidade (int): A qntd. de chaves.
+        semente (int, optional): A semente aleatória.
+        Valor padrão '0'.
+        tamanho (int, optional): O tamanho das chaves.
+        Valor padrão '256'.
+
+    Returns:
+        List[str]: As chaves.
+    """
+    aleatorio = Random(semente)
+    prefixo: str = "".join(aleatorio.choices(ascii_lowercase, k=tamanho // 2))
+    return [
+        prefixo + "".join(aleatorio.choices(ascii_lowercase, k=tamanho - tamanho // 2))
+        for _ in range(0, quantidade)
+    ]
+
+# Os geradores disponíveis, pelo nome.
+GERADORES: Dict[str, Callable[[int, int], List[str]]] = {
+    "uniforme": uniform_keys,
+    "enviesado": skewed_keys,
+    "anagramas": anagram_keys,
+    "longas": long_keys
+}
@@ -0,0 +1,185 @@
+"""Gerador de carga do Servidor de Consultas.
+Abre várias conexões, envia requisições em pipeline (várias
+requisições em trânsito por conexão) e reporta a vazão e os
+percentis de latência.
+
+Uso (a partir de 'src'):
+    python -m server.GeradorCarga words.txt --porta 8765 --conexoes 8 --profundidade 32
+"""
+
+import asyncio
+from argparse import ArgumentParser
+from collections import deque
+from random import Random
+from time import perf_counter
+from typing import Deque, Dict, List, Sequence
+
+# Percentis reportados.
+PERCENTIS: Sequence[float] = (50.0, 90.0, 99.0, 99.9)
+
+def percentile(latencias: Sequence[float], percentil: float) -> float:
+    """Retorna um percentil (nearest-rank) de latências já ordenadas.
+
+    Args:
+        latencias (Sequence[float]): As latências, em ordem crescente.
+        percentil (float): O percentil (entre 0 e 100).
+
+    Returns:
+        float: A latência do percentil ou '0.0' se não houver latências.
+    """
+    if not latencias:
+        return 0.0
+    posicao: int = max(-(-len(latencias) * percentil // 100), 1)
+    return latencias[int(posicao) - 1]
+
+def build_requests(chaves: Sequence[str], quantidade: int, taxa_ausentes: float = 0.0,
+                   tamanho_lote: int = 1, semente: int = 0) -> List[bytes]:
+    """Gera as requisições: 'GET' ou, em lotes, 'MGET'.
+
+    Args:
+        chaves (Sequence[str]): As chaves existentes.
+        quantidade (int): A qntd. de requisições.
+        taxa_ausentes (float, optional): A proporção de chaves ausentes.
+        Valor padrão '0.0'.
+        tamanho_lote (int, optional): A qntd. de chaves por requisição.
+        Valor padrão '1'.
+        semente (int, optional): A semente aleatória.
+        Valor padrão '0'.
+
+    Returns:
+        List[bytes]: As requisições, já codificadas.
+    """
+    aleatorio = Random(semente)
+
+    def key() -> str:
+        if aleatorio.random() < taxa_ausentes:
+            return f"{aleatorio.choice(chaves)}#ausente"
+        return aleatorio.choice(chaves)
+
+    if tamanho_lote <= 1:
+        return [f"GET\t{key()}\n".encode("UTF-8") for _ in range(0, quantidade)]
+    return [
+        ("MGET\t" + "\t".join(key() for _ in range(0, tamanho_lote)) + "\n").encode("UTF-8")
+        for _ in range(0, quantidade)
+    ]
+
+async def run_connection(requisicoes: Sequence[bytes], profundidade: int, host: str,
+                         porta: int, caminho: str = None) -> List[float]:
+    """Envia as requisições por uma conexão, mantendo até 'profundidade'
+    requisições em trânsito, e mede a latência de cada uma.
+
+    Args:
+        requisicoes (Sequence[bytes]): As requisições.
+        profundidade (int): A qntd. máxima de requisições em trânsito.
+        host (str): O endereço TCP.
+        porta (int): A porta TCP.
+        caminho (str, optional): O caminho de um socket Unix.
+        Valor padrão 'None'.
+
+    Returns:
+        List[float]: As latências (em segundos).
+    """
+    if caminho is not None:
+        leitor, escritor = await asyncio.open_unix_connection(caminho, limit=1 << 22)
+    else:
+        leitor, escritor = await asyncio.open_connection(host, porta, limit=1 << 22)
+    vagas = asyncio.Semaphore(profundidade)
+    envios: Deque[float] = deque()
+    latencias: List[float] = []
+
+    async def send() -> None:
+        for requisicao in requisicoes:
+            await vagas.acquire()
+            envios.append(perf_counter())
+            escritor.write(requisicao)
+            await escritor.drain()
+
+    async def receive() -> None:
+        for _ in range(0, len(requisicoes)):
+            resposta: bytes = await leitor.readline()
+            latencias.append(perf_counter() - envios.popleft())
+            vagas.release()
+            if resposta.startswith(b"ERR"):
+                raise ValueError(resposta.decode("UTF-8").strip())
+
+    await asyncio.gather(send(), receive())
+    escritor.close()
+    await escritor.wait_closed()
+    return latencias
+
+async def run_load(chaves: Sequence[str], quantidade: int, conexoes: int = 4,
+                   profundidade: int = 16, taxa_ausentes: float = 0.0, tamanho_lote: int = 1,
+                   host: str = "127.0.0.1", porta: int = 8765,
+                   caminho: str = None) -> Dict[str, float]:
+    """Executa a carga em várias conexões simultâneas.
+
+    Args:
+        chaves (Sequence[str]): As chaves existentes.
+        quantidade (int): A qntd. total de requisições.
+        conexoes (int, optional): A qntd. de conexões.
+        Valor padrão '4'.
+        profundidade (int, optional): A qntd. de requisições em trânsito por conexão.
+        Valor padrão '16'.
+        taxa_ausentes (float, optional): A proporção de chaves ausentes.
+        Valor padrão '0.0'.
+        tamanho_lote (int, optional): A qntd. de chaves por requisição.
+        Valor padrão '1'.
+        host (str, optional): O endereço TCP.
+        Valor padrão '127.0.0.1'.
+        porta (int, optional): A porta TCP.
+        Valor padrão '8765'.
+        caminho (str, optional): O caminho de um socket Unix.
+        Valor padrão 'None'.
+
+    Returns:
+        Dict[str, float]: A vazão de requisições ('requisicoes_por_segundo')
+        e de chaves ('chaves_por_segundo') e a latência (em milissegundos)
+        de cada percentil ('p50', 'p90', ...) e máxima ('max').
+    """
+    por_conexao: int = max(quantidade // conexoes, 1)
+    lotes: List[List[bytes]] = [
+        build_requests(chaves, por_conexao, taxa_ausentes, tamanho_lote, semente)
+        for semente in range(0, conexoes)
+    ]
+    inicio: float = perf_counter()
+    resultados: List[List[float]] = await asyncio.gather(*(
+        run_connection(lote, profundidade, host, porta, caminho) for lote in lotes
+    ))
+    tempo: float = perf_counter() - inicio
+    latencias: List[float] = sorted(latencia for resultado in resultados for latencia in resultado)
+    relatorio: Dict[str, float] = {
+        "requisicoes_por_segundo": len(latencias) / tempo,
+        "chaves_por_segundo": len(latencias) * tamanho_lote / tempo
+    }
+    for percentil in PERCENTIS:
+        relatorio[f"p{percentil:g}"] = percentile(latencias, percentil) * 1000
+    relatorio["max"] = latencias[-1] * 1000 if latencias else 0.0
+    return relatorio
+
+def main() -> None:
+    """Executa a carga e imprime o relatório."""
+    parser = ArgumentParser(description="Gerador de carga do Servidor de Consultas.")
+    parser.add_argument("arquivo", help="O arquivo com as chaves (uma por linha).")
+    parser.add_argument("--host", default="127.0.0.1", help="O endereço TCP.")
+    parser.add_argument("--porta", type=int, default=8765, help="A porta TCP.")
+    parser.add_argument("--unix", default=None, help="O caminho de um socket Unix.")
+    parser.add_argument("--requisicoes", type=int, default=100000, help="A qntd. de requisições.")
+    parser.add_argument("--conexoes", type=int, default=4, help="A qntd. de conexões.")
+    parser.add_argument("--profundidade", type=int, default=16,
+                        help="A qntd. de requisições em trânsito por conexão.")
+    parser.add_argument("--ausentes", type=float, default=0.0,
+                        help="A proporção de chaves ausentes.")
+    parser.add_argument("--lote", type=int, default=1, help="A qntd. de chaves por requisição.")
+    argumentos = parser.parse_args()
+
+    with open(argumentos.arquivo, encoding="UTF-8") as arquivo:
+        chaves: List[str] = [linha.strip() for linha in arquivo if linha.strip()]
+    relatorio: Dict[str, float] = asyncio.run(run_load(
+        chaves, argumentos.requisicoes, argumentos.conexoes, argumentos.profundidade,
+        argumentos.ausentes, argumentos.lote, argumentos.host, argumentos.porta, argumentos.unix
+    ))
+    for nome, valor in relatorio.items():
+        print(f"{nome:>24}: {valor:.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,338 @@
+"""Representa um Servidor de Consultas.
+Responde buscas nos Buckets, Table Scans e informações dos
+Buckets por um socket TCP ou Unix (asyncio), permitindo que
+outros serviços consultem o Índice Hash.
+
+Protocolo (linhas UTF-8, campos separados por tabulação):
+    GET   <chave>                    -> OK <bucket> <pagina> | NOTFOUND
+    MGET  <chave> <chave> ...        -> OK <bucket>:<pagina> ... ('-' se ausente)
+    SCAN  <chave> [quantidade]       -> OK <tuplas lidas> <pagina> | NOTFOUND
+    INFO  <bucket>                   -> OK <colisoes> <overflows>
+    STATS                            -> OK <tuplas> <buckets> <capacidade> <dispersao>
+    TRACE on|off|reset               -> OK <ativa> (ver 'Instrumentacao')
+    METRICS                          -> OK <JSON da Instrumentação em uma linha>
+Erros respondem 'ERR <mensagem>'. As respostas seguem a ordem das
+requisições, então várias requisições podem ser enviadas sem esperar
+pelas respostas (pipelining).
+
+Uso (a partir de 'src'):
+    python -m server.ServidorConsultas words.txt --porta 8765
+"""
+
+import asyncio
+import json
+from argparse import ArgumentParser
+from typing import Callable, Dict, List
+
+# pylint: disable=import-error
+
+from structs.Pagina import Pagina
+from structs.Tabela import Tabela
+from structs.Bucket import BucketManager
+from structs.IndiceArquivo import IndiceArquivo
+from structs.LeitorArquivo import LeitorArquivo
+from structs.TabelaColunar import TabelaColunar
+from structs.Instrumentacao import Instrumentacao
+
+class ServidorConsultas:
+    """Representa um Servidor de Consultas."""
+    # Separadores do protocolo.
+    SEPARADOR_CAMPOS: str = "\t"
+    SEPARADOR_LINHAS: bytes = b"\n"
+    # Tamanho máximo de uma linha (requisições em lote).
+    TAMANHO_MAXIMO_LINHA: int = 1 << 22
+    # Tamanho do buffer de escrita antes de esperar o cliente ler as respostas.
+    LIMITE_ESCRITA: int = 1 << 16
+
+    # A Tabela, os Buckets (ou o Arquivo de Índice) e as Paginas.
+    __tabela: Tabela
+    __bucket: BucketManager | IndiceArquivo
+    __pagina: Pagina
+    # Os comandos do protocolo.
+    __comandos: Dict[str, Callable[[List[str]], str]]
+    # Estatísticas: conexões abertas e requisições respondidas.
+    __conexoes: int
+    __requisicoes: int
+
+    def __init__(self, tabela: Tabela, bucket: BucketManager | IndiceArquivo,
+                 pagina: Pagina = None) -> None:
+        """Inicializa o Servidor com uma Tabela já inserida nos Buckets.
+
+        Args:
+            tabela (Tabela): A Tabela.
+            bucket (BucketManager | IndiceArquivo): Os Buckets da Tabela.
+            pagina (Pagina, optional): As Paginas da Tabela.
+            Valor padrão 'None'.
+        """
+        self.__tabela = tabela
+        self.__bucket = bucket
+        self.__pagina = pagina
+        self.__comandos = {
+            "GET": self.__get,
+            "MGET": self.__multi_get,
+            "SCAN": self.__scan,
+            "INFO": self.__info,
+            "STATS": self.__stats,
+            "TRACE": self.__trace,
+            "METRICS": self.__metrics
+        }
+        self.__conexoes = 0
+        self.__requisicoes = 0
+
+    def execute(self, linha: str) -> str:
+        """Executa uma requisição do protocolo.
+
+        Args:
+            linha (str): A requisição (sem a quebra de linha).
+
+        Returns:
+            str: A resposta (sem a quebra de linha).
+        """
+        campos: List[str] = linha.split(self.SEPARADOR_CAMPOS)
+        comando: Callable[[List[str]], str] = self.__comandos.get(campos[0].upper())
+        self.__requisicoes += 1
+        if comando is None:
+            return f"ERR{self.SEPARADOR_CAMPOS}Comando '{campos[0]}' inexistente."
+        try:
+            return comando(campos[1:])
+        except (ValueError, IndexError, KeyError) as erro:
+            return f"ERR{self.SEPARADOR_CAMPOS}{erro}"
+
+    def __response(self, *campos: object) -> str:
+        """Monta uma resposta de sucesso.
+
+        Args:
+            campos (object): Os campos da resposta.
+
+        Returns:
+            str: A resposta.
+        """
+        return self.SEPARADOR_CAMPOS.join(["OK", *map(str, campos)])
+
+    def __get(self, argumentos: List[str]) -> str:
+        """Procura por uma chave nos Buckets.
+
+        Args:
+            argumentos (List[str]): A chave.
+
+        Returns:
+            str: O Bucket e a Pagina da Tupla ou 'NOTFOUND'.
+        """
+        if len(argumentos) != 1:
+            raise ValueError("GET espera uma chave.")
+        tupla, id_bucket = self.__bucket.search_data(argumentos[0])
+        if tupla is None:
+            return "NOTFOUND"
+        return self.__response(id_bucket, tupla.get_page_index())
+
+    def __multi_get(self, argumentos: List[str]) -> str:
+        """Procura por várias chaves nos Buckets (ver
+        'BucketManager.search_many()').
+
+        Args:
+            argumentos (List[str]): As chaves.
+
+        Returns:
+            str: O Bucket e a Pagina de cada Tupla ('-' se ausente).
+        """
+        if isinstance(self.__bucket, BucketManager):
+            resultados = [
+                (id_bucket, tupla) for tupla, id_bucket, _ in self.__bucket.search_many(argumentos)
+            ]
+        else:
+            resultados = [
+                (id_bucket, tupla) for tupla, id_bucket in map(self.__bucket.search_data, argumentos)
+            ]
+        return self.__response(*(
+            "-" if tupla is None else f"{id_bucket}:{tupla.get_page_index()}"
+            for id_bucket, tupla in resultados
+        ))
+
+    def __scan(self, argumentos: List[str]) -> str:
+        """Realiza um Table Scan.
+
+        Args:
+            argumentos (List[str]): A chave e, opcionalmente, a qntd. de Tuplas.
+
+        Returns:
+            str: A qntd. de Tuplas lidas e a Pagina da Tupla ou 'NOTFOUND'.
+        """
+        if len(argumentos) not in (1, 2):
+            raise ValueError("SCAN espera uma chave e uma qntd. opcional.")
+        quantidade: int = int(argumentos[1]) if len(argumentos) == 2 else None
+        if quantidade is not None and not 0 <= quantidade <= self.__tabela.get_size():
+            raise ValueError("Qntd. de busca inválido no Table Scan.")
+        tuplas = self.__tabela.table_scan(argumentos[0], quantidade)
+        if not tuplas:
+            return "NOTFOUND"
+        return self.__response(len(tuplas), tuplas[-1].get_page_index())
+
+    def __info(self, argumentos: List[str]) -> str:
+        """Retorna as informações de um Bucket.
+
+        Args:
+            argumentos (List[str]): O índice do Bucket.
+
+        Returns:
+            str: A qntd. de colisões e de overflows do Bucket.
+        """
+        id_bucket: int = int(argumentos[0])
+        if not 0 <= id_bucket < self.__bucket.get_bucket_count():
+            raise ValueError(f"Bucket '{id_bucket}' inexistente.")
+        return self.__response(
+            self.__bucket.get_collision_count(id_bucket),
+            self.__bucket.get_overflow_count(id_bucket)
+        )
+
+    def __stats(self, _: List[str]) -> str:
+        """Retorna as informações gerais do Índice.
+
+        Returns:
+            str: A qntd. de Tuplas, de Buckets, a capacidade dos
+            Buckets e a porcentagem de dispersão.
+        """
+        return self.__response(
+            self.__tabela.get_size(),
+            self.__bucket.get_bucket_count(),
+            self.__bucket.get_bucket_capacity(),
+            self.__bucket.get_dispersion_percentage()
+        )
+
+    def __trace(self, argumentos: List[str]) -> str:
+        """Ativa, desativa ou zera a Instrumentação.
+
+        Args:
+            argumentos (List[str]): 'on', 'off' ou 'reset'.
+
+        Returns:
+            str: Se a Instrumentação está ativa.
+        """
+        acoes: Dict[str, Callable[[], None]] = {
+            "on": Instrumentacao.enable,
+            "off": Instrumentacao.disable,
+            "reset": Instrumentacao.reset
+        }
+        if len(argumentos) != 1 or argumentos[0].lower() not in acoes:
+            raise ValueError("TRACE espera 'on', 'off' ou 'reset'.")
+        acoes[argumentos[0].lower()]()
+        return self.__response(int(Instrumentacao.is_enabled()))
+
+    def __metrics(self, _: List[str]) -> str:
+        """Retorna os Histogramas e contadores da Instrumentação.
+
+        Returns:
+            str: O JSON (em uma linha) da Instrumentação.
+        """
+        return self.__response(json.dumps(Instrumentacao.to_dict(), separators=(",", ":")))
+
+    async def handle_connection(self, leitor: asyncio.StreamReader,
+                                escritor: asyncio.StreamWriter) -> None:
+        """Atende uma conexão, respondendo cada linha na ordem
+        em que foi recebida.
+
+        Args:
+            leitor (asyncio.StreamReader): O leitor da conexão.
+            escritor (asyncio.StreamWriter): O escritor da conexão.
+        """
+        self.__conexoes += 1
+        try:
+            while True:
+                try:
+                    linha: bytes = await leitor.readuntil(self.SEPARADOR_LINHAS)
+                except asyncio.IncompleteReadError as erro:
+                    linha = erro.partial
+                    if not linha:
+                        break
+                except asyncio.LimitOverrunError:
+                    escritor.write(b"ERR\tLinha muito longa.\n")
+                    break
+                try:
+                    resposta: str = self.execute(linha.decode("UTF-8").rstrip("\r\n"))
+                except UnicodeDecodeError:
+                    # Responde o erro somente desta linha, mantendo a conexão.
+                    resposta = f"ERR{self.SEPARADOR_CAMPOS}Linha com UTF-8 inválido."
+                escritor.write(resposta.encode("UTF-8") + self.SEPARADOR_LINHAS)
+                # Só espera o cliente quando o buffer de escrita encher.
+                if escritor.transport.get_write_buffer_size() > self.LIMITE_ESCRITA:
+                    await escritor.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.__conexoes -= 1
+            escritor.close()
+
+    async def start(self, host: str = "127.0.0.1", porta: int = 8765,
+                    caminho: str = None) -> asyncio.AbstractServer:
+        """Inicia o Servidor, em um socket TCP ou Unix.
+
+        Args:
+            host (str, optional): O endereço TCP.
+            Valor padrão '127.0.0.1'.
+            porta (int, optional): A porta TCP.
+            Valor padrão '8765'.
+            caminho (str, optional): O caminho de um socket Unix, que
+            substitui o socket TCP.
+            Valor padrão 'None'.
+
+        Returns:
+            asyncio.AbstractServer: O Servidor iniciado.
+        """
+        if caminho is not None:
+            return await asyncio.start_unix_server(
+                self.handle_connection, caminho, limit=self.TAMANHO_MAXIMO_LINHA
+            )
+        return await asyncio.start_server(
+            self.handle_connection, host, porta, limit=self.TAMANHO_MAXIMO_LINHA
+        )
+
+    def get_connection_count(self) -> int:
+        """Retorna a quantidade de conexões abertas.
+
+        Returns:
+            int: A qntd. de conexões.
+        """
+        return self.__conexoes
+
+    def get_request_count(self) -> int:
+        """Retorna a quantidade de requisições respondidas.
+
+        Returns:
+            int: A qntd. de requisições.
+        """
+        return self.__requisicoes
+
+async def serve(servidor: ServidorConsultas, host: str, porta: int, caminho: str = None) -> None:
+    """Executa o Servidor indefinidamente.
+
+    Args:
+        servidor (ServidorConsultas): O Servidor.
+        host (str): O endereço TCP.
+        porta (int): A porta TCP.
+        caminho (str, optional): O caminho de um socket Unix.
+        Valor padrão 'None'.
+    """
+    async with await servidor.start(host, porta, caminho) as socket_servidor:
+        await socket_servidor.serve_forever()
+
+def main() -> None:
+    """Carrega um arquivo de entrada e inicia o Servidor."""
+    parser = ArgumentParser(description="Servidor de consultas do Índice Hash.")
+    parser.add_argument("arquivo", help="O arquivo de entrada (uma chave por linha).")
+    parser.add_argument("--host", default="127.0.0.1", help="O endereço TCP.")
+    parser.add_argument("--porta", type=int, default=8765, help="A porta TCP.")
+    parser.add_argument("--unix", default=None, help="O caminho de um socket Unix.")
+    parser.add_argument("--pagina", type=int, default=100, help="O tamanho das Paginas.")
+    parser.add_argument("--bloom", default=None, help="O modo do Filtro de Bloom.")
+    argumentos = parser.parse_args()
+
+    # As Paginas e os Buckets são preenchidos durante a leitura do arquivo.
+    leitor = LeitorArquivo(argumentos.arquivo)
+    pagina = Pagina(argumentos.pagina)
+    bucket = BucketManager(leitor.count_lines(), filtro_bloom=argumentos.bloom)
+    tabela: Tabela = leitor.load(TabelaColunar(), pagina, bucket)
+    print(f"{tabela.get_size()} Tuplas carregadas em {bucket.get_bucket_count()} Buckets.")
+    asyncio.run(serve(ServidorConsultas(tabela, bucket, pagina),
+                      argumentos.host, argumentos.porta, argumentos.unix))
+
+if __name__ == "__main__":
+    main()
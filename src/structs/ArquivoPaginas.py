@@ -0,0 +1,341 @@
+"""Representa um Arquivo de Paginas.
+Armazena as Paginas em um arquivo binário com um
+cabeçalho e blocos de tamanho fixo (Slotted Pages),
+cada leitura busca exatamente um bloco do disco.
+
+Formato do arquivo (little-endian):
+    Cabeçalho (um bloco): assinatura, versão, tamanho do
+    bloco, qntd. de Paginas e tamanho fixo das Paginas.
+    Pagina 'i' (bloco 'i + 1'): qntd. de slots, início da
+    área livre, vetor de slots (deslocamento, tamanho) e,
+    a partir do final do bloco, os registros (UTF-8).
+    Um slot (0, 0) é uma lápide (registro removido).
+"""
+
+import os
+from struct import Struct
+from time import perf_counter
+from typing import List, Tuple, Union
+
+# pylint: disable=import-error
+
+from structs.Tupla import Tupla
+
+class ArquivoPaginas:
+    """Representa um Arquivo de Paginas."""
+    # Assinatura e versão do formato.
+    ASSINATURA: bytes = b"IHPG"
+    VERSAO: int = 1
+    # Tamanho mínimo (e múltiplo) dos blocos, em bytes.
+    TAMANHO_BLOCO_MINIMO: int = 4096
+    # Estruturas binárias do cabeçalho, da Pagina e de um slot.
+    CABECALHO: Struct = Struct("<4sHIII")
+    CABECALHO_PAGINA: Struct = Struct("<II")
+    SLOT: Struct = Struct("<II")
+
+    # O caminho e o descritor do arquivo.
+    __caminho: str
+    __descritor: int
+    # Se o arquivo foi aberto para escrita (lápides).
+    __escrita: bool
+    # Informações do cabeçalho.
+    __tamanho_bloco: int
+    __quantidade_paginas: int
+    __tamanho_pagina: int
+    # Estatísticas de leitura.
+    __quantidade_leituras: int
+    __tempo_leituras: float
+
+    def __init__(self, caminho: str, escrita: bool = False) -> None:
+        """Abre um Arquivo de Paginas para leitura.
+
+        Args:
+            caminho (str): O caminho do arquivo.
+            escrita (bool, optional): Se o arquivo também é aberto para
+            escrita, permitindo gravar lápides com 'write_tombstone()'.
+            Valor padrão 'False'.
+
+        Raises:
+            ValueError: Caso o arquivo não seja um Arquivo de Paginas.
+        """
+        self.__caminho = caminho
+        self.__escrita = escrita
+        self.__descritor = os.open(
+            caminho, (os.O_RDWR if escrita else os.O_RDONLY) | getattr(os, "O_BINARY", 0)
+        )
+        assinatura, versao, self.__tamanho_bloco, self.__quantidade_paginas, \
+            self.__tamanho_pagina = self.CABECALHO.unpack(
+                self.__read(0, self.CABECALHO.size)
+            )
+        if assinatura != self.ASSINATURA or versao != self.VERSAO:
+            self.close()
+            raise ValueError(f"'{caminho}' não é um Arquivo de Paginas válido.")
+        self.__quantidade_leituras = 0
+        self.__tempo_leituras = 0.0
+
+    @staticmethod
+    def write(caminho: str, paginas: List[List[Union[Tupla, None]]], tamanho_pagina: int) -> None:
+        """Grava Paginas em um novo Arquivo de Paginas.
+
+        O tamanho do bloco é o menor múltiplo de 'TAMANHO_BLOCO_MINIMO'
+        em que a maior Pagina cabe.
+
+        Args:
+            caminho (str): O caminho do arquivo.
+            paginas (List[List[Union[Tupla, None]]]): As Tuplas de cada
+            Pagina, 'None' é gravado como uma lápide.
+            tamanho_pagina (int): O tamanho fixo (em Tuplas) das Paginas.
+        """
+        registros: List[List[Union[bytes, None]]] = [
+            [None if tupla is None else tupla.get_data().encode("UTF-8") for tupla in pagina]
+            for pagina in paginas
+        ]
+        maior_pagina: int = max(
+            (ArquivoPaginas.CABECALHO_PAGINA.size
+             + sum(ArquivoPaginas.SLOT.size + len(registro or b"") for registro in pagina)
+             for pagina in registros),
+            default=0
+        )
+        minimo: int = ArquivoPaginas.TAMANHO_BLOCO_MINIMO
+        tamanho_bloco: int = max(-(-maior_pagina // minimo), 1) * minimo
+        with open(caminho, "wb") as arquivo:
+            arquivo.write(ArquivoPaginas.CABECALHO.pack(
+                ArquivoPaginas.ASSINATURA, ArquivoPaginas.VERSAO,
+                tamanho_bloco, len(registros), tamanho_pagina
+            ).ljust(tamanho_bloco, b"\0"))
+            for pagina in registros:
+                arquivo.write(ArquivoPaginas.__pack_page(pagina, tamanho_bloco))
+
+    @staticmethod
+    def __pack_page(registros: List[Union[bytes, None]], tamanho_bloco: int) -> bytes:
+        """Monta o bloco de uma Pagina: os slots crescem a partir
+        do início e os registros a partir do final do bloco.
+
+        Args:
+            registros (List[Union[bytes, None]]): Os registros da Pagina.
+            tamanho_bloco (int): O tamanho do bloco.
+
+        Returns:
+            bytes: O bloco da Pagina.
+        """
+        bloco: bytearray = bytearray(tamanho_bloco)
+        fim_livre: int = tamanho_bloco
+        posicao_slot: int = ArquivoPaginas.CABECALHO_PAGINA.size
+        for registro in registros:
+            if registro is None:
+                # Lápide.
+                ArquivoPaginas.SLOT.pack_into(bloco, posicao_slot, 0, 0)
+                posicao_slot += ArquivoPaginas.SLOT.size
+                continue
+            fim_livre -= len(registro)
+            bloco[fim_livre:fim_livre + len(registro)] = registro
+            ArquivoPaginas.SLOT.pack_into(bloco, posicao_slot, fim_livre, len(registro))
+            posicao_slot += ArquivoPaginas.SLOT.size
+        ArquivoPaginas.CABECALHO_PAGINA.pack_into(bloco, 0, len(registros), fim_livre)
+        return bytes(bloco)
+
+    def __read(self, posicao: int, tamanho: int) -> bytes:
+        """Lê bytes do arquivo em uma posição.
+
+        Args:
+            posicao (int): A posição no arquivo.
+            tamanho (int): A qntd. de bytes.
+
+        Returns:
+            bytes: Os bytes lidos.
+        """
+        if hasattr(os, "pread"):
+            return os.pread(self.__descritor, tamanho, posicao)
+        os.lseek(self.__descritor, posicao, os.SEEK_SET)
+        return os.read(self.__descritor, tamanho)
+
+    def read_block(self, indice_pagina: int) -> bytes:
+        """Lê (do disco) o bloco inteiro de uma Pagina.
+
+        Args:
+            indice_pagina (int): O índice da Pagina.
+
+        Raises:
+            IndexError: Caso a Pagina não exista.
+
+        Returns:
+            bytes: O bloco da Pagina.
+        """
+        if not 0 <= indice_pagina < self.__quantidade_paginas:
+            raise IndexError(f"Pagina '{indice_pagina}' inexistente.")
+        inicio: float = perf_counter()
+        bloco: bytes = self.__read((indice_pagina + 1) * self.__tamanho_bloco, self.__tamanho_bloco)
+        self.__tempo_leituras += perf_counter() - inicio
+        self.__quantidade_leituras += 1
+        return bloco
+
+    @staticmethod
+    def unpack_page(bloco: bytes) -> List[str]:
+        """Extrai os registros do bloco de uma Pagina.
+
+        Args:
+            bloco (bytes): O bloco da Pagina.
+
+        Returns:
+            List[str]: Os registros, na ordem dos slots (sem as lápides).
+        """
+        quantidade_slots, _ = ArquivoPaginas.CABECALHO_PAGINA.unpack_from(bloco, 0)
+        registros: List[str] = []
+        for posicao_slot, tamanho in ArquivoPaginas.SLOT.iter_unpack(
+                bloco[ArquivoPaginas.CABECALHO_PAGINA.size:
+                      ArquivoPaginas.CABECALHO_PAGINA.size
+                      + quantidade_slots * ArquivoPaginas.SLOT.size]):
+            if posicao_slot != 0:
+                registros.append(bloco[posicao_slot:posicao_slot + tamanho].decode("UTF-8"))
+        return registros
+
+    def write_tombstone(self, indice_pagina: int, posicao_slot: int) -> None:
+        """Grava uma lápide (slot (0, 0)) no slot de uma Pagina,
+        sem regravar o restante do bloco.
+
+        Args:
+            indice_pagina (int): O índice da Pagina.
+            posicao_slot (int): A posição do slot na Pagina.
+
+        Raises:
+            ValueError: Caso o arquivo não tenha sido aberto para escrita.
+            IndexError: Caso a Pagina ou o slot não existam.
+        """
+        if not self.__escrita:
+            raise ValueError(f"'{self.__caminho}' não foi aberto para escrita.")
+        if not 0 <= indice_pagina < self.__quantidade_paginas:
+            raise IndexError(f"Pagina '{indice_pagina}' inexistente.")
+        inicio_bloco: int = (indice_pagina + 1) * self.__tamanho_bloco
+        quantidade_slots, _ = self.CABECALHO_PAGINA.unpack(
+            self.__read(inicio_bloco, self.CABECALHO_PAGINA.size)
+        )
+        if not 0 <= posicao_slot < quantidade_slots:
+            raise IndexError(f"Slot '{posicao_slot}' inexistente na Pagina '{indice_pagina}'.")
+        posicao: int = inicio_bloco + self.CABECALHO_PAGINA.size + posicao_slot * self.SLOT.size
+        self.__write(posicao, self.SLOT.pack(0, 0))
+
+    def write_page(self, indice_pagina: int, tuplas: List[Union[Tupla, None]]) -> None:
+        """Regrava (no lugar) somente o bloco de uma Pagina, por
+        exemplo após descartar as suas lápides.
+
+        Args:
+            indice_pagina (int): O índice da Pagina.
+            tuplas (List[Union[Tupla, None]]): As Tuplas da Pagina,
+            'None' é gravado como uma lápide.
+
+        Raises:
+            ValueError: Caso o arquivo não tenha sido aberto para escrita
+            ou a Pagina não caiba no bloco.
+            IndexError: Caso a Pagina não exista.
+        """
+        if not self.__escrita:
+            raise ValueError(f"'{self.__caminho}' não foi aberto para escrita.")
+        if not 0 <= indice_pagina < self.__quantidade_paginas:
+            raise IndexError(f"Pagina '{indice_pagina}' inexistente.")
+        registros: List[Union[bytes, None]] = [
+            None if tupla is None else tupla.get_data().encode("UTF-8") for tupla in tuplas
+        ]
+        tamanho: int = self.CABECALHO_PAGINA.size + sum(
+            self.SLOT.size + len(registro or b"") for registro in registros
+        )
+        if tamanho > self.__tamanho_bloco:
+            raise ValueError(f"A Pagina '{indice_pagina}' não cabe no bloco.")
+        self.__write((indice_pagina + 1) * self.__tamanho_bloco,
+                     self.__pack_page(registros, self.__tamanho_bloco))
+
+    def __write(self, posicao: int, dados: bytes) -> None:
+        """Escreve bytes no arquivo em uma posição.
+
+        Args:
+            posicao (int): A posição no arquivo.
+            dados (bytes): Os bytes a serem escritos.
+        """
+        if hasattr(os, "pwrite"):
+            os.pwrite(self.__descritor, dados, posicao)
+        else:
+            os.lseek(self.__descritor, posicao, os.SEEK_SET)
+            os.write(self.__descritor, dados)
+
+    def read_page(self, indice_pagina: int) -> List[str]:
+        """Lê (do disco) os registros de uma Pagina.
+
+        Args:
+            indice_pagina (int): O índice da Pagina.
+
+        Returns:
+            List[str]: Os registros da Pagina.
+        """
+        return self.unpack_page(self.read_block(indice_pagina))
+
+    def search(self, dado: Tupla | str, indice_pagina: int) -> Tuple[Union[str, None], int]:
+        """Procura por um registro em uma Pagina, lendo-a do disco.
+
+        Args:
+            dado (Tupla | str): A Tupla (ou chave) a ser procurada.
+            indice_pagina (int): O índice da Pagina.
+
+        Returns:
+            Tuple[Union[str, None], int]: O registro caso seja encontrado,
+            ou 'None' caso contrário, juntamente com a qntd. de Paginas lidas.
+        """
+        chave: str = dado.get_data() if isinstance(dado, Tupla) else dado
+        for registro in self.read_page(indice_pagina):
+            if registro == chave:
+                return registro, 1
+        return None, 1
+
+    def get_path(self) -> str:
+        """Retorna o caminho do arquivo.
+
+        Returns:
+            str: O caminho do arquivo.
+        """
+        return self.__caminho
+
+    def get_block_size(self) -> int:
+        """Retorna o tamanho (em bytes) dos blocos.
+
+        Returns:
+            int: O tamanho dos blocos.
+        """
+        return self.__tamanho_bloco
+
+    def get_page_count(self) -> int:
+        """Retorna a quantidade de Paginas gravadas.
+
+        Returns:
+            int: A qntd. de Paginas.
+        """
+        return self.__quantidade_paginas
+
+    def get_page_fixed_size(self) -> int:
+        """Retorna o tamanho fixo (em Tuplas) das Paginas.
+
+        Returns:
+            int: O tamanho fixo das Paginas.
+        """
+        return self.__tamanho_pagina
+
+    def get_read_count(self) -> int:
+        """Retorna a quantidade de blocos lidos do disco.
+
+        Returns:
+            int: A qntd. de leituras.
+        """
+        return self.__quantidade_leituras
+
+    def get_average_read_latency(self) -> float:
+        """Retorna o tempo médio (em segundos) de leitura de um bloco.
+
+        Returns:
+            float: O tempo médio de leitura.
+        """
+        if self.__quantidade_leituras == 0:
+            return 0.0
+        return self.__tempo_leituras / self.__quantidade_leituras
+
+    def close(self) -> None:
+        """Fecha o arquivo."""
+        if self.__descritor != -1:
+            os.close(self.__descritor)
+            self.__descritor = -1
@@ -3,25 +3,52 @@ Estrutura responsável pelo mapeamento de
 dados de busca em endereços de páginas.
 """
 
-from math import log10
-from typing import Dict, List, Union, Any
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from heapq import nlargest
+from itertools import accumulate
+from math import ceil, log10
+from os import cpu_count
+from threading import Lock
+from time import perf_counter_ns
+from typing import Dict, List, Sequence, Tuple, Union, Any
 
 # pylint: disable=import-error
 
 from structs.Tupla import Tupla
 from structs.Tabela import Tabela
+from structs.Pagina import Pagina
 from structs.FuncaoHash import FuncaoHash
+from structs.FiltroBloom import FiltroBloom
+from structs.IndicePrefixo import IndicePrefixo
+from structs.TravaLeituraEscrita import TravaLeituraEscrita
+from structs.Instrumentacao import Instrumentacao
+
+# NumPy é opcional, usado somente no agrupamento por Bucket da carga em massa.
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 class Bucket:
     """Representa a estrutura Bucket."""
     # O "Id" do Bucket. (Facilita a contagem de Overflow)
     __id: int
-    # As Tuplas armazenadas no Bucket.
-    __dados: List[Tupla]
+    # As Tuplas armazenadas no Bucket, 'None' marca uma Tupla removida (lápide).
+    __dados: List[Union[Tupla, None]]
+    # A qntd. de lápides no Bucket.
+    __lapides: int
     # Capacidade do Bucket.
     __capacidade_bucket: int
     # Referêcia para o próximo Bucket. (Linked List)
     __proximo_bucket: 'Bucket' = None
+    # Somente no primeiro Bucket da cadeia: o último Bucket (Overflow),
+    # a qntd. de Tuplas, de Buckets e de lápides de toda a cadeia.
+    __ultimo_bucket: 'Bucket'
+    __quantidade_cadeia: int
+    __comprimento_cadeia: int
+    __lapides_cadeia: int
 
     def __init__(self, id_bucket: int, capacidade: int) -> None:
         """Inicializa dados essenciais.
@@ -32,7 +59,12 @@ class Bucket:
         """
         self.__id = id_bucket
         self.__dados = []
+        self.__lapides = 0
         self.__capacidade_bucket = capacidade
+        self.__ultimo_bucket = self
+        self.__quantidade_cadeia = 0
+        self.__comprimento_cadeia = 1
+        self.__lapides_cadeia = 0
 
     def get_bucket_id(self) -> int:
         """Retorna o "Id" do Bucket atual.
@@ -43,7 +75,8 @@ class Bucket:
         return self.__id
 
     def is_bucket_full(self) -> bool:
-        """Verifica se este Bucket está cheio.
+        """Verifica se este Bucket está cheio (as lápides
+        ocupam espaço até a cadeia ser compactada).
 
         Returns:
             bool: Se o Bucket está cheio ou não.
@@ -56,7 +89,18 @@ class Bucket:
         Returns:
             int: A qntd. de Tuplas armazenadas.
         """
-        return len(self.__dados)
+        return len(self.__dados) - self.__lapides
+
+    def get_data(self) -> List[Union[Tupla, None]]:
+        """Retorna as Tuplas armazenadas neste Bucket, sem
+        incluir as Tuplas dos Buckets (Overflow).
+
+        As Tuplas removidas aparecem como 'None' (lápides).
+
+        Returns:
+            List[Union[Tupla, None]]: As Tuplas armazenadas.
+        """
+        return self.__dados
 
     def get_next_bucket(self) -> Union['Bucket', None]:
         """Pega a referência do próximo Bucket (Overflow) caso
@@ -68,20 +112,76 @@ class Bucket:
         """
         return self.__proximo_bucket
 
-    def __create_overflow(self) -> None:
-        """Cria um novo Bucket (Overflow) e faz para referência a ele."""
-        bucket_overflow: 'Bucket' = Bucket(self.get_bucket_id() + 1, self.__capacidade_bucket)
-        self.__proximo_bucket = bucket_overflow
+    def get_last_bucket(self) -> 'Bucket':
+        """Retorna o último Bucket (Overflow) da cadeia, ou o
+        próprio Bucket caso ele não possua Overflows.
 
-    def __insert_data_into_overflow(self, dado: Tupla) -> None:
-        """Insere uma Tupla no próximo Bucket (Overflow).
+        Deve ser chamado no primeiro Bucket da cadeia.
 
-        Repete os mesmos passos de "self.insert_data()".
+        Returns:
+            Bucket: O último Bucket da cadeia.
+        """
+        return self.__ultimo_bucket
 
-        Args:
-            dado (Tupla): A Tupla a ser inserida no Bucket (Overflow).
+    def get_chain_size(self) -> int:
+        """Retorna a quantidade de Tuplas de toda a cadeia
+        (este Bucket e seus Overflows).
+
+        Deve ser chamado no primeiro Bucket da cadeia.
+
+        Returns:
+            int: A qntd. de Tuplas da cadeia.
+        """
+        return self.__quantidade_cadeia
+
+    def get_chain_length(self) -> int:
+        """Retorna a quantidade de Buckets da cadeia
+        (este Bucket e seus Overflows).
+
+        Deve ser chamado no primeiro Bucket da cadeia.
+
+        Returns:
+            int: A qntd. de Buckets da cadeia.
+        """
+        return self.__comprimento_cadeia
+
+    def get_tombstone_count(self) -> int:
+        """Retorna a quantidade de lápides de toda a cadeia.
+
+        Deve ser chamado no primeiro Bucket da cadeia.
+
+        Returns:
+            int: A qntd. de lápides da cadeia.
         """
-        self.__proximo_bucket.insert_data(dado)
+        return self.__lapides_cadeia
+
+    def get_wasted_bucket_count(self) -> int:
+        """Retorna quantos Buckets a cadeia possui além do mínimo
+        necessário para as suas Tuplas, ou seja, quantos Buckets
+        seriam liberados por 'compact()'.
+
+        Deve ser chamado no primeiro Bucket da cadeia.
+
+        Returns:
+            int: A qntd. de Buckets desperdiçados.
+        """
+        minimo: int = max(-(-self.__quantidade_cadeia // self.__capacidade_bucket), 1)
+        return self.__comprimento_cadeia - minimo
+
+    def __create_overflow(self) -> 'Bucket':
+        """Cria um novo Bucket (Overflow) no final da cadeia e faz
+        para referência a ele.
+
+        Deve ser chamado no primeiro Bucket da cadeia.
+
+        Returns:
+            Bucket: O novo último Bucket da cadeia.
+        """
+        ultimo: Bucket = self.__ultimo_bucket
+        ultimo.__proximo_bucket = Bucket(ultimo.get_bucket_id() + 1, self.__capacidade_bucket)
+        self.__ultimo_bucket = ultimo.__proximo_bucket
+        self.__comprimento_cadeia += 1
+        return self.__ultimo_bucket
 
     def insert_data(self, dado: Tupla) -> None:
         """Insere uma Tupla no Bucket, se possível.
@@ -90,55 +190,262 @@ class Bucket:
         por um Bucket (Overflow) e insere nele, caso não
         existe um Bucket (Overflow) um novo será criado.
 
+        A Tupla vai direto para o último Bucket da cadeia, sem
+        percorrê-la, então deve ser chamado no primeiro Bucket.
+
         Args:
             dado (Tupla): A Tupla a ser inserida no Bucket.
         """
-        if self.is_bucket_full():
-            if self.get_next_bucket() is None:
-                self.__create_overflow()
-            self.__insert_data_into_overflow(dado)
-        else:
-            self.__dados.append(dado)
+        bucket_alvo: Bucket = self.__ultimo_bucket
+        if bucket_alvo.is_bucket_full():
+            bucket_alvo = self.__create_overflow()
+        bucket_alvo.__dados.append(dado)
+        self.__quantidade_cadeia += 1
+
+    def insert_data_bulk(self, dados: Sequence[Tupla]) -> None:
+        """Insere várias Tuplas de uma só vez, preenchendo o último
+        Bucket da cadeia e criando os Buckets (Overflow) necessários
+        em uma única passada.
+
+        O resultado é o mesmo de inserir as Tuplas, em ordem,
+        com 'insert_data()'.
+
+        Args:
+            dados (Sequence[Tupla]): As Tuplas a serem inseridas.
+        """
+        bucket_alvo: Bucket = self.__ultimo_bucket
+        inicio: int = 0
+        while inicio < len(dados):
+            if bucket_alvo.is_bucket_full():
+                bucket_alvo = self.__create_overflow()
+            fim: int = inicio + self.__capacidade_bucket - len(bucket_alvo.__dados)
+            bucket_alvo.__dados.extend(dados[inicio:fim])
+            inicio = fim
+        self.__quantidade_cadeia += len(dados)
+
+    def remove_data(self, dado: Tupla | str) -> Union[Tupla, None]:
+        """Remove uma Tupla da cadeia, deixando uma lápide no seu lugar.
+
+        Deve ser chamado no primeiro Bucket da cadeia.
+
+        Args:
+            dado (Tupla | str): A Tupla (ou chave) a ser removida.
+
+        Returns:
+            Union[Tupla, None]: A Tupla removida ou 'None' caso ela
+            não seja encontrada.
+        """
+        chave: str = dado.get_data() if isinstance(dado, Tupla) else dado
+        chave_bytes: bytes = chave.encode("UTF-8")
+        bucket_alvo: Union[Bucket, None] = self
+        while bucket_alvo is not None:
+            for posicao, dado_bucket in enumerate(bucket_alvo.__dados):
+                if dado_bucket is not None and dado_bucket.has_key(chave, chave_bytes):
+                    bucket_alvo.__dados[posicao] = None
+                    bucket_alvo.__lapides += 1
+                    self.__quantidade_cadeia -= 1
+                    self.__lapides_cadeia += 1
+                    return dado_bucket
+            bucket_alvo = bucket_alvo.get_next_bucket()
+        return None
+
+    def compact(self) -> int:
+        """Compacta a cadeia, descartando as lápides e regravando as
+        suas Tuplas (na mesma ordem) na menor quantidade possível
+        de Buckets cheios.
+
+        Deve ser chamado no primeiro Bucket da cadeia.
+
+        Returns:
+            int: A qntd. de Buckets (Overflow) liberados.
+        """
+        if self.__lapides_cadeia == 0 and self.get_wasted_bucket_count() == 0:
+            return 0
+        comprimento_anterior: int = self.__comprimento_cadeia
+        tuplas: List[Tupla] = []
+        bucket_alvo: Union[Bucket, None] = self
+        while bucket_alvo is not None:
+            tuplas.extend(tupla for tupla in bucket_alvo.get_data() if tupla is not None)
+            bucket_alvo = bucket_alvo.get_next_bucket()
+        self.__dados = tuplas[:self.__capacidade_bucket]
+        self.__lapides = 0
+        self.__proximo_bucket = None
+        self.__ultimo_bucket = self
+        self.__comprimento_cadeia = 1
+        self.__quantidade_cadeia = len(self.__dados)
+        self.__lapides_cadeia = 0
+        self.insert_data_bulk(tuplas[self.__capacidade_bucket:])
+        return comprimento_anterior - self.__comprimento_cadeia
 
-    def search_data(self, dado: Any) -> Union[Tupla, None]:
+    def search_data(self, dado: Any, chave_bytes: bytes = None) -> Union[Tupla, None]:
         """Procura por uma determinada Tupla nesse Bucket.
 
         Args:
-            dado (Any): A Tupla a ser procurada.
+            dado (Any): A chave da Tupla a ser procurada.
+            chave_bytes (bytes, optional): A chave codificada em UTF-8,
+            comparada diretamente com as Tuplas que só armazenam os bytes
+            (ver 'Tupla.has_key()').
+            Valor padrão 'None'.
 
         Returns:
             Union[Tupla, None]: Retorna a Tupla se a mesma for
             encontrada ou "None" caso contrário.
         """
-        for dado_bucket in self.__dados:
-            if dado_bucket.get_data() == dado:
-                return dado_bucket
-        return None
+        posicao: int = self.search_position(dado, chave_bytes)
+        return self.__dados[posicao] if posicao != -1 else None
+
+    def search_position(self, dado: Any, chave_bytes: bytes = None) -> int:
+        """Procura pela posição de uma Tupla nesse Bucket.
+
+        Args:
+            dado (Any): A chave da Tupla a ser procurada.
+            chave_bytes (bytes, optional): A chave codificada em UTF-8
+            (ver 'search_data()').
+            Valor padrão 'None'.
+
+        Returns:
+            int: A posição da Tupla no Bucket ou '-1' caso contrário.
+        """
+        for posicao, dado_bucket in enumerate(self.__dados):
+            if dado_bucket is not None and dado_bucket.has_key(dado, chave_bytes):
+                return posicao
+        return -1
 
 
 class BucketManager:
     """Responsálve por manipular Buckets."""
+    # Modos do Filtro de Bloom: um único Filtro ou um Filtro por Bucket.
+    FILTRO_GLOBAL: str = "global"
+    FILTRO_POR_BUCKET: str = "bucket"
+
     # A quantidade necessária de Buckets para armazenar as Tuplas de uma Tabela.
     __quantidade_buckets: int
     # A capacidade dos Buckets.
     __capacidade_buckets: int
     # O registro de todos os Buckets criados, incluindo os overflows.
     __buckets: Dict[int, Bucket]
+    # A estratégia de hash usada para endereçar os Buckets.
+    __estrategia_hash: str
+    # A quantidade de Tuplas inseridas nos Buckets.
+    __quantidade_tuplas: int
+    # Hash Linear: se está ativo e o fator de carga máximo antes de um split.
+    __modo_linear: bool
+    __fator_carga_maximo: float
+    # Hash Linear: qntd. inicial de Buckets, nível atual e próximo Bucket a ser dividido.
+    __quantidade_inicial: int
+    __nivel: int
+    __proximo_split: int
+    # Estatísticas mantidas a cada inserção/remoção: o total de colisões e de
+    # Overflows e, para cada comprimento de cadeia, a qntd. de Buckets.
+    __total_colisoes: int
+    __total_overflows: int
+    __histograma_cadeias: Dict[int, int]
+    # Filtro de Bloom (opcional): o modo, a taxa de falsos positivos e os Filtros
+    # (no modo global somente o de índice 0).
+    __modo_filtro: Union[str, None]
+    __taxa_falsos_positivos: float
+    __filtros: Dict[int, FiltroBloom]
+    # Índice de Prefixos (opcional), com as mesmas Tuplas dos Buckets.
+    __indice_prefixo: Union[IndicePrefixo, None]
+    # Modo concorrente: a Trava da estrutura (splits e operações em massa),
+    # as Travas das faixas de Buckets (cadeias) com a largura de cada faixa,
+    # e a Trava dos contadores, do Filtro de Bloom global e do Índice de Prefixos.
+    __concorrente: bool
+    __trava_estrutura: Union[TravaLeituraEscrita, None]
+    __travas_faixas: List[TravaLeituraEscrita]
+    __largura_faixa: int
+    __trava_contadores: Union[Lock, None]
 
-    def __init__(self, quantidade_tuplas: int) -> None:
+    def __init__(self, quantidade_tuplas: int,
+                 estrategia_hash: str = FuncaoHash.ESTRATEGIA_PADRAO,
+                 modo_linear: bool = False, fator_carga_maximo: float = 0.8,
+                 filtro_bloom: str = None, taxa_falsos_positivos: float = 0.01,
+                 concorrente: bool = False, quantidade_travas: int = 16,
+                 indice_prefixo: bool = False) -> None:
         """Inicializa o Bucket, configurando a quantidade e
         a capacidade de cada Bucket baseado na qntd. de Tuplas.
 
         Args:
             quantidade_tuplas (int): A qntd. de Tuplas em uma Tabela.
+            estrategia_hash (str, optional): O nome da estratégia de hash
+            (ver 'FuncaoHash.get_strategies()').
+            Valor padrão 'FuncaoHash.ESTRATEGIA_PADRAO'.
+            modo_linear (bool, optional): Ativa o Hash Linear, em que um
+            Bucket é dividido por vez sempre que o fator de carga passar
+            de 'fator_carga_maximo'.
+            Valor padrão 'False'.
+            fator_carga_maximo (float, optional): O fator de carga máximo
+            (Tuplas / capacidade total) no Hash Linear.
+            Valor padrão '0.8'.
+            filtro_bloom (str, optional): Ativa um Filtro de Bloom na frente
+            das buscas, 'global' ou 'bucket' (um Filtro por Bucket).
+            Valor padrão 'None'.
+            taxa_falsos_positivos (float, optional): A taxa de falsos
+            positivos do Filtro de Bloom.
+            Valor padrão '0.01'.
+            concorrente (bool, optional): Permite o uso por várias threads,
+            com uma Trava de Leitura e Escrita por faixa de Buckets (várias
+            buscas simultâneas, inserções e remoções exclusivas por faixa).
+            Valor padrão 'False'.
+            quantidade_travas (int, optional): A qntd. de faixas (Travas)
+            no modo concorrente.
+            Valor padrão '16'.
+            indice_prefixo (bool, optional): Mantém um Índice de Prefixos
+            junto aos Buckets (ver 'search_prefix()').
+            Valor padrão 'False'.
+
+        Raises:
+            ValueError: Caso o fator de carga máximo não seja positivo,
+            o modo do Filtro de Bloom não exista ou a qntd. de Travas
+            seja inválida.
         """
+        # Valida e define a estratégia de hash.
+        FuncaoHash.get_strategy(estrategia_hash)
+        self.__estrategia_hash = estrategia_hash
+        if fator_carga_maximo <= 0:
+            raise ValueError("Fator de carga máximo inválido no Hash Linear.")
+        self.__modo_linear = modo_linear
+        self.__fator_carga_maximo = fator_carga_maximo
+        self.__quantidade_tuplas = 0
         # Calcula a quantidade de Buckets necessários.
         self.__calculate_bucket_size(quantidade_tuplas)
         # Calcula a capacidade dos Bucket.
         self.__calculate_bucket_capacity(quantidade_tuplas)
         # Inicializa os Buckets.
         self.__init_buckets()
+        # Inicializa o estado do Hash Linear.
+        self.__quantidade_inicial = self.__quantidade_buckets
+        self.__nivel = 0
+        self.__proximo_split = 0
+        # Inicializa o(s) Filtro(s) de Bloom.
+        if filtro_bloom not in (None, self.FILTRO_GLOBAL, self.FILTRO_POR_BUCKET):
+            raise ValueError(f"Modo de Filtro de Bloom '{filtro_bloom}' inexistente.")
+        self.__modo_filtro = filtro_bloom
+        self.__taxa_falsos_positivos = taxa_falsos_positivos
+        self.__filtros = {}
+        if filtro_bloom == self.FILTRO_GLOBAL:
+            self.__filtros[0] = FiltroBloom(
+                quantidade_tuplas, taxa_falsos_positivos, concorrente=concorrente
+            )
+        elif filtro_bloom == self.FILTRO_POR_BUCKET:
+            for id_bucket in range(0, self.__quantidade_buckets):
+                self.__filtros[id_bucket] = FiltroBloom(
+                    self.get_bucket_capacity(), taxa_falsos_positivos, concorrente=concorrente
+                )
+        self.__indice_prefixo = IndicePrefixo() if indice_prefixo else None
+        # Inicializa as Travas do modo concorrente.
+        if quantidade_travas <= 0:
+            raise ValueError("Qntd. de Travas inválida no modo concorrente.")
+        self.__concorrente = concorrente
+        self.__trava_estrutura = TravaLeituraEscrita() if concorrente else None
+        self.__travas_faixas = [
+            TravaLeituraEscrita() for _ in range(0, quantidade_travas if concorrente else 0)
+        ]
+        # Faixas contíguas, os Buckets criados por splits reaproveitam as faixas.
+        self.__largura_faixa = max(-(-self.__quantidade_inicial // quantidade_travas), 1)
+        self.__trava_contadores = Lock() if concorrente else None
 
+    @Instrumentacao.traced("carga")
     def insert_data_from_table(self, tabela: Tabela) -> None:
         """Insere TODAS as Tuplas de uma Tabela qualquer.
 
@@ -147,9 +454,147 @@ class BucketManager:
             nos Buckets.
         """
         if tabela is not None:
-            for tupla in tabela.get_tuples():
-                self.insert_data(tupla)
+            with self.__lock_structure(True):
+                self.__insert_bulk(tabela.get_tuples(), *tabela.get_packed_keys())
+
+    def __insert_bulk(self, tuplas: Sequence[Tupla], buffer: bytes, deslocamentos: array) -> None:
+        """Carga em massa: calcula o índice do Bucket de todas as Tuplas,
+        agrupa-as por Bucket (counting sort) e preenche cada Bucket e
+        seus Overflows em uma única passada.
 
+        No Hash Linear os splits dependem somente da qntd. de Tuplas,
+        então eles são feitos antes e as Tuplas são endereçadas com o
+        estado final, resultando nos mesmos Buckets da inserção uma a uma.
+
+        Args:
+            tuplas (Sequence[Tupla]): As Tuplas a serem inseridas.
+            buffer (bytes): As chaves das Tuplas codificadas em UTF-8.
+            deslocamentos (array): Os deslocamentos das chaves no buffer.
+        """
+        if self.__modo_linear:
+            valores: List[int] = FuncaoHash.hash_values_packed(
+                buffer, deslocamentos, self.__estrategia_hash
+            )
+            for _ in range(0, len(valores)):
+                self.__quantidade_tuplas += 1
+                if self.get_load_factor() > self.__fator_carga_maximo:
+                    self.__split_bucket()
+            ids_buckets: List[int] = [self.__get_address(valor) for valor in valores]
+        else:
+            ids_buckets = FuncaoHash.hash_batch_packed(
+                buffer, deslocamentos, self.__quantidade_buckets, self.__estrategia_hash
+            )
+            self.__quantidade_tuplas += len(ids_buckets)
+        inicios, registros = BucketManager.partition_by_bucket(ids_buckets, self.__quantidade_buckets)
+        # Materializa as Tuplas (ex.: Tabela Colunar) uma única vez.
+        if not isinstance(tuplas, list):
+            tuplas = list(tuplas)
+        for id_bucket in range(0, self.__quantidade_buckets):
+            if inicios[id_bucket] != inicios[id_bucket + 1]:
+                antes: Tuple[int, int] = self.__get_chain_stats(id_bucket)
+                self.get_bucket_by_id(id_bucket).insert_data_bulk(list(map(
+                    tuplas.__getitem__, registros[inicios[id_bucket]:inicios[id_bucket + 1]]
+                )))
+                self.__update_stats(antes, self.__get_chain_stats(id_bucket))
+        if self.__modo_filtro is not None:
+            self.__add_bulk_to_filters(buffer, deslocamentos, inicios, registros)
+        if self.__indice_prefixo is not None:
+            self.__indice_prefixo.insert_many(tuplas)
+
+    def __add_bulk_to_filters(self, buffer: bytes, deslocamentos: array,
+                              inicios: array, registros: array) -> None:
+        """Insere as chaves de uma carga em massa (já nos Buckets) no(s)
+        Filtro(s) de Bloom. Um Filtro que passaria da sua capacidade é
+        redimensionado pela qntd. real de Tuplas (da cadeia ou de todos
+        os Buckets) e reconstruído.
+
+        Args:
+            buffer (bytes): As chaves das Tuplas codificadas em UTF-8.
+            deslocamentos (array): Os deslocamentos das chaves no buffer.
+            inicios (array): O início de cada Bucket em 'registros'.
+            registros (array): As posições das Tuplas, agrupadas por Bucket.
+        """
+        if self.__modo_filtro == self.FILTRO_GLOBAL:
+            filtro: FiltroBloom = self.__filtros[0]
+            if filtro.get_insert_count() + len(deslocamentos) - 1 > filtro.get_capacity():
+                self.__rebuild_bloom_filter()
+                return
+        # Os valores hash do Filtro também são calculados de uma só vez.
+        valores_filtro: List[int] = FuncaoHash.hash_values_packed(
+            buffer, deslocamentos, FiltroBloom.ESTRATEGIA_PADRAO
+        )
+        if self.__modo_filtro == self.FILTRO_GLOBAL:
+            self.__filtros[0].add_hashes(valores_filtro)
+            return
+        for id_bucket in range(0, self.__quantidade_buckets):
+            quantidade: int = inicios[id_bucket + 1] - inicios[id_bucket]
+            if quantidade == 0:
+                continue
+            filtro = self.__filtros[id_bucket]
+            if filtro.get_insert_count() + quantidade > filtro.get_capacity():
+                self.__rebuild_bucket_filter(id_bucket)
+            else:
+                filtro.add_hashes([
+                    valores_filtro[id_registro]
+                    for id_registro in registros[inicios[id_bucket]:inicios[id_bucket + 1]]
+                ])
+
+    @staticmethod
+    def partition_by_bucket(ids_buckets: Sequence[int],
+                            quantidade_buckets: int) -> Tuple[array, array]:
+        """Agrupa posições pelo índice do Bucket (counting sort estável).
+
+        Args:
+            ids_buckets (Sequence[int]): O índice do Bucket de cada posição.
+            quantidade_buckets (int): A qntd. de Buckets.
+
+        Returns:
+            Tuple[array, array]: O início de cada Bucket e as posições,
+            agrupadas por Bucket (na ordem original dentro de cada Bucket).
+        """
+        if numpy is not None and len(ids_buckets) > 0:
+            ids = numpy.asarray(ids_buckets, dtype=numpy.int64)
+            inicios: array = array("Q", [0])
+            inicios.frombytes(numpy.cumsum(
+                numpy.bincount(ids, minlength=quantidade_buckets), dtype=numpy.uint64
+            ).tobytes())
+            registros: array = array("I")
+            registros.frombytes(numpy.argsort(ids, kind="stable").astype(numpy.uint32).tobytes())
+            return inicios, registros
+        contagem: List[int] = [0] * quantidade_buckets
+        for id_bucket in ids_buckets:
+            contagem[id_bucket] += 1
+        inicios: array = array("Q", [0])
+        inicios.extend(accumulate(contagem))
+        posicoes: List[int] = list(inicios[:-1])
+        registros: array = array("I", bytes(4 * len(ids_buckets)))
+        for id_registro, id_bucket in enumerate(ids_buckets):
+            registros[posicoes[id_bucket]] = id_registro
+            posicoes[id_bucket] += 1
+        return inicios, registros
+
+    def insert_data_batch(self, tuplas: Sequence[Tupla],
+                          chaves: Sequence[bytes] = None) -> None:
+        """Insere um lote de Tuplas, calculando o índice do Bucket
+        de todas elas de uma só vez.
+
+        Args:
+            tuplas (Sequence[Tupla]): As Tuplas a serem inseridas.
+            chaves (Sequence[bytes], optional): As chaves das Tuplas já
+            codificadas em UTF-8 (ex.: as linhas lidas do arquivo),
+            evitando lê-las e codificá-las novamente.
+            Valor padrão 'None'.
+        """
+        if chaves is None:
+            buffer, deslocamentos = FuncaoHash.pack_keys(tuplas)
+        else:
+            buffer = b"".join(chaves)
+            deslocamentos = array("Q", [0])
+            deslocamentos.extend(accumulate(map(len, chaves)))
+        with self.__lock_structure(True):
+            self.__insert_bulk(tuplas, buffer, deslocamentos)
+
+    @Instrumentacao.traced("insercao")
     def insert_data(self, dado: Tupla) -> None:
         """Insere uma Tupla em um determinado Bucket,
         o índice do Bucket é definido pela Função Hash.
@@ -157,13 +602,464 @@ class BucketManager:
         Args:
             dado (Tupla): A Tupla a ser inserida no Bucket.
         """
-        id_bucket: int = FuncaoHash.hash_function(dado, self.__quantidade_buckets)
-        self.get_bucket_by_id(id_bucket).insert_data(dado)
+        with self.__lock_structure(False):
+            id_bucket: int = self.get_bucket_id(dado)
+            with self.__lock_chain(id_bucket, True):
+                antes: Tuple[int, int] = self.__get_chain_stats(id_bucket)
+                self.get_bucket_by_id(id_bucket).insert_data(dado)
+                if self.__modo_filtro == self.FILTRO_POR_BUCKET:
+                    self.__filtros[id_bucket].add(dado)
+                    # Redimensiona (com folga) o Filtro que passou da capacidade.
+                    if self.__filtros[id_bucket].is_full():
+                        self.__rebuild_bucket_filter(id_bucket, 2.0)
+                # As estatísticas são atualizadas ainda com a cadeia travada,
+                # assim os deltas de uma mesma cadeia são aplicados em ordem.
+                with self.__lock_counters():
+                    self.__update_stats(antes, self.__get_chain_stats(id_bucket))
+                    self.__quantidade_tuplas += 1
+                    if self.__modo_filtro == self.FILTRO_GLOBAL:
+                        self.__filtros[0].add(dado)
+                    if self.__indice_prefixo is not None:
+                        self.__indice_prefixo.insert(dado)
+        # No Hash Linear, divide o próximo Bucket caso o fator de carga
+        # seja ultrapassado (o split bloqueia toda a estrutura).
+        if self.__modo_linear and self.get_load_factor() > self.__fator_carga_maximo:
+            with self.__lock_structure(True):
+                if self.get_load_factor() > self.__fator_carga_maximo:
+                    self.__split_bucket()
+        # O Filtro global que passou da capacidade é redimensionado (com folga),
+        # lendo todas as cadeias (o que também bloqueia toda a estrutura).
+        if self.__modo_filtro == self.FILTRO_GLOBAL and self.__filtros[0].is_full():
+            with self.__lock_structure(True):
+                if self.__filtros[0].is_full():
+                    self.__rebuild_bloom_filter(2.0)
+
+    def __lock_structure(self, escrita: bool) -> AbstractContextManager:
+        """Retorna a Trava da estrutura (modo concorrente), para leitura
+        nas operações sobre uma cadeia, ou para escrita nos splits e nas
+        operações em massa.
+
+        Args:
+            escrita (bool): Se a Trava é de escrita.
+
+        Returns:
+            AbstractContextManager: A Trava ou um contexto vazio.
+        """
+        if not self.__concorrente:
+            return nullcontext()
+        if escrita:
+            return self.__trava_estrutura.write_lock()
+        return self.__trava_estrutura.read_lock()
+
+    def __lock_chain(self, id_bucket: int, escrita: bool) -> AbstractContextManager:
+        """Retorna a Trava da faixa de um Bucket (modo concorrente).
+
+        Args:
+            id_bucket (int): O índice do Bucket.
+            escrita (bool): Se a Trava é de escrita.
+
+        Returns:
+            AbstractContextManager: A Trava ou um contexto vazio.
+        """
+        if not self.__concorrente:
+            return nullcontext()
+        trava: TravaLeituraEscrita = self.__travas_faixas[
+            (id_bucket // self.__largura_faixa) % len(self.__travas_faixas)
+        ]
+        return trava.write_lock() if escrita else trava.read_lock()
+
+    def __lock_counters(self) -> AbstractContextManager:
+        """Retorna a Trava dos contadores, do Filtro de Bloom global e do
+        Índice de Prefixos (modo concorrente).
+
+        Returns:
+            AbstractContextManager: A Trava ou um contexto vazio.
+        """
+        return self.__trava_contadores if self.__concorrente else nullcontext()
+
+    def is_concurrent(self) -> bool:
+        """Retorna se o modo concorrente está ativo.
+
+        Returns:
+            bool: Se o modo concorrente está ativo.
+        """
+        return self.__concorrente
+
+    def get_bucket_id(self, dado: Tupla | str) -> int:
+        """Retorna o índice do Bucket de uma Tupla (ou chave).
+
+        Args:
+            dado (Tupla | str): A Tupla (ou chave).
+
+        Returns:
+            int: O índice do Bucket.
+        """
+        if not self.__modo_linear:
+            return FuncaoHash.hash_function(
+                dado, self.__quantidade_buckets, self.__estrategia_hash
+            )
+        return self.__get_address(FuncaoHash.hash_value(dado, self.__estrategia_hash))
+
+    def __get_address(self, valor_hash: int) -> int:
+        """Converte um valor hash no índice de um Bucket (Hash Linear).
+
+        Os Buckets antes do ponteiro de split já foram divididos
+        nesse nível, então usam o dobro de endereços.
+
+        Args:
+            valor_hash (int): O valor hash de uma chave.
+
+        Returns:
+            int: O índice do Bucket.
+        """
+        id_bucket: int = valor_hash % (self.__quantidade_inicial << self.__nivel)
+        if id_bucket < self.__proximo_split:
+            id_bucket = valor_hash % (self.__quantidade_inicial << (self.__nivel + 1))
+        return id_bucket
+
+    def __split_bucket(self) -> None:
+        """Divide o Bucket apontado pelo ponteiro de split (Hash Linear).
+
+        Somente as Tuplas desse Bucket (e seus Overflows) são
+        redistribuídas entre ele e um novo Bucket no final.
+        """
+        id_antigo: int = self.__proximo_split
+        id_novo: int = (self.__quantidade_inicial << self.__nivel) + self.__proximo_split
+        # Recolhe todas as Tuplas da cadeia do Bucket a ser dividido.
+        tuplas: List[Tupla] = []
+        bucket_alvo: Bucket = self.get_bucket_by_id(id_antigo)
+        while bucket_alvo is not None:
+            tuplas.extend(tupla for tupla in bucket_alvo.get_data() if tupla is not None)
+            bucket_alvo = bucket_alvo.get_next_bucket()
+        self.__update_stats(self.__get_chain_stats(id_antigo), None)
+        self.__buckets[id_antigo] = Bucket(0, self.get_bucket_capacity())
+        self.__buckets[id_novo] = Bucket(0, self.get_bucket_capacity())
+        self.__quantidade_buckets += 1
+        # Avança o ponteiro de split, subindo de nível ao final de uma rodada.
+        self.__proximo_split += 1
+        if self.__proximo_split == self.__quantidade_inicial << self.__nivel:
+            self.__nivel += 1
+            self.__proximo_split = 0
+        # Redistribui as Tuplas entre os dois Buckets.
+        for tupla in tuplas:
+            self.get_bucket_by_id(self.get_bucket_id(tupla)).insert_data(tupla)
+        self.__update_stats(None, self.__get_chain_stats(id_antigo))
+        self.__update_stats(None, self.__get_chain_stats(id_novo))
+        if self.__modo_filtro == self.FILTRO_POR_BUCKET:
+            self.__create_bucket_filter(id_novo)
+            self.__rebuild_bucket_filter(id_antigo)
+            self.__rebuild_bucket_filter(id_novo)
+
+    def delete_data(self, dado: Tupla | str, tabela: Tabela = None,
+                    pagina: Pagina = None) -> Union[Tupla, None]:
+        """Remove uma Tupla dos Buckets, deixando uma lápide no seu
+        lugar (ver 'vacuum()') e, se informadas, também da Tabela e
+        da sua Pagina.
+
+        Args:
+            dado (Tupla | str): A Tupla (ou chave) a ser removida.
+            tabela (Tabela, optional): A Tabela da Tupla.
+            Valor padrão 'None'.
+            pagina (Pagina, optional): As Paginas da Tupla.
+            Valor padrão 'None'.
+
+        Returns:
+            Union[Tupla, None]: A Tupla removida ou 'None' caso ela
+            não seja encontrada.
+        """
+        with self.__lock_structure(False):
+            id_bucket: int = self.get_bucket_id(dado)
+            with self.__lock_chain(id_bucket, True):
+                antes: Tuple[int, int] = self.__get_chain_stats(id_bucket)
+                tupla: Union[Tupla, None] = self.get_bucket_by_id(id_bucket).remove_data(dado)
+                if tupla is not None:
+                    with self.__lock_counters():
+                        self.__update_stats(antes, self.__get_chain_stats(id_bucket))
+                        self.__quantidade_tuplas -= 1
+                        if self.__indice_prefixo is not None:
+                            self.__indice_prefixo.delete(tupla)
+                        if pagina is not None:
+                            pagina.delete(tupla)
+                        if tabela is not None:
+                            tabela.delete(tupla)
+        return tupla
+
+    def update_data(self, dado: Tupla | str, novo_dado: str,
+                    tabela: Tabela = None) -> Union[Tupla, None]:
+        """Substitui o dado (chave) de uma Tupla, movendo-a para o
+        Bucket da nova chave, a Tupla continua na mesma posição da
+        Tabela e na mesma Pagina.
+
+        No modo concorrente a remoção e a inserção são feitas
+        separadamente (a Tupla fica ausente entre elas).
+
+        Args:
+            dado (Tupla | str): A Tupla (ou chave) a ser atualizada.
+            novo_dado (str): O novo dado.
+            tabela (Tabela, optional): A Tabela da Tupla.
+            Valor padrão 'None'.
+
+        Returns:
+            Union[Tupla, None]: A Tupla atualizada ou 'None' caso ela
+            não seja encontrada.
+        """
+        tupla: Union[Tupla, None] = self.delete_data(dado)
+        if tupla is not None:
+            if tabela is not None:
+                tabela.update(tupla, novo_dado)
+            else:
+                tupla.set_data(novo_dado)
+            self.insert_data(tupla)
+        return tupla
+
+    def vacuum(self, quantidade_cadeias: int = None) -> int:
+        """Descarta as lápides das cadeias que mais as possuem,
+        compactando-as (ver 'Bucket.compact()'), o que também
+        encurta as cadeias de Overflow.
+
+        Limitando a qntd. de cadeias, a limpeza pode ser feita
+        aos poucos, entre outras operações.
+
+        Args:
+            quantidade_cadeias (int, optional): A qntd. máxima de cadeias
+            compactadas nesta passada.
+            Valor padrão 'None' (todas as cadeias com lápides).
+
+        Returns:
+            int: A qntd. de lápides descartadas.
+        """
+        with self.__lock_structure(True):
+            return self.__vacuum(quantidade_cadeias)
+
+    def __vacuum(self, quantidade_cadeias: int = None) -> int:
+        """Descarta as lápides das cadeias que mais as possuem
+        (ver 'vacuum()').
+
+        Args:
+            quantidade_cadeias (int, optional): A qntd. máxima de cadeias.
+            Valor padrão 'None' (todas as cadeias com lápides).
+
+        Returns:
+            int: A qntd. de lápides descartadas.
+        """
+        cadeias: List[int] = sorted(
+            (
+                id_bucket for id_bucket in range(0, self.get_bucket_count())
+                if self.get_bucket_by_id(id_bucket).get_tombstone_count() > 0
+            ),
+            key=lambda id_bucket: self.get_bucket_by_id(id_bucket).get_tombstone_count(),
+            reverse=True
+        )
+        if quantidade_cadeias is not None:
+            cadeias = cadeias[:max(quantidade_cadeias, 0)]
+        lapides: int = 0
+        for id_bucket in cadeias:
+            lapides += self.get_bucket_by_id(id_bucket).get_tombstone_count()
+            self.compact_chain(id_bucket)
+            if self.__modo_filtro == self.FILTRO_POR_BUCKET:
+                self.__rebuild_bucket_filter(id_bucket)
+        return lapides
+
+    def __create_bucket_filter(self, id_bucket: int) -> None:
+        """Cria o Filtro de Bloom (vazio) de um Bucket, dimensionado
+        pela capacidade dos Buckets.
+
+        Args:
+            id_bucket (int): O índice do Bucket.
+        """
+        self.__filtros[id_bucket] = FiltroBloom(
+            self.get_bucket_capacity(), self.__taxa_falsos_positivos,
+            concorrente=self.__concorrente
+        )
+
+    def __get_filter(self, id_bucket: int) -> Union[FiltroBloom, None]:
+        """Retorna o Filtro de Bloom que cobre um Bucket, caso exista.
+
+        Args:
+            id_bucket (int): O índice do Bucket.
+
+        Returns:
+            Union[FiltroBloom, None]: O Filtro de Bloom ou 'None'.
+        """
+        if self.__modo_filtro is None:
+            return None
+        return self.__filtros[0 if self.__modo_filtro == self.FILTRO_GLOBAL else id_bucket]
+
+    def __get_chain_tuples(self, id_bucket: int) -> List[Tupla]:
+        """Retorna as Tuplas (sem as lápides) da cadeia de um Bucket.
+
+        Args:
+            id_bucket (int): O índice do Bucket.
+
+        Returns:
+            List[Tupla]: As Tuplas da cadeia.
+        """
+        tuplas: List[Tupla] = []
+        bucket_alvo: Union[Bucket, None] = self.get_bucket_by_id(id_bucket)
+        while bucket_alvo is not None:
+            tuplas.extend(tupla for tupla in bucket_alvo.get_data() if tupla is not None)
+            bucket_alvo = bucket_alvo.get_next_bucket()
+        return tuplas
+
+    def __rebuild_bucket_filter(self, id_bucket: int, folga: float = 1.0) -> None:
+        """Reconstrói o Filtro de Bloom de um Bucket a partir das Tuplas
+        da sua cadeia, dimensionado pela qntd. real de Tuplas (no mínimo
+        a capacidade dos Buckets).
+
+        O novo Filtro é preenchido à parte e substitui o antigo em uma
+        única atribuição, então as buscas (que consultam o Filtro sem a
+        Trava da cadeia) nunca veem um Filtro vazio ou pela metade.
+
+        Args:
+            id_bucket (int): O índice do Bucket.
+            folga (float, optional): O fator aplicado à qntd. de Tuplas,
+            para que novas inserções não passem logo da capacidade.
+            Valor padrão '1.0'.
+        """
+        tuplas: List[Tupla] = self.__get_chain_tuples(id_bucket)
+        filtro: FiltroBloom = self.__filtros[id_bucket].resized(
+            max(ceil(len(tuplas) * folga), self.get_bucket_capacity())
+        )
+        if tuplas:
+            filtro.add_hashes(FuncaoHash.hash_values_packed(
+                *FuncaoHash.pack_keys(tuplas), FiltroBloom.ESTRATEGIA_PADRAO
+            ))
+        self.__filtros[id_bucket] = filtro
+
+    def rebuild_bloom_filter(self) -> None:
+        """Reconstrói o(s) Filtro(s) de Bloom a partir das Tuplas dos
+        Buckets, descartando as chaves já removidas (o Filtro não
+        permite remoções, elas somente causam falsos positivos).
+        """
+        with self.__lock_structure(True):
+            self.__rebuild_bloom_filter()
+
+    def __rebuild_bloom_filter(self, folga: float = 1.0) -> None:
+        """Reconstrói o(s) Filtro(s) de Bloom (ver 'rebuild_bloom_filter()'),
+        dimensionados pela qntd. real de Tuplas.
+
+        Args:
+            folga (float, optional): O fator aplicado à qntd. de Tuplas.
+            Valor padrão '1.0'.
+        """
+        if self.__modo_filtro == self.FILTRO_POR_BUCKET:
+            for id_bucket in range(0, self.get_bucket_count()):
+                self.__rebuild_bucket_filter(id_bucket, folga)
+        elif self.__modo_filtro == self.FILTRO_GLOBAL:
+            tuplas: List[Tupla] = []
+            for id_bucket in range(0, self.get_bucket_count()):
+                tuplas.extend(self.__get_chain_tuples(id_bucket))
+            filtro: FiltroBloom = self.__filtros[0].resized(ceil(len(tuplas) * folga))
+            if tuplas:
+                filtro.add_hashes(FuncaoHash.hash_values_packed(
+                    *FuncaoHash.pack_keys(tuplas), FiltroBloom.ESTRATEGIA_PADRAO
+                ))
+            self.__filtros[0] = filtro
+
+    def get_bloom_filter_mode(self) -> Union[str, None]:
+        """Retorna o modo do Filtro de Bloom.
+
+        Returns:
+            Union[str, None]: 'global', 'bucket' ou 'None' (desativado).
+        """
+        return self.__modo_filtro
+
+    def get_bloom_filter_stats(self) -> Dict[str, int]:
+        """Retorna os contadores do(s) Filtro(s) de Bloom, somados.
+
+        Returns:
+            Dict[str, int]: A qntd. de consultas ('consultas'), de consultas
+            que passaram pelo Filtro ('aprovacoes'), de buscas sem sucesso
+            evitadas ('descartes') e de falsos positivos ('falsos_positivos').
+        """
+        estatisticas: Dict[str, int] = {
+            "consultas": 0, "aprovacoes": 0, "descartes": 0, "falsos_positivos": 0
+        }
+        for filtro in self.__filtros.values():
+            estatisticas["consultas"] += filtro.get_query_count()
+            estatisticas["aprovacoes"] += filtro.get_hit_count()
+            estatisticas["descartes"] += filtro.get_skip_count()
+            estatisticas["falsos_positivos"] += filtro.get_false_positive_count()
+        return estatisticas
+
+    def get_prefix_index(self) -> IndicePrefixo:
+        """Retorna o Índice de Prefixos.
+
+        Returns:
+            IndicePrefixo: O Índice de Prefixos.
+
+        Raises:
+            ValueError: Caso o Índice de Prefixos esteja desativado.
+        """
+        if self.__indice_prefixo is None:
+            raise ValueError("Índice de Prefixos desativado.")
+        return self.__indice_prefixo
+
+    def search_prefix(self, prefixo: str, limite: int = None) -> List[Tupla]:
+        """Procura as Tuplas cujas chaves começam com um prefixo,
+        no Índice de Prefixos (sem percorrer a Tabela).
+
+        Args:
+            prefixo (str): O prefixo.
+            limite (int, optional): A qntd. máxima de Tuplas retornadas.
+            Valor padrão 'None' (sem limite).
+
+        Returns:
+            List[Tupla]: As Tuplas, em ordem alfabética das chaves.
+
+        Raises:
+            ValueError: Caso o Índice de Prefixos esteja desativado.
+        """
+        indice: IndicePrefixo = self.get_prefix_index()
+        # A carga em massa substitui o Índice sob a Trava da estrutura e as
+        # inserções o alteram sob a Trava dos contadores.
+        with self.__lock_structure(False), self.__lock_counters():
+            return indice.search_prefix(prefixo, limite)
+
+    def count_prefix(self, prefixo: str) -> int:
+        """Conta as Tuplas cujas chaves começam com um prefixo.
+
+        Args:
+            prefixo (str): O prefixo.
+
+        Returns:
+            int: A qntd. de Tuplas.
+
+        Raises:
+            ValueError: Caso o Índice de Prefixos esteja desativado.
+        """
+        indice: IndicePrefixo = self.get_prefix_index()
+        with self.__lock_structure(False), self.__lock_counters():
+            return indice.count_prefix(prefixo)
+
+    def get_completions(self, prefixo: str, quantidade: int = 10) -> List[Tuple[str, int]]:
+        """Retorna as primeiras chaves distintas (em ordem alfabética)
+        que completam um prefixo (autocompletar). Não são as chaves
+        mais frequentes, ver 'IndicePrefixo.get_completions()'.
+
+        Args:
+            prefixo (str): O prefixo.
+            quantidade (int, optional): A qntd. máxima de chaves.
+            Valor padrão '10'.
+
+        Returns:
+            List[Tuple[str, int]]: Cada chave e a sua qntd. de Tuplas.
+
+        Raises:
+            ValueError: Caso o Índice de Prefixos esteja desativado.
+        """
+        indice: IndicePrefixo = self.get_prefix_index()
+        with self.__lock_structure(False), self.__lock_counters():
+            return indice.get_completions(prefixo, quantidade)
 
     def search_data(self, dado: Tupla | str) -> Union[Union[Tupla, None], int]:
         """Procura por uma Tupla em um Bucket qualquer,
         o Bucket é determinado pela Função Hash.
 
+        Com a Instrumentação ativa, registra a latência de cada etapa
+        ('busca.hash', 'busca.filtro' e 'busca.cadeia') e da busca
+        ('busca'), além das sondagens (Buckets visitados) e comparações.
+
         Args:
             dado (Tupla | str): A Tupla a ser procurada nos Buckets.
 
@@ -172,16 +1068,194 @@ class BucketManager:
             for encontrada ou 'None' caso contrário e, também o índice
             do bucket em que ela foi encontrada ou '-1' caso contrário.
         """
-        id_bucket: int = FuncaoHash.hash_function(dado, self.__quantidade_buckets)
-        bucket_alvo: Bucket = self.get_bucket_by_id(id_bucket)
-        dado_alvo: Tupla | None = None
-        while bucket_alvo is not None:
-            dado_alvo = bucket_alvo.search_data(dado)
-            if dado_alvo is not None:
-                if dado == dado_alvo.get_data():
-                    return dado_alvo, id_bucket
-            bucket_alvo = bucket_alvo.get_next_bucket()
-        return None, -1
+        rastrear: bool = Instrumentacao.ativa
+        inicio: int = perf_counter_ns() if rastrear else 0
+        dado_alvo: Union[Tupla, None] = None
+        resultado: int = -1
+        sondagens: int = 0
+        comparacoes: int = 0
+        with self.__lock_structure(False):
+            id_bucket: int = self.get_bucket_id(dado)
+            if rastrear:
+                etapa: int = perf_counter_ns()
+                Instrumentacao.record("busca.hash", etapa - inicio)
+            # Uma chave certamente ausente não precisa percorrer o Bucket.
+            filtro: Union[FiltroBloom, None] = self.__get_filter(id_bucket)
+            descartada: bool = filtro is not None and not filtro.might_contain(dado)
+            if rastrear and filtro is not None:
+                Instrumentacao.record("busca.filtro", perf_counter_ns() - etapa)
+                etapa = perf_counter_ns()
+            if not descartada:
+                dado_alvo, sondagens, comparacoes = self.__search_chain(id_bucket, dado, rastrear)
+                if dado_alvo is not None:
+                    resultado = id_bucket
+                elif filtro is not None:
+                    filtro.record_false_positive()
+                if rastrear:
+                    Instrumentacao.record("busca.cadeia", perf_counter_ns() - etapa)
+        if rastrear:
+            Instrumentacao.record("busca", perf_counter_ns() - inicio)
+            Instrumentacao.increment("busca.sondagens", sondagens)
+            Instrumentacao.increment("busca.comparacoes", comparacoes)
+            Instrumentacao.increment("busca.sucessos" if resultado != -1 else "busca.falhas")
+        return dado_alvo, resultado
+
+    def __search_chain(self, id_bucket: int, dado: Tupla | str,
+                       contar: bool = False) -> Tuple[Union[Tupla, None], int, int]:
+        """Percorre a cadeia de um Bucket procurando por uma Tupla,
+        deve ser chamado com a Trava da estrutura (leitura).
+
+        Args:
+            id_bucket (int): O índice do Bucket.
+            dado (Tupla | str): A Tupla (ou chave) a ser procurada.
+            contar (bool, optional): Se as comparações são contadas.
+            Valor padrão 'False'.
+
+        Returns:
+            Tuple[Union[Tupla, None], int, int]: A Tupla (ou 'None'), a
+            qntd. de Buckets visitados e a qntd. de comparações (ou '0').
+        """
+        chave: str = dado.get_data() if isinstance(dado, Tupla) else dado
+        # A chave é codificada uma única vez para toda a cadeia.
+        chave_bytes: bytes = chave.encode("UTF-8")
+        sondagens: int = 0
+        comparacoes: int = 0
+        with self.__lock_chain(id_bucket, False):
+            bucket_alvo: Bucket = self.get_bucket_by_id(id_bucket)
+            while bucket_alvo is not None:
+                sondagens += 1
+                posicao: int = bucket_alvo.search_position(chave, chave_bytes)
+                if posicao != -1:
+                    dados: List[Union[Tupla, None]] = bucket_alvo.get_data()
+                    if contar:
+                        comparacoes += posicao + 1 - dados[:posicao + 1].count(None)
+                    return dados[posicao], sondagens, comparacoes
+                if contar:
+                    comparacoes += bucket_alvo.get_data_size()
+                bucket_alvo = bucket_alvo.get_next_bucket()
+        return None, sondagens, comparacoes
+
+    @Instrumentacao.traced("busca_lote")
+    def search_many(self, dados: Sequence[Tupla | str],
+                    executor: Executor = None) -> List[Tuple[Union[Tupla, None], int, int]]:
+        """Procura por várias Tuplas de uma só vez.
+
+        Os valores hash de todas as chaves são calculados em lote, as
+        chaves são agrupadas pelo índice do Bucket e a cadeia de cada
+        Bucket é percorrida uma única vez para todas as suas chaves.
+
+        Args:
+            dados (Sequence[Tupla | str]): As Tuplas (ou chaves) a serem procuradas.
+            executor (Executor, optional): Um pool de threads ou processos
+            para distribuir os grupos de Buckets. No pool de processos
+            somente as chaves das cadeias são enviadas.
+            Valor padrão 'None' (busca em série).
+
+        Returns:
+            List[Tuple[Union[Tupla, None], int, int]]: Para cada chave
+            (na ordem de entrada) a Tupla, o índice do Bucket e o índice
+            da Pagina ou '(None, -1, -1)' caso ela não seja encontrada.
+        """
+        with self.__lock_structure(False):
+            return self.__search_many(dados, executor)
+
+    def __search_many(self, dados: Sequence[Tupla | str],
+                      executor: Executor = None) -> List[Tuple[Union[Tupla, None], int, int]]:
+        """Procura por várias Tuplas de uma só vez (ver 'search_many()').
+
+        Args:
+            dados (Sequence[Tupla | str]): As Tuplas (ou chaves) a serem procuradas.
+            executor (Executor, optional): Um pool de threads ou processos.
+            Valor padrão 'None' (busca em série).
+
+        Returns:
+            List[Tuple[Union[Tupla, None], int, int]]: A Tupla, o índice
+            do Bucket e o índice da Pagina de cada chave.
+        """
+        chaves: List[str] = [
+            dado.get_data() if isinstance(dado, Tupla) else dado for dado in dados
+        ]
+        resultados: List[Tuple[Union[Tupla, None], int, int]] = [(None, -1, -1)] * len(chaves)
+        if not chaves:
+            return resultados
+        buffer, deslocamentos = FuncaoHash.pack_keys(chaves)
+        if self.__modo_linear:
+            ids_buckets: List[int] = list(map(self.__get_address, FuncaoHash.hash_values_packed(
+                buffer, deslocamentos, self.__estrategia_hash
+            )))
+        else:
+            ids_buckets = FuncaoHash.hash_batch_packed(
+                buffer, deslocamentos, self.__quantidade_buckets, self.__estrategia_hash
+            )
+        # Chaves certamente ausentes não entram em nenhum grupo.
+        if self.__modo_filtro is not None:
+            for id_registro, valor in enumerate(FuncaoHash.hash_values_packed(
+                    buffer, deslocamentos, FiltroBloom.ESTRATEGIA_PADRAO)):
+                if not self.__get_filter(ids_buckets[id_registro]).might_contain_hash(valor):
+                    ids_buckets[id_registro] = -1
+        quantidade_buckets: int = self.get_bucket_count()
+        ids_validos: List[int] = [id_bucket for id_bucket in ids_buckets if id_bucket >= 0]
+        posicoes: List[int] = [
+            id_registro for id_registro, id_bucket in enumerate(ids_buckets) if id_bucket >= 0
+        ]
+        inicios, registros = BucketManager.partition_by_bucket(ids_validos, quantidade_buckets)
+        grupos: List[Tuple[int, List[int]]] = [
+            (id_bucket, [posicoes[id_registro]
+                         for id_registro in registros[inicios[id_bucket]:inicios[id_bucket + 1]]])
+            for id_bucket in range(0, quantidade_buckets)
+            if inicios[id_bucket] != inicios[id_bucket + 1]
+        ]
+
+        cadeias: List[List[Tupla]] = []
+        for id_bucket, _ in grupos:
+            with self.__lock_chain(id_bucket, False):
+                cadeias.append(self.__get_chain_tuples(id_bucket))
+        argumentos: Tuple[list, list] = (
+            [[tupla.get_data() for tupla in cadeia] for cadeia in cadeias],
+            [[chaves[id_registro] for id_registro in grupo] for _, grupo in grupos]
+        )
+        if executor is None:
+            encontrados = map(BucketManager.match_chain, *argumentos)
+        elif isinstance(executor, ProcessPoolExecutor):
+            encontrados = executor.map(
+                BucketManager.match_chain, *argumentos,
+                chunksize=max(len(grupos) // (4 * (cpu_count() or 1)), 1)
+            )
+        else:
+            encontrados = executor.map(BucketManager.match_chain, *argumentos)
+
+        for (id_bucket, grupo), cadeia, indices in zip(grupos, cadeias, encontrados):
+            filtro: Union[FiltroBloom, None] = self.__get_filter(id_bucket)
+            for id_registro, indice in zip(grupo, indices):
+                if indice >= 0:
+                    tupla: Tupla = cadeia[indice]
+                    resultados[id_registro] = (tupla, id_bucket, tupla.get_page_index())
+                elif filtro is not None:
+                    filtro.record_false_positive()
+        return resultados
+
+    @staticmethod
+    def match_chain(chaves_cadeia: List[str], chaves: List[str]) -> List[int]:
+        """Percorre as chaves de uma cadeia uma única vez, procurando
+        por várias chaves (pode ser executado em outro processo).
+
+        Args:
+            chaves_cadeia (List[str]): As chaves da cadeia, em ordem.
+            chaves (List[str]): As chaves procuradas.
+
+        Returns:
+            List[int]: A posição da primeira ocorrência de cada chave
+            na cadeia ou '-1' caso ela não seja encontrada.
+        """
+        pendentes: Dict[str, int] = dict.fromkeys(chaves, -1)
+        restantes: int = len(pendentes)
+        for indice, chave in enumerate(chaves_cadeia):
+            if pendentes.get(chave, 0) == -1:
+                pendentes[chave] = indice
+                restantes -= 1
+                if restantes == 0:
+                    break
+        return [pendentes[chave] for chave in chaves]
 
     def get_bucket_by_id(self, id_bucket: int) -> Bucket:
         """Retorna um Bucket, procurando-o pelo índice.
@@ -202,6 +1276,41 @@ class BucketManager:
         """
         return self.__quantidade_buckets
 
+    def get_load_factor(self) -> float:
+        """Retorna o fator de carga, ou seja, a qntd. de Tuplas
+        dividida pela capacidade total dos Buckets (sem Overflows).
+
+        Returns:
+            float: O fator de carga.
+        """
+        return self.__quantidade_tuplas / (self.get_bucket_capacity() * self.get_bucket_count())
+
+    def is_linear(self) -> bool:
+        """Verifica se o Hash Linear está ativo.
+
+        Returns:
+            bool: Se o Hash Linear está ativo ou não.
+        """
+        return self.__modo_linear
+
+    def get_linear_state(self) -> Tuple[int, int, int]:
+        """Retorna o estado do Hash Linear (também válido fora dele,
+        em que o nível e o ponteiro de split são sempre 0).
+
+        Returns:
+            Tuple[int, int, int]: A qntd. inicial de Buckets, o nível
+            atual e o próximo Bucket a ser dividido.
+        """
+        return self.__quantidade_inicial, self.__nivel, self.__proximo_split
+
+    def get_hash_strategy(self) -> str:
+        """Retorna o nome da estratégia de hash usada.
+
+        Returns:
+            str: O nome da estratégia de hash.
+        """
+        return self.__estrategia_hash
+
     def get_bucket_capacity(self) -> int:
         """Retorna a capacidade dos Buckets.
 
@@ -216,18 +1325,126 @@ class BucketManager:
         Returns:
             float: A porcentagem de dispersão nos Buckets.
         """
-        # Calcula o total de colisões em TODOS os Buckets.
-        taxa_colisao: int = 0
-        for i in range(0, self.get_bucket_count()):
-            taxa_colisao += self.get_collision_count(i)
-        # Retorna a porcentagem, baseando-se na capacidade vezes quantidade.
-        return (taxa_colisao * 100) / (self.get_bucket_capacity() * self.get_bucket_count())
+        # Retorna a porcentagem do total de colisões (mantido a cada inserção),
+        # baseando-se na capacidade vezes quantidade.
+        return (self.__total_colisoes * 100) / (self.get_bucket_capacity() * self.get_bucket_count())
+
+    def __get_chain_stats(self, id_bucket: int) -> Tuple[int, int]:
+        """Retorna as estatísticas da cadeia de um Bucket, a partir
+        dos contadores mantidos pela cadeia (sem percorrê-la).
+
+        Args:
+            id_bucket (int): O índice do Bucket.
+
+        Returns:
+            Tuple[int, int]: A qntd. de colisões e o comprimento da cadeia.
+        """
+        bucket_alvo: Bucket = self.get_bucket_by_id(id_bucket)
+        return (
+            bucket_alvo.get_chain_size() - bucket_alvo.get_data_size(),
+            bucket_alvo.get_chain_length()
+        )
+
+    def __update_stats(self, antes: Union[Tuple[int, int], None],
+                       depois: Union[Tuple[int, int], None]) -> None:
+        """Atualiza as estatísticas globais com a mudança de uma cadeia.
+
+        Args:
+            antes (Union[Tuple[int, int], None]): As estatísticas da cadeia
+            antes da mudança ou 'None' se ela não existia.
+            depois (Union[Tuple[int, int], None]): As estatísticas da cadeia
+            depois da mudança ou 'None' se ela deixou de existir.
+        """
+        if antes == depois:
+            return
+        if antes is not None:
+            self.__total_colisoes -= antes[0]
+            self.__total_overflows -= antes[1] - 1
+            self.__histograma_cadeias[antes[1]] -= 1
+            if self.__histograma_cadeias[antes[1]] == 0:
+                del self.__histograma_cadeias[antes[1]]
+        if depois is not None:
+            self.__total_colisoes += depois[0]
+            self.__total_overflows += depois[1] - 1
+            self.__histograma_cadeias[depois[1]] = self.__histograma_cadeias.get(depois[1], 0) + 1
+
+    def get_total_collision_count(self) -> int:
+        """Retorna o total de colisões em todos os Buckets, em O(1).
+
+        Returns:
+            int: O total de colisões.
+        """
+        return self.__total_colisoes
+
+    def get_total_overflow_count(self) -> int:
+        """Retorna o total de Buckets (Overflow), em O(1).
+
+        Returns:
+            int: O total de Overflows.
+        """
+        return self.__total_overflows
+
+    def get_chain_length_histogram(self) -> Dict[int, int]:
+        """Retorna o histograma do comprimento das cadeias, sem percorrê-las.
+
+        Returns:
+            Dict[int, int]: Para cada comprimento, a qntd. de Buckets.
+        """
+        return dict(sorted(self.__histograma_cadeias.items()))
+
+    def get_worst_buckets(self, quantidade: int = 10) -> List[Tuple[int, int, int]]:
+        """Retorna os Buckets com as maiores cadeias, em O(Buckets),
+        a partir dos contadores das cadeias (sem percorrê-las).
+
+        Args:
+            quantidade (int, optional): A qntd. de Buckets.
+            Valor padrão '10'.
+
+        Returns:
+            List[Tuple[int, int, int]]: O índice, o comprimento da cadeia
+            e a qntd. de colisões de cada Bucket, do pior ao melhor.
+        """
+        estatisticas = (
+            (id_bucket, *self.__get_chain_stats(id_bucket))
+            for id_bucket in range(0, self.get_bucket_count())
+        )
+        return [
+            (id_bucket, comprimento, colisoes)
+            for id_bucket, colisoes, comprimento in nlargest(
+                quantidade, estatisticas, key=lambda estatistica: (estatistica[2], estatistica[1])
+            )
+        ]
+
+    def get_statistics(self, quantidade_piores: int = 10) -> Dict[str, Any]:
+        """Retorna as estatísticas dos Buckets, sem percorrer as cadeias.
+
+        Args:
+            quantidade_piores (int, optional): A qntd. de piores Buckets.
+            Valor padrão '10'.
+
+        Returns:
+            Dict[str, Any]: A qntd. de Tuplas ('tuplas') e de Buckets
+            ('buckets'), o fator de carga ('fator_carga'), o total de colisões
+            ('colisoes') e de Overflows ('overflows'), a porcentagem de
+            dispersão ('dispersao'), o histograma do comprimento das cadeias
+            ('histograma_cadeias') e os piores Buckets ('piores_buckets').
+        """
+        return {
+            "tuplas": self.__quantidade_tuplas,
+            "buckets": self.get_bucket_count(),
+            "fator_carga": self.get_load_factor(),
+            "colisoes": self.__total_colisoes,
+            "overflows": self.__total_overflows,
+            "dispersao": self.get_dispersion_percentage(),
+            "histograma_cadeias": self.get_chain_length_histogram(),
+            "piores_buckets": self.get_worst_buckets(quantidade_piores)
+        }
 
     def get_collision_count(self, id_bucket: int) -> int:
         """Retorna a taxa de colisão de um Bucket.
 
-        Itera sobre todos os Bucket (Overflow) e conta quantas
-        Tuplas foram registradas além da capacidade máxima.
+        Conta quantas Tuplas foram registradas nos Buckets (Overflow),
+        a partir da qntd. de Tuplas mantida pela cadeia.
 
         Args:
             id_bucket (int): O índice do Bucket a ser pego
@@ -236,12 +1453,8 @@ class BucketManager:
         Returns:
             int: A taxa de colisão de um Bucket.
         """
-        taxa_colisao: int = 0
         bucket_alvo: Bucket = self.get_bucket_by_id(id_bucket)
-        while bucket_alvo.get_next_bucket() is not None:
-            bucket_alvo = bucket_alvo.get_next_bucket()
-            taxa_colisao += bucket_alvo.get_data_size()
-        return taxa_colisao
+        return bucket_alvo.get_chain_size() - bucket_alvo.get_data_size()
 
     def get_overflow_count(self, id_bucket: int) -> int:
         """Retorna a quantidade de overflow de um Bucket.
@@ -253,12 +1466,149 @@ class BucketManager:
         Returns:
             int: A qntd. de overflow de um Bucket.
         """
-        quantidade_overflow: int = 0
-        bucket_alvo: Bucket = self.get_bucket_by_id(id_bucket)
-        while bucket_alvo.get_next_bucket() is not None:
-            bucket_alvo = bucket_alvo.get_next_bucket()
-            quantidade_overflow = max(quantidade_overflow, bucket_alvo.get_bucket_id())
-        return quantidade_overflow
+        return self.get_bucket_by_id(id_bucket).get_chain_length() - 1
+
+    def get_chain_length(self, id_bucket: int) -> int:
+        """Retorna o comprimento da cadeia de um Bucket, ou seja,
+        o próprio Bucket mais todos os seus Buckets (Overflow).
+
+        Args:
+            id_bucket (int): O índice do Bucket.
+
+        Returns:
+            int: A qntd. de Buckets na cadeia.
+        """
+        return self.get_bucket_by_id(id_bucket).get_chain_length()
+
+    def compact_chain(self, id_bucket: int) -> int:
+        """Compacta a cadeia de um Bucket na menor quantidade
+        possível de Buckets cheios (ver 'Bucket.compact()').
+
+        Args:
+            id_bucket (int): O índice do Bucket.
+
+        Returns:
+            int: A qntd. de Buckets (Overflow) liberados.
+        """
+        with self.__lock_structure(False), self.__lock_chain(id_bucket, True):
+            antes: Tuple[int, int] = self.__get_chain_stats(id_bucket)
+            liberados: int = self.get_bucket_by_id(id_bucket).compact()
+            with self.__lock_counters():
+                self.__update_stats(antes, self.__get_chain_stats(id_bucket))
+        return liberados
+
+    def rebalance(self, quantidade_cadeias: int = None) -> int:
+        """Regrava as piores cadeias, ou seja, as que mais desperdiçam
+        Buckets (Overflow), fazendo com que as buscas nelas percorram
+        menos Buckets.
+
+        Limitando a qntd. de cadeias, o rebalanceamento pode ser feito
+        aos poucos, entre outras operações, como uma tarefa de fundo.
+
+        Args:
+            quantidade_cadeias (int, optional): A qntd. máxima de cadeias
+            regravadas nesta passada.
+            Valor padrão 'None' (todas as cadeias com desperdício).
+
+        Returns:
+            int: A qntd. de Buckets (Overflow) liberados.
+        """
+        with self.__lock_structure(True):
+            return self.__rebalance(quantidade_cadeias)
+
+    def __rebalance(self, quantidade_cadeias: int = None) -> int:
+        """Regrava as piores cadeias (ver 'rebalance()').
+
+        Args:
+            quantidade_cadeias (int, optional): A qntd. máxima de cadeias.
+            Valor padrão 'None' (todas as cadeias com desperdício).
+
+        Returns:
+            int: A qntd. de Buckets (Overflow) liberados.
+        """
+        piores: List[int] = sorted(
+            (
+                id_bucket for id_bucket in range(0, self.get_bucket_count())
+                if self.get_bucket_by_id(id_bucket).get_wasted_bucket_count() > 0
+            ),
+            key=lambda id_bucket: (
+                self.get_bucket_by_id(id_bucket).get_wasted_bucket_count(),
+                self.get_bucket_by_id(id_bucket).get_chain_length()
+            ),
+            reverse=True
+        )
+        if quantidade_cadeias is not None:
+            piores = piores[:max(quantidade_cadeias, 0)]
+        return sum(self.compact_chain(id_bucket) for id_bucket in piores)
+
+    def get_probe_length_distribution(self) -> Dict[int, int]:
+        """Retorna a distribuição do comprimento de sondagem, ou seja,
+        quantas Tuplas são comparadas para encontrar cada Tupla
+        (percorrendo o Bucket e seus Overflows).
+
+        Returns:
+            Dict[int, int]: Para cada comprimento, a qntd. de Tuplas.
+        """
+        distribuicao: Dict[int, int] = {}
+        for id_bucket in range(0, self.get_bucket_count()):
+            comprimento: int = 0
+            bucket_alvo: Bucket = self.get_bucket_by_id(id_bucket)
+            while bucket_alvo is not None:
+                for tupla in bucket_alvo.get_data():
+                    comprimento += 1
+                    if tupla is not None:
+                        distribuicao[comprimento] = distribuicao.get(comprimento, 0) + 1
+                bucket_alvo = bucket_alvo.get_next_bucket()
+        return dict(sorted(distribuicao.items()))
+
+    @staticmethod
+    def compare_hash_strategies(tabela: Tabela) -> Dict[str, Dict[str, float]]:
+        """Compara todas as estratégias de hash sobre uma Tabela.
+
+        Para cada estratégia é construído um BucketManager com
+        as Tuplas da Tabela, medindo a porcentagem de dispersão
+        e o maior comprimento de cadeia (Bucket + Overflows).
+
+        Args:
+            tabela (Tabela): A Tabela usada na comparação.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Para cada estratégia, a
+            porcentagem de dispersão ('dispersao') e o maior
+            comprimento de cadeia ('maior_cadeia').
+        """
+        relatorio: Dict[str, Dict[str, float]] = {}
+        for estrategia in FuncaoHash.get_strategies():
+            gerenciador = BucketManager(tabela.get_size(), estrategia)
+            gerenciador.insert_data_from_table(tabela)
+            relatorio[estrategia] = {
+                "dispersao": gerenciador.get_dispersion_percentage(),
+                "maior_cadeia": max(
+                    gerenciador.get_chain_length(i)
+                    for i in range(0, gerenciador.get_bucket_count())
+                )
+            }
+        return relatorio
+
+    @staticmethod
+    def calculate_bucket_layout(quantidade_tuplas: int) -> Tuple[int, int]:
+        """Calcula a quantidade e a capacidade dos Buckets baseado
+        na quantidade de Tuplas de uma Tabela.
+
+        Basicamente divide a qntd. de Tuplas por alguma potência
+        de 10, em que a potência se dá pela contagem de dígitos
+        da qntd. de Tuplas dividido por 2, a capacidade é a divisão
+        entre a qntd. de Tuplas e a qntd. de Buckets.
+
+        Args:
+            quantidade_tuplas (int): A qntd. de Tuplas de uma Tabela.
+
+        Returns:
+            Tuple[int, int]: A qntd. e a capacidade dos Buckets.
+        """
+        quantidade_digitos: int = int(log10(quantidade_tuplas) + 1) // 2
+        quantidade_buckets: int = quantidade_tuplas // pow(10, quantidade_digitos)
+        return quantidade_buckets, quantidade_tuplas // quantidade_buckets
 
     def __calculate_bucket_size(self, quantidade_tuplas: int) -> None:
         """Calcula a quantidade de Buckets necessários baseado
@@ -271,8 +1621,7 @@ class BucketManager:
         Args:
             quantidade_tuplas (int): A qntd. de Tuplas de uma Tabela.
         """
-        quantidade_digitos: int = int(log10(quantidade_tuplas) + 1) // 2
-        self.__quantidade_buckets = quantidade_tuplas // pow(10, quantidade_digitos)
+        self.__quantidade_buckets, _ = BucketManager.calculate_bucket_layout(quantidade_tuplas)
 
     def __calculate_bucket_capacity(self, quantidade_tuplas: int) -> None:
         """Calcula a capacidade dos Buckets.
@@ -284,7 +1633,7 @@ class BucketManager:
         Args:
             quantidade_tuplas (int): A qntd. de Tuplas de uma Tabela.
         """
-        self.__capacidade_buckets = quantidade_tuplas // self.__quantidade_buckets
+        _, self.__capacidade_buckets = BucketManager.calculate_bucket_layout(quantidade_tuplas)
 
     def __init_buckets(self) -> None:
         """Inicializa todos os Buckets."""
@@ -292,3 +1641,6 @@ class BucketManager:
             id_bucket: Bucket(0, self.get_bucket_capacity())
             for id_bucket in range(0, self.get_bucket_count())
         }
+        self.__total_colisoes = 0
+        self.__total_overflows = 0
+        self.__histograma_cadeias = {1: self.get_bucket_count()}
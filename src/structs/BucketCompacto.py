@@ -0,0 +1,220 @@
+"""Representa a estrutura Bucket Compacto.
+Alternativa ao BucketManager em que todos os Buckets
+ficam em um único vetor contíguo de registros (CSR),
+com um vetor de deslocamentos marcando o início de
+cada Bucket, os Overflows são apenas intervalos.
+"""
+
+from array import array
+from typing import Dict, List, Tuple, Union
+
+# pylint: disable=import-error
+
+from structs.Tupla import Tupla
+from structs.Tabela import Tabela
+from structs.Bucket import BucketManager
+from structs.FuncaoHash import FuncaoHash
+
+class BucketCompacto:
+    """Responsável por manipular Buckets compactos."""
+    # A quantidade e a capacidade dos Buckets.
+    __quantidade_buckets: int
+    __capacidade_buckets: int
+    # A estratégia de hash usada para endereçar os Buckets.
+    __estrategia_hash: str
+    # Referências das Tuplas, o "Id" do registro é a posição nessa lista.
+    __tuplas: List[Tupla]
+    # Os "Ids" dos registros, agrupados por Bucket.
+    __registros: array
+    # O Bucket 'i' ocupa 'registros[inicios[i]:inicios[i + 1]]'.
+    __inicios: array
+    # Registros inseridos após a construção, ainda fora do vetor contíguo.
+    __pendentes: Dict[int, List[int]]
+
+    def __init__(self, quantidade_tuplas: int,
+                 estrategia_hash: str = FuncaoHash.ESTRATEGIA_PADRAO) -> None:
+        """Inicializa os Buckets (vazios), com a mesma quantidade e
+        capacidade calculadas pelo BucketManager.
+
+        Args:
+            quantidade_tuplas (int): A qntd. de Tuplas em uma Tabela.
+            estrategia_hash (str, optional): O nome da estratégia de hash.
+            Valor padrão 'FuncaoHash.ESTRATEGIA_PADRAO'.
+        """
+        FuncaoHash.get_strategy(estrategia_hash)
+        self.__estrategia_hash = estrategia_hash
+        self.__quantidade_buckets, self.__capacidade_buckets = \
+            BucketManager.calculate_bucket_layout(quantidade_tuplas)
+        self.__tuplas = []
+        self.__registros = array("I")
+        self.__inicios = array("Q", bytes(8 * (self.__quantidade_buckets + 1)))
+        self.__pendentes = {}
+
+    def insert_data_from_table(self, tabela: Tabela) -> None:
+        """Insere TODAS as Tuplas de uma Tabela qualquer.
+
+        Args:
+            tabela (Tabela): A Tabela a ser inserido as Tuplas
+            nos Buckets.
+        """
+        if tabela is not None:
+            self.__tuplas.extend(tabela.get_tuples())
+            self.compact()
+
+    def insert_data(self, dado: Tupla) -> None:
+        """Insere uma Tupla, ela fica pendente até a próxima
+        compactação (ver 'compact()').
+
+        Args:
+            dado (Tupla): A Tupla a ser inserida.
+        """
+        id_bucket: int = FuncaoHash.hash_function(
+            dado, self.__quantidade_buckets, self.__estrategia_hash
+        )
+        self.__pendentes.setdefault(id_bucket, []).append(len(self.__tuplas))
+        self.__tuplas.append(dado)
+
+    def compact(self) -> None:
+        """Reconstrói o vetor contíguo com TODAS as Tuplas (incluindo
+        as pendentes), agrupando-as por Bucket com o mesmo counting sort
+        da carga em massa do BucketManager ('partition_by_bucket()').
+        """
+        ids_buckets: List[int] = FuncaoHash.hash_batch(
+            self.__tuplas, self.__quantidade_buckets, self.__estrategia_hash
+        )
+        self.__inicios, self.__registros = BucketManager.partition_by_bucket(
+            ids_buckets, self.__quantidade_buckets
+        )
+        self.__pendentes = {}
+
+    def get_range(self, id_bucket: int) -> Tuple[int, int]:
+        """Retorna o intervalo de um Bucket no vetor de registros.
+
+        Args:
+            id_bucket (int): O índice do Bucket.
+
+        Returns:
+            Tuple[int, int]: O início e o fim (exclusivo) do intervalo.
+        """
+        return self.__inicios[id_bucket], self.__inicios[id_bucket + 1]
+
+    def get_page_range(self, id_bucket: int, indice_pagina: int) -> Tuple[int, int]:
+        """Retorna o intervalo de uma página de um Bucket, a página
+        0 é o próprio Bucket e as demais são os seus Overflows.
+
+        Args:
+            id_bucket (int): O índice do Bucket.
+            indice_pagina (int): O índice da página no Bucket.
+
+        Returns:
+            Tuple[int, int]: O início e o fim (exclusivo) do intervalo.
+        """
+        inicio, fim = self.get_range(id_bucket)
+        inicio_pagina: int = min(inicio + indice_pagina * self.__capacidade_buckets, fim)
+        return inicio_pagina, min(inicio_pagina + self.__capacidade_buckets, fim)
+
+    def search_data(self, dado: Tupla | str) -> Union[Union[Tupla, None], int]:
+        """Procura por uma Tupla no intervalo do seu Bucket.
+
+        Args:
+            dado (Tupla | str): A Tupla a ser procurada nos Buckets.
+
+        Returns:
+            Union[Union[Tupla, None], int]: Retorna a Tupla se ela
+            for encontrada ou 'None' caso contrário e, também o índice
+            do bucket em que ela foi encontrada ou '-1' caso contrário.
+        """
+        chave: str = dado.get_data() if isinstance(dado, Tupla) else dado
+        id_bucket: int = FuncaoHash.hash_function(
+            chave, self.__quantidade_buckets, self.__estrategia_hash
+        )
+        inicio, fim = self.get_range(id_bucket)
+        for id_registro in self.__registros[inicio:fim]:
+            if self.__tuplas[id_registro].get_data() == chave:
+                return self.__tuplas[id_registro], id_bucket
+        for id_registro in self.__pendentes.get(id_bucket, []):
+            if self.__tuplas[id_registro].get_data() == chave:
+                return self.__tuplas[id_registro], id_bucket
+        return None, -1
+
+    def get_bucket_count(self) -> int:
+        """Retorna a quantidade de Buckets.
+
+        Returns:
+            int: A qntd. de Buckets.
+        """
+        return self.__quantidade_buckets
+
+    def get_bucket_capacity(self) -> int:
+        """Retorna a capacidade dos Buckets.
+
+        Returns:
+            int: A capacidade dos Buckets.
+        """
+        return self.__capacidade_buckets
+
+    def get_hash_strategy(self) -> str:
+        """Retorna o nome da estratégia de hash usada.
+
+        Returns:
+            str: O nome da estratégia de hash.
+        """
+        return self.__estrategia_hash
+
+    def get_data_size(self, id_bucket: int) -> int:
+        """Retorna a quantidade de Tuplas de um Bucket (com Overflows).
+
+        Args:
+            id_bucket (int): O índice do Bucket.
+
+        Returns:
+            int: A qntd. de Tuplas do Bucket.
+        """
+        inicio, fim = self.get_range(id_bucket)
+        return fim - inicio + len(self.__pendentes.get(id_bucket, []))
+
+    def get_collision_count(self, id_bucket: int) -> int:
+        """Retorna a taxa de colisão de um Bucket, ou seja,
+        quantas Tuplas estão além da capacidade máxima.
+
+        Args:
+            id_bucket (int): O índice do Bucket.
+
+        Returns:
+            int: A taxa de colisão de um Bucket.
+        """
+        return max(self.get_data_size(id_bucket) - self.__capacidade_buckets, 0)
+
+    def get_overflow_count(self, id_bucket: int) -> int:
+        """Retorna a quantidade de overflow (páginas além da primeira)
+        de um Bucket.
+
+        Args:
+            id_bucket (int): O índice do Bucket.
+
+        Returns:
+            int: A qntd. de overflow de um Bucket.
+        """
+        return self.get_chain_length(id_bucket) - 1
+
+    def get_chain_length(self, id_bucket: int) -> int:
+        """Retorna a quantidade de páginas de um Bucket (com Overflows).
+
+        Args:
+            id_bucket (int): O índice do Bucket.
+
+        Returns:
+            int: A qntd. de páginas do Bucket.
+        """
+        return max(-(-self.get_data_size(id_bucket) // self.__capacidade_buckets), 1)
+
+    def get_dispersion_percentage(self) -> float:
+        """Retorna a porcentagem de dispersão nos Buckets.
+
+        Returns:
+            float: A porcentagem de dispersão nos Buckets.
+        """
+        taxa_colisao: int = 0
+        for i in range(0, self.get_bucket_count()):
+            taxa_colisao += self.get_collision_count(i)
+        return (taxa_colisao * 100) / (self.get_bucket_capacity() * self.get_bucket_count())
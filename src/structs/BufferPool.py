@@ -0,0 +1,219 @@
+"""Representa um Buffer Pool.
+Mantém em memória uma quantidade fixa de Paginas lidas
+de um Arquivo de Paginas, substituindo-as pelas políticas
+LRU ou Clock, evitando reler Paginas acessadas com frequência.
+"""
+
+from collections import OrderedDict
+from typing import Dict, List, Union
+
+# pylint: disable=import-error
+
+from structs.ArquivoPaginas import ArquivoPaginas
+
+class BufferPool:
+    """Representa um Buffer Pool."""
+    # Políticas de substituição disponíveis.
+    POLITICA_LRU: str = "lru"
+    POLITICA_CLOCK: str = "clock"
+
+    # O arquivo de onde as Paginas são lidas.
+    __arquivo: ArquivoPaginas
+    # A política de substituição.
+    __politica: str
+    # Quadros: Pagina carregada (-1 se vazio), registros, fixações e bit de referência.
+    __paginas_quadros: List[int]
+    __conteudos: List[Union[List[str], None]]
+    __fixacoes: List[int]
+    __referencias: List[bool]
+    # Mapeia o índice de uma Pagina ao seu quadro.
+    __tabela_paginas: Dict[int, int]
+    # LRU: quadros do menos ao mais recentemente usado.
+    __recencia: OrderedDict
+    # Clock: posição do ponteiro.
+    __ponteiro: int
+    # Estatísticas.
+    __acertos: int
+    __faltas: int
+    __substituicoes: int
+
+    def __init__(self, arquivo: ArquivoPaginas, quantidade_quadros: int,
+                 politica: str = POLITICA_LRU) -> None:
+        """Inicializa o Buffer Pool com todos os quadros vazios.
+
+        Args:
+            arquivo (ArquivoPaginas): O arquivo de onde as Paginas são lidas.
+            quantidade_quadros (int): A qntd. de quadros (Paginas em memória).
+            politica (str, optional): 'lru' ou 'clock'.
+            Valor padrão 'lru'.
+
+        Raises:
+            ValueError: Caso a qntd. de quadros ou a política sejam inválidas.
+        """
+        if quantidade_quadros <= 0:
+            raise ValueError("Qntd. de quadros inválida no Buffer Pool.")
+        if politica not in (self.POLITICA_LRU, self.POLITICA_CLOCK):
+            raise ValueError(f"Política de substituição '{politica}' inexistente.")
+        self.__arquivo = arquivo
+        self.__politica = politica
+        self.__paginas_quadros = [-1] * quantidade_quadros
+        self.__conteudos = [None] * quantidade_quadros
+        self.__fixacoes = [0] * quantidade_quadros
+        self.__referencias = [False] * quantidade_quadros
+        self.__tabela_paginas = {}
+        self.__recencia = OrderedDict((quadro, None) for quadro in range(quantidade_quadros))
+        self.__ponteiro = 0
+        self.__acertos = 0
+        self.__faltas = 0
+        self.__substituicoes = 0
+
+    def pin_page(self, indice_pagina: int) -> List[str]:
+        """Fixa uma Pagina em um quadro, lendo-a do disco caso
+        ela ainda não esteja em memória.
+
+        Uma Pagina fixada nunca é substituída, até que seja liberada
+        com 'unpin_page()'.
+
+        A Pagina é lida antes da escolha da vítima, então uma leitura
+        que falha (ex.: Pagina inexistente) não altera os quadros.
+
+        Args:
+            indice_pagina (int): O índice da Pagina.
+
+        Returns:
+            List[str]: Os registros da Pagina.
+        """
+        quadro: Union[int, None] = self.__tabela_paginas.get(indice_pagina)
+        if quadro is not None:
+            self.__acertos += 1
+        else:
+            registros: List[str] = self.__arquivo.read_page(indice_pagina)
+            quadro = self.__choose_frame()
+            self.__faltas += 1
+            if self.__paginas_quadros[quadro] != -1:
+                del self.__tabela_paginas[self.__paginas_quadros[quadro]]
+                self.__substituicoes += 1
+            self.__conteudos[quadro] = registros
+            self.__paginas_quadros[quadro] = indice_pagina
+            self.__tabela_paginas[indice_pagina] = quadro
+        self.__fixacoes[quadro] += 1
+        self.__referencias[quadro] = True
+        self.__recencia.move_to_end(quadro)
+        return self.__conteudos[quadro]
+
+    def unpin_page(self, indice_pagina: int) -> None:
+        """Libera uma Pagina fixada com 'pin_page()'.
+
+        Args:
+            indice_pagina (int): O índice da Pagina.
+
+        Raises:
+            ValueError: Caso a Pagina não esteja fixada.
+        """
+        quadro: Union[int, None] = self.__tabela_paginas.get(indice_pagina)
+        if quadro is None or self.__fixacoes[quadro] == 0:
+            raise ValueError(f"A Pagina '{indice_pagina}' não está fixada.")
+        self.__fixacoes[quadro] -= 1
+
+    def invalidate_page(self, indice_pagina: int) -> bool:
+        """Descarta uma Pagina do seu quadro (por exemplo, após uma
+        escrita no arquivo), a próxima fixação a relê do disco.
+
+        Args:
+            indice_pagina (int): O índice da Pagina.
+
+        Raises:
+            ValueError: Caso a Pagina esteja fixada.
+
+        Returns:
+            bool: Se a Pagina estava em memória.
+        """
+        quadro: Union[int, None] = self.__tabela_paginas.get(indice_pagina)
+        if quadro is None:
+            return False
+        if self.__fixacoes[quadro] > 0:
+            raise ValueError(f"A Pagina '{indice_pagina}' está fixada.")
+        del self.__tabela_paginas[indice_pagina]
+        self.__paginas_quadros[quadro] = -1
+        self.__conteudos[quadro] = None
+        self.__referencias[quadro] = False
+        # O quadro vazio é o primeiro a ser reutilizado.
+        self.__recencia.move_to_end(quadro, last=False)
+        return True
+
+    def __choose_frame(self) -> int:
+        """Escolhe um quadro para receber uma nova Pagina: um quadro
+        vazio ou, se não houver, a vítima escolhida pela política.
+
+        Raises:
+            RuntimeError: Caso todos os quadros estejam fixados.
+
+        Returns:
+            int: O índice do quadro.
+        """
+        if self.__politica == self.POLITICA_LRU:
+            # O primeiro quadro não fixado, do menos ao mais recente.
+            for quadro in self.__recencia:
+                if self.__fixacoes[quadro] == 0:
+                    return quadro
+        else:
+            # Clock: dá uma segunda chance aos quadros referenciados.
+            quantidade_quadros: int = len(self.__paginas_quadros)
+            for _ in range(2 * quantidade_quadros):
+                quadro: int = self.__ponteiro
+                self.__ponteiro = (self.__ponteiro + 1) % quantidade_quadros
+                if self.__fixacoes[quadro] > 0:
+                    continue
+                if self.__paginas_quadros[quadro] == -1 or not self.__referencias[quadro]:
+                    return quadro
+                self.__referencias[quadro] = False
+        raise RuntimeError("Todos os quadros do Buffer Pool estão fixados.")
+
+    def get_policy(self) -> str:
+        """Retorna a política de substituição.
+
+        Returns:
+            str: 'lru' ou 'clock'.
+        """
+        return self.__politica
+
+    def get_frame_count(self) -> int:
+        """Retorna a quantidade de quadros.
+
+        Returns:
+            int: A qntd. de quadros.
+        """
+        return len(self.__paginas_quadros)
+
+    def get_hit_count(self) -> int:
+        """Retorna a quantidade de acessos a Paginas já em memória.
+
+        Returns:
+            int: A qntd. de acertos.
+        """
+        return self.__acertos
+
+    def get_miss_count(self) -> int:
+        """Retorna a quantidade de acessos que leram o disco.
+
+        Returns:
+            int: A qntd. de faltas.
+        """
+        return self.__faltas
+
+    def get_eviction_count(self) -> int:
+        """Retorna a quantidade de Paginas substituídas.
+
+        Returns:
+            int: A qntd. de substituições.
+        """
+        return self.__substituicoes
+
+    def get_hit_ratio(self) -> float:
+        """Retorna a taxa de acertos.
+
+        Returns:
+            float: A taxa de acertos (entre 0 e 1).
+        """
+        acessos: int = self.__acertos + self.__faltas
+        return self.__acertos / acessos if acessos > 0 else 0.0
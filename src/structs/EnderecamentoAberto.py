@@ -0,0 +1,399 @@
+"""Representa a estrutura Endereçamento Aberto.
+Alternativa ao BucketManager em que as Tuplas são
+armazenadas diretamente em vetores paralelos (sem
+Buckets e sem Overflows), usando Robin Hood ou Cuckoo.
+"""
+
+from array import array
+from typing import Dict, List, Union
+
+# pylint: disable=import-error
+
+from structs.Tupla import Tupla
+from structs.Tabela import Tabela
+from structs.FuncaoHash import FuncaoHash
+
+class EnderecamentoAberto:
+    """Responsável por manipular uma tabela de Endereçamento Aberto."""
+    # Modos disponíveis.
+    MODO_ROBIN_HOOD: str = "robin_hood"
+    MODO_CUCKOO: str = "cuckoo"
+    # Qntd. máxima de deslocamentos no Cuckoo antes de usar o estoque.
+    MAXIMO_DESLOCAMENTOS: int = 256
+    # Qntd. de entradas expulsas (ciclos) no estoque do Cuckoo antes de crescer a tabela.
+    TAMANHO_ESTOQUE: int = 8
+
+    # O modo de endereçamento.
+    __modo: str
+    # As estratégias de hash (a secundária é usada somente no Cuckoo).
+    __estrategia_hash: str
+    __estrategia_secundaria: str
+    # O fator de carga máximo antes de dobrar a tabela.
+    __fator_carga_maximo: float
+    # Vetores paralelos: Tupla, chave, valores hash e distância de sondagem.
+    __tuplas: List[Union[Tupla, None]]
+    __chaves: List[Union[str, None]]
+    __hashes: array
+    __hashes_secundarios: array
+    __distancias: array
+    # A quantidade de Tuplas armazenadas.
+    __quantidade_tuplas: int
+    # Cuckoo: as entradas sem posição (chaves repetidas que já ocupam as
+    # suas duas posições e expulsas de ciclos), também lidas nas buscas,
+    # e a qntd. de expulsas de ciclos entre elas. A entrada 'i' do estoque
+    # tem a posição 'qntd. de posições + i'.
+    __estoque: List[tuple]
+    __expulsas: int
+
+    def __init__(self, quantidade_tuplas: int,
+                 estrategia_hash: str = "fnv1a",
+                 modo: str = MODO_ROBIN_HOOD, fator_carga_maximo: float = None,
+                 estrategia_secundaria: str = "polinomial") -> None:
+        """Inicializa os vetores com espaço para 'quantidade_tuplas'.
+
+        Args:
+            quantidade_tuplas (int): A qntd. de Tuplas em uma Tabela.
+            estrategia_hash (str, optional): O nome da estratégia de hash.
+            A estratégia 'soma' gera poucos valores distintos, formando
+            aglomerados enormes, por isso não é a padrão aqui.
+            Valor padrão 'fnv1a'.
+            modo (str, optional): 'robin_hood' ou 'cuckoo'.
+            Valor padrão 'robin_hood'.
+            fator_carga_maximo (float, optional): O fator de carga máximo.
+            Valor padrão '0.85' (Robin Hood) ou '0.45' (Cuckoo).
+            estrategia_secundaria (str, optional): A segunda estratégia
+            de hash do Cuckoo, deve ser diferente de 'estrategia_hash'.
+            Valor padrão 'polinomial'.
+
+        Raises:
+            ValueError: Caso o modo seja inválido ou as duas estratégias
+            do Cuckoo sejam iguais.
+        """
+        if modo not in (self.MODO_ROBIN_HOOD, self.MODO_CUCKOO):
+            raise ValueError(f"Modo de endereçamento '{modo}' inexistente.")
+        FuncaoHash.get_strategy(estrategia_hash)
+        FuncaoHash.get_strategy(estrategia_secundaria)
+        if modo == self.MODO_CUCKOO and estrategia_hash == estrategia_secundaria:
+            raise ValueError("O Cuckoo precisa de duas estratégias de hash diferentes.")
+        self.__modo = modo
+        self.__estrategia_hash = estrategia_hash
+        self.__estrategia_secundaria = estrategia_secundaria
+        if fator_carga_maximo is None:
+            fator_carga_maximo = 0.85 if modo == self.MODO_ROBIN_HOOD else 0.45
+        self.__fator_carga_maximo = fator_carga_maximo
+        self.__init_slots(int(max(quantidade_tuplas, 1) / fator_carga_maximo) + 1)
+
+    def __init_slots(self, quantidade_slots: int) -> None:
+        """Inicializa os vetores paralelos vazios.
+
+        Args:
+            quantidade_slots (int): A qntd. de posições.
+        """
+        self.__tuplas = [None] * quantidade_slots
+        self.__chaves = [None] * quantidade_slots
+        self.__hashes = array("Q", bytes(8 * quantidade_slots))
+        self.__hashes_secundarios = array("Q", bytes(8 * quantidade_slots))
+        self.__distancias = array("i", [-1]) * quantidade_slots
+        self.__quantidade_tuplas = 0
+        self.__estoque = []
+        self.__expulsas = 0
+
+    def insert_data_from_table(self, tabela: Tabela) -> None:
+        """Insere TODAS as Tuplas de uma Tabela qualquer.
+
+        Args:
+            tabela (Tabela): A Tabela a ser inserido as Tuplas.
+        """
+        if tabela is not None:
+            tuplas: List[Tupla] = tabela.get_tuples()
+            # Calcula os valores hash de todas as Tuplas de uma só vez.
+            buffer, deslocamentos = tabela.get_packed_keys()
+            valores: List[int] = FuncaoHash.hash_values_packed(
+                buffer, deslocamentos, self.__estrategia_hash
+            )
+            secundarios: List[int] = valores
+            if self.__modo == self.MODO_CUCKOO:
+                secundarios = FuncaoHash.hash_values_packed(
+                    buffer, deslocamentos, self.__estrategia_secundaria
+                )
+            for tupla, valor, secundario in zip(tuplas, valores, secundarios):
+                self.__insert_data_with_hash(tupla, valor, secundario)
+
+    def insert_data(self, dado: Tupla) -> None:
+        """Insere uma Tupla na tabela.
+
+        Args:
+            dado (Tupla): A Tupla a ser inserida.
+        """
+        valor: int = FuncaoHash.hash_value(dado, self.__estrategia_hash)
+        secundario: int = valor
+        if self.__modo == self.MODO_CUCKOO:
+            secundario = FuncaoHash.hash_value(dado, self.__estrategia_secundaria)
+        self.__insert_data_with_hash(dado, valor, secundario)
+
+    def __insert_data_with_hash(self, dado: Tupla, valor: int, secundario: int) -> None:
+        """Insere uma Tupla cujos valores hash já são conhecidos,
+        dobrando a tabela caso o fator de carga seja ultrapassado.
+
+        Args:
+            dado (Tupla): A Tupla a ser inserida.
+            valor (int): O valor hash primário.
+            secundario (int): O valor hash secundário (Cuckoo).
+        """
+        if (self.__quantidade_tuplas + 1) / len(self.__tuplas) > self.__fator_carga_maximo:
+            self.__resize(2 * len(self.__tuplas))
+        if self.__add_entry((dado, dado.get_data(), valor, secundario)):
+            self.__resize(2 * len(self.__tuplas))
+
+    def __add_entry(self, entrada: tuple) -> bool:
+        """Posiciona uma entrada, sem verificar o fator de carga.
+
+        Args:
+            entrada (tuple): A Tupla, a chave e os valores hash.
+
+        Returns:
+            bool: Se o estoque do Cuckoo encheu (a tabela precisa crescer).
+        """
+        self.__quantidade_tuplas += 1
+        if self.__modo == self.MODO_ROBIN_HOOD:
+            self.__insert_robin_hood(*entrada)
+            return False
+        # Uma chave repetida que já ocupa as suas duas posições nunca seria
+        # posicionada (nem crescendo a tabela), então vai para o estoque.
+        if self.__is_saturated(*entrada[1:]):
+            self.__estoque.append(entrada)
+            return False
+        entrada = self.__insert_cuckoo(*entrada)
+        if entrada is None:
+            return False
+        # Uma entrada ficou sem posição (ciclo), vai para o estoque e a
+        # tabela cresce somente se o estoque encher.
+        self.__estoque.append(entrada)
+        self.__expulsas += 1
+        return self.__expulsas > self.TAMANHO_ESTOQUE
+
+    def __is_saturated(self, chave: str, valor: int, secundario: int) -> bool:
+        """Verifica se as duas posições de uma chave (Cuckoo) já são
+        ocupadas por essa mesma chave.
+
+        Args:
+            chave (str): A chave.
+            valor (int): O valor hash primário.
+            secundario (int): O valor hash secundário.
+
+        Returns:
+            bool: Se as duas posições possuem a chave.
+        """
+        quantidade_slots: int = len(self.__tuplas)
+        return all(
+            self.__distancias[posicao] != -1 and self.__chaves[posicao] == chave
+            for posicao in (valor % quantidade_slots, secundario % quantidade_slots)
+        )
+
+    def __place(self, posicao: int, dado: Tupla, chave: str,
+                valor: int, secundario: int, distancia: int) -> None:
+        """Grava uma entrada em uma posição dos vetores paralelos.
+
+        Args:
+            posicao (int): A posição.
+            dado (Tupla): A Tupla.
+            chave (str): A chave da Tupla.
+            valor (int): O valor hash primário.
+            secundario (int): O valor hash secundário.
+            distancia (int): A distância de sondagem (ou qual hash, no Cuckoo).
+        """
+        self.__tuplas[posicao] = dado
+        self.__chaves[posicao] = chave
+        self.__hashes[posicao] = valor
+        self.__hashes_secundarios[posicao] = secundario
+        self.__distancias[posicao] = distancia
+
+    def __take(self, posicao: int) -> tuple:
+        """Retorna a entrada gravada em uma posição.
+
+        Args:
+            posicao (int): A posição.
+
+        Returns:
+            tuple: A Tupla, a chave e os valores hash.
+        """
+        return (self.__tuplas[posicao], self.__chaves[posicao],
+                self.__hashes[posicao], self.__hashes_secundarios[posicao])
+
+    def __insert_robin_hood(self, dado: Tupla, chave: str, valor: int, secundario: int) -> None:
+        """Insere com sondagem linear Robin Hood: uma entrada mais
+        distante da sua posição ideal toma o lugar de uma mais próxima.
+
+        Args:
+            dado (Tupla): A Tupla.
+            chave (str): A chave da Tupla.
+            valor (int): O valor hash primário.
+            secundario (int): O valor hash secundário.
+        """
+        quantidade_slots: int = len(self.__tuplas)
+        posicao: int = valor % quantidade_slots
+        distancia: int = 0
+        while True:
+            distancia_atual: int = self.__distancias[posicao]
+            if distancia_atual == -1:
+                self.__place(posicao, dado, chave, valor, secundario, distancia)
+                return None
+            if distancia_atual < distancia:
+                # Troca com a entrada "mais rica" e continua inserindo ela.
+                deslocada = self.__take(posicao)
+                self.__place(posicao, dado, chave, valor, secundario, distancia)
+                dado, chave, valor, secundario = deslocada
+                distancia = distancia_atual
+            posicao = (posicao + 1) % quantidade_slots
+            distancia += 1
+
+    def __insert_cuckoo(self, dado: Tupla, chave: str, valor: int, secundario: int) -> Union[tuple, None]:
+        """Insere com Cuckoo: a entrada vai para uma das duas posições
+        possíveis, expulsando a ocupante para a posição alternativa dela.
+
+        Args:
+            dado (Tupla): A Tupla.
+            chave (str): A chave da Tupla.
+            valor (int): O valor hash primário.
+            secundario (int): O valor hash secundário.
+
+        Returns:
+            Union[tuple, None]: 'None' caso a inserção termine, ou a
+            entrada que ficou sem posição após 'MAXIMO_DESLOCAMENTOS'.
+        """
+        quantidade_slots: int = len(self.__tuplas)
+        posicao: int = valor % quantidade_slots
+        if self.__distancias[posicao] != -1:
+            posicao = secundario % quantidade_slots
+        for _ in range(self.MAXIMO_DESLOCAMENTOS):
+            qual_hash: int = 0 if posicao == valor % quantidade_slots else 1
+            if self.__distancias[posicao] == -1:
+                self.__place(posicao, dado, chave, valor, secundario, qual_hash)
+                return None
+            expulsa = self.__take(posicao)
+            self.__place(posicao, dado, chave, valor, secundario, qual_hash)
+            dado, chave, valor, secundario = expulsa
+            # A entrada expulsa vai para a sua outra posição.
+            alternativa: int = valor % quantidade_slots
+            if alternativa == posicao:
+                alternativa = secundario % quantidade_slots
+            posicao = alternativa
+        return (dado, chave, valor, secundario)
+
+    def __resize(self, quantidade_slots: int) -> None:
+        """Recria os vetores com uma nova quantidade de posições,
+        reposicionando as entradas (e o estoque) diretamente nos novos
+        vetores com os valores hash já armazenados.
+
+        Caso o estoque do Cuckoo encha durante o reposicionamento, a
+        qntd. de posições dobra e o reposicionamento recomeça.
+
+        Args:
+            quantidade_slots (int): A nova qntd. de posições.
+        """
+        entradas: List[tuple] = [
+            self.__take(posicao)
+            for posicao in range(0, len(self.__tuplas))
+            if self.__distancias[posicao] != -1
+        ] + self.__estoque
+        while True:
+            self.__init_slots(quantidade_slots)
+            if not any(map(self.__add_entry, entradas)):
+                return
+            quantidade_slots *= 2
+
+    def search_data(self, dado: Tupla | str) -> Union[Union[Tupla, None], int]:
+        """Procura por uma Tupla na tabela.
+
+        Args:
+            dado (Tupla | str): A Tupla (ou chave) a ser procurada.
+
+        Returns:
+            Union[Union[Tupla, None], int]: Retorna a Tupla se ela
+            for encontrada ou 'None' caso contrário e, também a posição
+            em que ela foi encontrada ou '-1' caso contrário. A posição
+            'get_slot_count() + i' é a entrada 'i' do estoque do Cuckoo.
+        """
+        chave: str = dado.get_data() if isinstance(dado, Tupla) else dado
+        valor: int = FuncaoHash.hash_value(chave, self.__estrategia_hash)
+        quantidade_slots: int = len(self.__tuplas)
+        if self.__modo == self.MODO_CUCKOO:
+            posicoes = (
+                valor % quantidade_slots,
+                FuncaoHash.hash_value(chave, self.__estrategia_secundaria) % quantidade_slots
+            )
+            for posicao in posicoes:
+                if self.__distancias[posicao] != -1 and self.__chaves[posicao] == chave:
+                    return self.__tuplas[posicao], posicao
+            for indice, entrada in enumerate(self.__estoque):
+                if entrada[1] == chave:
+                    return entrada[0], quantidade_slots + indice
+            return None, -1
+        # Robin Hood: a busca para assim que a distância da entrada
+        # for menor que a distância percorrida.
+        posicao: int = valor % quantidade_slots
+        distancia: int = 0
+        while distancia <= self.__distancias[posicao]:
+            if self.__hashes[posicao] == valor and self.__chaves[posicao] == chave:
+                return self.__tuplas[posicao], posicao
+            posicao = (posicao + 1) % quantidade_slots
+            distancia += 1
+        return None, -1
+
+    def get_slot_count(self) -> int:
+        """Retorna a quantidade de posições da tabela.
+
+        Returns:
+            int: A qntd. de posições.
+        """
+        return len(self.__tuplas)
+
+    def get_data_size(self) -> int:
+        """Retorna a quantidade de Tuplas armazenadas.
+
+        Returns:
+            int: A qntd. de Tuplas armazenadas.
+        """
+        return self.__quantidade_tuplas
+
+    def get_stash_size(self) -> int:
+        """Retorna a quantidade de Tuplas no estoque do Cuckoo.
+
+        Returns:
+            int: A qntd. de Tuplas sem posição na tabela.
+        """
+        return len(self.__estoque)
+
+    def get_load_factor(self) -> float:
+        """Retorna o fator de carga da tabela.
+
+        Returns:
+            float: O fator de carga.
+        """
+        return self.__quantidade_tuplas / len(self.__tuplas)
+
+    def get_mode(self) -> str:
+        """Retorna o modo de endereçamento.
+
+        Returns:
+            str: 'robin_hood' ou 'cuckoo'.
+        """
+        return self.__modo
+
+    def get_probe_length_distribution(self) -> Dict[int, int]:
+        """Retorna a distribuição do comprimento de sondagem, ou seja,
+        quantas posições são lidas para encontrar cada Tupla.
+
+        Encontrar a entrada 'i' do estoque do Cuckoo custa as duas
+        posições da tabela mais 'i + 1' entradas do estoque.
+
+        Returns:
+            Dict[int, int]: Para cada comprimento, a qntd. de Tuplas.
+        """
+        distribuicao: Dict[int, int] = {}
+        for distancia in self.__distancias:
+            if distancia != -1:
+                distribuicao[distancia + 1] = distribuicao.get(distancia + 1, 0) + 1
+        for indice in range(0, len(self.__estoque)):
+            distribuicao[indice + 3] = distribuicao.get(indice + 3, 0) + 1
+        return dict(sorted(distribuicao.items()))
@@ -0,0 +1,309 @@
+"""Representa um Filtro de Bloom.
+Estrutura probabilística que responde se uma chave
+certamente NÃO foi inserida, evitando percorrer um
+Bucket (e seus Overflows) nas buscas sem sucesso.
+"""
+
+from contextlib import AbstractContextManager, nullcontext
+from math import ceil, log
+from threading import Lock
+from typing import Dict, Sequence, Union
+
+# pylint: disable=import-error
+
+from structs.Tupla import Tupla
+from structs.FuncaoHash import FuncaoHash
+
+# NumPy é opcional, usado somente na inserção em lote (vetorizada).
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class FiltroBloom:
+    """Representa um Filtro de Bloom."""
+    # Estratégia de hash padrão, independente da usada nos Buckets.
+    ESTRATEGIA_PADRAO: str = "fnv1a"
+
+    # O vetor de bits.
+    __bits: bytearray
+    # A qntd. de bits e de funções hash.
+    __quantidade_bits: int
+    __quantidade_funcoes: int
+    # A qntd. de elementos para a qual o Filtro foi dimensionado, a taxa de
+    # falsos positivos desejada e a qntd. de elementos inseridos desde então.
+    __capacidade: int
+    __taxa_falsos_positivos: float
+    __quantidade_insercoes: int
+    # A estratégia de hash usada.
+    __estrategia_hash: str
+    # Contadores: consultas, descartes (chaves certamente ausentes) e falsos
+    # positivos, compartilhados com os Filtros criados por 'resized()'.
+    __contadores: Dict[str, int]
+    # Protege os contadores no modo concorrente (também compartilhada).
+    __trava: Union[Lock, None]
+
+    def __init__(self, quantidade_elementos: int, taxa_falsos_positivos: float = 0.01,
+                 estrategia_hash: str = ESTRATEGIA_PADRAO, concorrente: bool = False) -> None:
+        """Dimensiona o Filtro de Bloom para uma qntd. de elementos
+        e uma taxa de falsos positivos.
+
+        Args:
+            quantidade_elementos (int): A qntd. esperada de elementos.
+            taxa_falsos_positivos (float, optional): A taxa de falsos
+            positivos desejada (entre 0 e 1).
+            Valor padrão '0.01'.
+            estrategia_hash (str, optional): O nome da estratégia de hash.
+            Valor padrão 'fnv1a'.
+            concorrente (bool, optional): Protege os contadores com uma
+            Trava, para consultas de várias threads.
+            Valor padrão 'False'.
+
+        Raises:
+            ValueError: Caso a taxa de falsos positivos seja inválida.
+        """
+        if not 0 < taxa_falsos_positivos < 1:
+            raise ValueError("Taxa de falsos positivos inválida no Filtro de Bloom.")
+        FuncaoHash.get_strategy(estrategia_hash)
+        self.__estrategia_hash = estrategia_hash
+        self.__taxa_falsos_positivos = taxa_falsos_positivos
+        self.resize(quantidade_elementos)
+        self.__contadores = {"consultas": 0, "descartes": 0, "falsos_positivos": 0}
+        self.__trava = Lock() if concorrente else None
+
+    def __lock(self) -> AbstractContextManager:
+        """Retorna a Trava dos contadores (modo concorrente).
+
+        Returns:
+            AbstractContextManager: A Trava ou um contexto nulo.
+        """
+        return self.__trava if self.__trava is not None else nullcontext()
+
+    def resized(self, quantidade_elementos: int) -> 'FiltroBloom':
+        """Cria um novo Filtro vazio, com a mesma taxa e estratégia,
+        dimensionado para uma nova qntd. de elementos e que compartilha
+        os contadores (e a Trava) deste Filtro.
+
+        Com consultas simultâneas, o novo Filtro é preenchido e só então
+        substitui a referência ao antigo, que nunca fica parcialmente vazio.
+
+        Args:
+            quantidade_elementos (int): A qntd. esperada de elementos.
+
+        Returns:
+            FiltroBloom: O novo Filtro.
+        """
+        filtro: FiltroBloom = FiltroBloom(
+            quantidade_elementos, self.__taxa_falsos_positivos, self.__estrategia_hash
+        )
+        filtro.__contadores = self.__contadores
+        filtro.__trava = self.__trava
+        return filtro
+
+    def resize(self, quantidade_elementos: int) -> None:
+        """Redimensiona o Filtro para uma nova qntd. de elementos,
+        removendo todas as chaves (os contadores são mantidos).
+
+        Não deve ser usado com consultas simultâneas, ver 'resized()'.
+
+        Args:
+            quantidade_elementos (int): A qntd. esperada de elementos.
+        """
+        quantidade_elementos = max(quantidade_elementos, 1)
+        # m = -n * ln(p) / ln(2)^2 e k = (m / n) * ln(2).
+        self.__quantidade_bits = max(
+            ceil(-quantidade_elementos * log(self.__taxa_falsos_positivos) / (log(2) ** 2)), 8
+        )
+        self.__quantidade_funcoes = max(
+            round(self.__quantidade_bits / quantidade_elementos * log(2)), 1
+        )
+        self.__bits = bytearray((self.__quantidade_bits + 7) // 8)
+        self.__capacidade = quantidade_elementos
+        self.__quantidade_insercoes = 0
+
+    def hash_value(self, dado: Tupla | str) -> int:
+        """Retorna o valor hash de uma chave, com a estratégia do Filtro.
+
+        Args:
+            dado (Tupla | str): A Tupla (ou chave).
+
+        Returns:
+            int: O valor hash da chave.
+        """
+        return FuncaoHash.hash_value(dado, self.__estrategia_hash)
+
+    def add_hash(self, valor_hash: int) -> None:
+        """Insere uma chave a partir do seu valor hash.
+
+        As posições são derivadas do valor hash (duplo hashing),
+        com as metades baixa e alta de 32 bits.
+
+        Args:
+            valor_hash (int): O valor hash da chave.
+        """
+        self.__quantidade_insercoes += 1
+        base: int = valor_hash & 0xFFFFFFFF
+        passo: int = (valor_hash >> 32) | 1
+        for _ in range(0, self.__quantidade_funcoes):
+            posicao: int = base % self.__quantidade_bits
+            self.__bits[posicao >> 3] |= 1 << (posicao & 7)
+            base += passo
+
+    def add_hashes(self, valores: Sequence[int]) -> None:
+        """Insere várias chaves a partir dos seus valores hash
+        (ver 'add_hash()'), de forma vetorizada se possível.
+
+        Args:
+            valores (Sequence[int]): Os valores hash das chaves.
+        """
+        if numpy is None or len(valores) == 0:
+            for valor in valores:
+                self.add_hash(valor)
+            return
+        self.__quantidade_insercoes += len(valores)
+        valores_hash = numpy.asarray(valores, dtype=numpy.uint64)
+        base = valores_hash & numpy.uint64(0xFFFFFFFF)
+        passo = (valores_hash >> numpy.uint64(32)) | numpy.uint64(1)
+        bits = numpy.frombuffer(self.__bits, dtype=numpy.uint8)
+        for i in range(0, self.__quantidade_funcoes):
+            posicoes = (base + numpy.uint64(i) * passo) % numpy.uint64(self.__quantidade_bits)
+            numpy.bitwise_or.at(
+                bits, (posicoes >> numpy.uint64(3)).astype(numpy.intp),
+                numpy.left_shift(1, posicoes & numpy.uint64(7)).astype(numpy.uint8)
+            )
+
+    def clear(self) -> None:
+        """Remove todas as chaves do Filtro, mantendo os contadores."""
+        self.__bits[:] = bytes(len(self.__bits))
+        self.__quantidade_insercoes = 0
+
+    def add(self, dado: Tupla | str) -> None:
+        """Insere uma chave no Filtro.
+
+        Args:
+            dado (Tupla | str): A Tupla (ou chave).
+        """
+        self.add_hash(self.hash_value(dado))
+
+    def might_contain_hash(self, valor_hash: int) -> bool:
+        """Verifica se uma chave pode ter sido inserida, a partir
+        do seu valor hash, contabilizando a consulta.
+
+        Args:
+            valor_hash (int): O valor hash da chave.
+
+        Returns:
+            bool: 'False' se a chave certamente não foi inserida,
+            'True' se ela talvez tenha sido.
+        """
+        base: int = valor_hash & 0xFFFFFFFF
+        passo: int = (valor_hash >> 32) | 1
+        presente: bool = True
+        for _ in range(0, self.__quantidade_funcoes):
+            posicao: int = base % self.__quantidade_bits
+            if not self.__bits[posicao >> 3] & (1 << (posicao & 7)):
+                presente = False
+                break
+            base += passo
+        with self.__lock():
+            self.__contadores["consultas"] += 1
+            if not presente:
+                self.__contadores["descartes"] += 1
+        return presente
+
+    def might_contain(self, dado: Tupla | str) -> bool:
+        """Verifica se uma chave pode ter sido inserida
+        (ver 'might_contain_hash()').
+
+        Args:
+            dado (Tupla | str): A Tupla (ou chave).
+
+        Returns:
+            bool: 'False' se a chave certamente não foi inserida,
+            'True' se ela talvez tenha sido.
+        """
+        return self.might_contain_hash(self.hash_value(dado))
+
+    def record_false_positive(self) -> None:
+        """Contabiliza um falso positivo, ou seja, uma consulta que
+        passou pelo Filtro mas a chave não foi encontrada.
+        """
+        with self.__lock():
+            self.__contadores["falsos_positivos"] += 1
+
+    def get_capacity(self) -> int:
+        """Retorna a quantidade de elementos para a qual o Filtro
+        foi dimensionado.
+
+        Returns:
+            int: A capacidade do Filtro.
+        """
+        return self.__capacidade
+
+    def get_insert_count(self) -> int:
+        """Retorna a quantidade de elementos inseridos desde o
+        último dimensionamento (ou 'clear()').
+
+        Returns:
+            int: A qntd. de inserções.
+        """
+        return self.__quantidade_insercoes
+
+    def is_full(self) -> bool:
+        """Verifica se o Filtro passou da sua capacidade, ou seja,
+        se a taxa de falsos positivos já supera a desejada.
+
+        Returns:
+            bool: Se o Filtro passou da sua capacidade.
+        """
+        return self.__quantidade_insercoes > self.__capacidade
+
+    def get_bit_count(self) -> int:
+        """Retorna a quantidade de bits do Filtro.
+
+        Returns:
+            int: A qntd. de bits.
+        """
+        return self.__quantidade_bits
+
+    def get_hash_count(self) -> int:
+        """Retorna a quantidade de funções hash (posições por chave).
+
+        Returns:
+            int: A qntd. de funções hash.
+        """
+        return self.__quantidade_funcoes
+
+    def get_query_count(self) -> int:
+        """Retorna a quantidade de consultas.
+
+        Returns:
+            int: A qntd. de consultas.
+        """
+        return self.__contadores["consultas"]
+
+    def get_skip_count(self) -> int:
+        """Retorna a quantidade de consultas descartadas, ou seja,
+        em que a chave certamente não foi inserida.
+
+        Returns:
+            int: A qntd. de descartes.
+        """
+        return self.__contadores["descartes"]
+
+    def get_hit_count(self) -> int:
+        """Retorna a quantidade de consultas que passaram pelo Filtro.
+
+        Returns:
+            int: A qntd. de consultas aprovadas.
+        """
+        with self.__lock():
+            return self.__contadores["consultas"] - self.__contadores["descartes"]
+
+    def get_false_positive_count(self) -> int:
+        """Retorna a quantidade de falsos positivos registrados.
+
+        Returns:
+            int: A qntd. de falsos positivos.
+        """
+        return self.__contadores["falsos_positivos"]
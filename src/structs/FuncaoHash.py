@@ -1,31 +1,491 @@
 """Representa uma Função Hash.
 Mapeia um chave de busca em um endereço Bucket.
+
+Disponibiliza uma família de estratégias de hash selecionáveis
+pelo nome (ver 'FuncaoHash.ESTRATEGIAS').
 """
 
+from array import array
+from itertools import accumulate
+from typing import Callable, Dict, Iterable, List, Tuple
+
 # pylint: disable=import-error
 
 from structs.Tupla import Tupla
+from structs.Instrumentacao import Instrumentacao
+
+# NumPy é opcional, usado somente no cálculo em lote (vetorizado).
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Máscara para manter os valores em 64 bits.
+MASCARA_64: int = (1 << 64) - 1
+# Constantes da FNV-1a (64 bits).
+FNV_OFFSET_BASIS: int = 0xcbf29ce484222325
+FNV_PRIMO: int = 0x100000001b3
+# Base da hash polinomial e constante multiplicativa (razão áurea).
+POLINOMIAL_BASE: int = 131
+MULTIPLICADOR_AUREO: int = 0x9e3779b97f4a7c15
+# Chave (128 bits) padrão da SipHash.
+CHAVE_SIPHASH: bytes = bytes(range(16))
 
 class FuncaoHash:
     """Representa uma Função Hash."""
+    # Nome da estratégia usada quando nenhuma for informada.
+    ESTRATEGIA_PADRAO: str = "soma"
 
     @staticmethod
-    def hash_function(dado: Tupla | str, quantidade_buckets: int) -> int:
-        """Retorna um índice de algum Bucket.
-        A Função Hash utiliza da ideia de índices círculares,
-        somando todos os valores Unicode de uma 'chave' e retornando
-        o resto da divisão da soma com a a qntd. de buckets.
+    def soma(chave: str) -> int:
+        """Estratégia legada, soma todos os valores Unicode da chave.
+
+        Args:
+            chave (str): A chave de busca.
+
+        Returns:
+            int: A soma dos valores Unicode da chave.
+        """
+        return sum(ord(c) for c in chave)
+
+    @staticmethod
+    def fnv1a(chave: str) -> int:
+        """Estratégia FNV-1a (64 bits) sobre os bytes UTF-8 da chave.
+
+        Args:
+            chave (str): A chave de busca.
+
+        Returns:
+            int: O valor hash (64 bits) da chave.
+        """
+        valor: int = FNV_OFFSET_BASIS
+        for byte in chave.encode("UTF-8"):
+            valor = ((valor ^ byte) * FNV_PRIMO) & MASCARA_64
+        return valor
+
+    @staticmethod
+    def polinomial(chave: str) -> int:
+        """Estratégia polinomial (rolling hash), finalizada por uma
+        multiplicação pela razão áurea para espalhar os bits.
+
+        Args:
+            chave (str): A chave de busca.
+
+        Returns:
+            int: O valor hash (64 bits) da chave.
+        """
+        valor: int = 0
+        for byte in chave.encode("UTF-8"):
+            valor = (valor * POLINOMIAL_BASE + byte) & MASCARA_64
+        valor = (valor * MULTIPLICADOR_AUREO) & MASCARA_64
+        return valor ^ (valor >> 32)
+
+    @staticmethod
+    def __rotate_left(valor: int, deslocamento: int) -> int:
+        """Rotaciona um valor de 64 bits para a esquerda.
+
+        Args:
+            valor (int): O valor a ser rotacionado.
+            deslocamento (int): A qntd. de bits.
+
+        Returns:
+            int: O valor rotacionado.
+        """
+        return ((valor << deslocamento) | (valor >> (64 - deslocamento))) & MASCARA_64
+
+    @staticmethod
+    def siphash(chave: str, chave_secreta: bytes = CHAVE_SIPHASH) -> int:
+        """Estratégia SipHash-2-4, uma hash com chave secreta.
+
+        Args:
+            chave (str): A chave de busca.
+            chave_secreta (bytes, optional): A chave secreta de 16 bytes.
+            Valor padrão 'CHAVE_SIPHASH'.
+
+        Returns:
+            int: O valor hash (64 bits) da chave.
+        """
+        rotl = FuncaoHash.__rotate_left
+        k0: int = int.from_bytes(chave_secreta[0:8], "little")
+        k1: int = int.from_bytes(chave_secreta[8:16], "little")
+        v = [
+            k0 ^ 0x736f6d6570736575,
+            k1 ^ 0x646f72616e646f6d,
+            k0 ^ 0x6c7967656e657261,
+            k1 ^ 0x7465646279746573
+        ]
+
+        def sipround() -> None:
+            v[0] = (v[0] + v[1]) & MASCARA_64
+            v[1] = rotl(v[1], 13) ^ v[0]
+            v[0] = rotl(v[0], 32)
+            v[2] = (v[2] + v[3]) & MASCARA_64
+            v[3] = rotl(v[3], 16) ^ v[2]
+            v[0] = (v[0] + v[3]) & MASCARA_64
+            v[3] = rotl(v[3], 21) ^ v[0]
+            v[2] = (v[2] + v[1]) & MASCARA_64
+            v[1] = rotl(v[1], 17) ^ v[2]
+            v[2] = rotl(v[2], 32)
+
+        mensagem: bytes = chave.encode("UTF-8")
+        tamanho: int = len(mensagem)
+        # Processa os blocos completos de 8 bytes.
+        fim: int = tamanho - (tamanho % 8)
+        for i in range(0, fim, 8):
+            bloco: int = int.from_bytes(mensagem[i:i + 8], "little")
+            v[3] ^= bloco
+            sipround()
+            sipround()
+            v[0] ^= bloco
+        # Último bloco: bytes restantes + tamanho da mensagem.
+        bloco = int.from_bytes(mensagem[fim:], "little") | ((tamanho & 0xff) << 56)
+        v[3] ^= bloco
+        sipround()
+        sipround()
+        v[0] ^= bloco
+        # Finalização.
+        v[2] ^= 0xff
+        for _ in range(4):
+            sipround()
+        return v[0] ^ v[1] ^ v[2] ^ v[3]
+
+    # Estratégias de hash disponíveis, mapeadas pelo nome.
+    ESTRATEGIAS: Dict[str, Callable[[str], int]] = {
+        "soma": soma,
+        "fnv1a": fnv1a,
+        "polinomial": polinomial,
+        "siphash": siphash
+    }
+
+    @staticmethod
+    def get_strategies() -> List[str]:
+        """Retorna o nome de todas as estratégias disponíveis.
+
+        Returns:
+            List[str]: Os nomes das estratégias.
+        """
+        return list(FuncaoHash.ESTRATEGIAS.keys())
+
+    @staticmethod
+    def get_strategy(estrategia: str) -> Callable[[str], int]:
+        """Retorna a função de uma estratégia de hash.
+
+        Args:
+            estrategia (str): O nome da estratégia.
+
+        Raises:
+            ValueError: Caso a estratégia não exista.
+
+        Returns:
+            Callable[[str], int]: A função da estratégia.
+        """
+        if estrategia not in FuncaoHash.ESTRATEGIAS:
+            raise ValueError(f"Estratégia de hash '{estrategia}' inexistente.")
+        return FuncaoHash.ESTRATEGIAS[estrategia]
+
+    @staticmethod
+    def hash_value(dado: Tupla | str, estrategia: str = ESTRATEGIA_PADRAO) -> int:
+        """Retorna o valor hash (sem redução) de uma chave.
 
         Args:
             dado (Tupla | str): Uma Tupla qualquer de uma Tabela.
-            quantidade_buckets (int): A qntd. de Buckets.
+            estrategia (str, optional): O nome da estratégia de hash.
+            Valor padrão 'ESTRATEGIA_PADRAO'.
 
         Returns:
-            int: O índice do Bucket no qual a Tupla pertence.
+            int: O valor hash da chave.
         """
         chave: str
         if isinstance(dado, Tupla):
             chave = dado.get_data()
         else:
             chave = dado
-        return sum(ord(c) for c in chave) % quantidade_buckets
+        return FuncaoHash.get_strategy(estrategia)(chave)
+
+    @staticmethod
+    def hash_function(dado: Tupla | str, quantidade_buckets: int,
+                      estrategia: str = ESTRATEGIA_PADRAO) -> int:
+        """Retorna um índice de algum Bucket.
+        A Função Hash utiliza da ideia de índices círculares,
+        calculando o valor hash de uma 'chave' (pela estratégia
+        escolhida) e retornando o resto da divisão com a qntd. de buckets.
+
+        A estratégia padrão ('soma') soma todos os valores Unicode
+        da chave.
+
+        Args:
+            dado (Tupla | str): Uma Tupla qualquer de uma Tabela.
+            quantidade_buckets (int): A qntd. de Buckets.
+            estrategia (str, optional): O nome da estratégia de hash.
+            Valor padrão 'ESTRATEGIA_PADRAO'.
+
+        Returns:
+            int: O índice do Bucket no qual a Tupla pertence.
+        """
+        return FuncaoHash.hash_value(dado, estrategia) % quantidade_buckets
+
+    @staticmethod
+    def pack_keys(dados: Iterable[Tupla | str]) -> Tuple[bytes, array]:
+        """Codifica todas as chaves em um único buffer contíguo
+        de bytes (UTF-8), juntamente com os deslocamentos de cada chave.
+
+        A chave 'i' ocupa 'buffer[deslocamentos[i]:deslocamentos[i + 1]]'.
+
+        Args:
+            dados (Iterable[Tupla | str]): As Tuplas (ou chaves).
+
+        Returns:
+            Tuple[bytes, array]: O buffer e os deslocamentos.
+        """
+        chaves: List[str] = [
+            dado.get_data() if isinstance(dado, Tupla) else dado
+            for dado in dados
+        ]
+        texto: str = "".join(chaves)
+        buffer: bytes = texto.encode("UTF-8")
+        deslocamentos: array = array("Q", [0])
+        if len(buffer) == len(texto):
+            # Texto ASCII, o tamanho em bytes é o próprio tamanho da chave.
+            deslocamentos.extend(accumulate(map(len, chaves)))
+        else:
+            deslocamentos.extend(accumulate(len(chave.encode("UTF-8")) for chave in chaves))
+        return buffer, deslocamentos
+
+    @staticmethod
+    @Instrumentacao.traced("hash_lote")
+    def hash_values_packed(buffer: bytes, deslocamentos: array,
+                           estrategia: str = ESTRATEGIA_PADRAO,
+                           vetorizado: bool = True) -> List[int]:
+        """Calcula o valor hash de todas as chaves de um buffer
+        (ver 'pack_keys()').
+
+        Caso o NumPy esteja disponível e a estratégia possua uma
+        versão vetorizada, todas as chaves são calculadas de uma só
+        vez, caso contrário cada chave é calculada individualmente.
+        Ambos os caminhos produzem os mesmos valores.
+
+        Args:
+            buffer (bytes): As chaves codificadas em UTF-8.
+            deslocamentos (array): Os deslocamentos de cada chave.
+            estrategia (str, optional): O nome da estratégia de hash.
+            Valor padrão 'ESTRATEGIA_PADRAO'.
+            vetorizado (bool, optional): Se o caminho vetorizado
+            pode ser usado.
+            Valor padrão 'True'.
+
+        Returns:
+            List[int]: Os valores hash de cada chave.
+        """
+        funcao: Callable[[str], int] = FuncaoHash.get_strategy(estrategia)
+        if vetorizado and numpy is not None and len(deslocamentos) > 1:
+            valores = FuncaoHash.__hash_values_numpy(buffer, deslocamentos, estrategia)
+            if valores is not None:
+                return valores.tolist()
+        # Caminho puro em Python.
+        return [
+            funcao(buffer[deslocamentos[i]:deslocamentos[i + 1]].decode("UTF-8"))
+            for i in range(0, len(deslocamentos) - 1)
+        ]
+
+    @staticmethod
+    def __hash_values_numpy(buffer: bytes, deslocamentos: array, estrategia: str):
+        """Calcula, com o NumPy, o valor hash de todas as chaves.
+
+        As chaves são ordenadas pelo tamanho (decrescente), assim
+        a cada posição 'j' somente um prefixo das chaves está ativo
+        e a posição é processada para todas elas de uma só vez.
+
+        Args:
+            buffer (bytes): As chaves codificadas em UTF-8.
+            deslocamentos (array): Os deslocamentos de cada chave.
+            estrategia (str): O nome da estratégia de hash.
+
+        Returns:
+            numpy.ndarray | None: Os valores hash (uint64) ou 'None'
+            caso a estratégia não possua versão vetorizada.
+        """
+        if estrategia not in ("soma", "fnv1a", "polinomial", "siphash"):
+            return None
+        dados_brutos = numpy.frombuffer(buffer, dtype=numpy.uint8)
+        inicios = numpy.frombuffer(
+            deslocamentos, dtype=numpy.dtype(f"u{deslocamentos.itemsize}")
+        ).astype(numpy.int64)
+        tamanhos = numpy.diff(inicios)
+        inicios = inicios[:-1]
+
+        if estrategia == "soma":
+            # Para texto ASCII o valor Unicode é o próprio byte.
+            if dados_brutos.size > 0 and dados_brutos.max() >= 0x80:
+                return None
+            acumulado = numpy.concatenate((
+                numpy.zeros(1, dtype=numpy.uint64),
+                numpy.cumsum(dados_brutos, dtype=numpy.uint64)
+            ))
+            return acumulado[inicios + tamanhos] - acumulado[inicios]
+
+        # Ordena as chaves pelo tamanho, da maior para a menor.
+        ordem = numpy.argsort(-tamanhos, kind="stable")
+        inicios_ordenados = inicios[ordem]
+        tamanhos_ordenados = tamanhos[ordem]
+
+        if estrategia == "siphash":
+            valores = FuncaoHash.__siphash_numpy(dados_brutos, inicios_ordenados, tamanhos_ordenados)
+            resultado = numpy.empty_like(valores)
+            resultado[ordem] = valores
+            return resultado
+        valores = numpy.empty(len(ordem), dtype=numpy.uint64)
+        if estrategia == "fnv1a":
+            valores.fill(FNV_OFFSET_BASIS)
+            primo = numpy.uint64(FNV_PRIMO)
+        else:
+            valores.fill(0)
+            base = numpy.uint64(POLINOMIAL_BASE)
+
+        maior_tamanho: int = int(tamanhos_ordenados[0]) if len(ordem) > 0 else 0
+        # Qntd. de chaves ativas (tamanho > j) para cada posição 'j'.
+        ativos_por_posicao = numpy.searchsorted(
+            -tamanhos_ordenados, -numpy.arange(0, maior_tamanho), side="left"
+        )
+        for j in range(0, maior_tamanho):
+            ativos: int = int(ativos_por_posicao[j])
+            byte = dados_brutos[inicios_ordenados[:ativos] + j].astype(numpy.uint64)
+            if estrategia == "fnv1a":
+                valores[:ativos] = (valores[:ativos] ^ byte) * primo
+            else:
+                valores[:ativos] = valores[:ativos] * base + byte
+
+        if estrategia == "polinomial":
+            valores *= numpy.uint64(MULTIPLICADOR_AUREO)
+            valores ^= valores >> numpy.uint64(32)
+
+        # Desfaz a ordenação.
+        resultado = numpy.empty_like(valores)
+        resultado[ordem] = valores
+        return resultado
+
+    @staticmethod
+    def __siphash_numpy(dados_brutos, inicios, tamanhos):
+        """Calcula, com o NumPy, a SipHash-2-4 (chave padrão) de
+        várias chaves, ordenadas pelo tamanho (decrescente).
+
+        Args:
+            dados_brutos (numpy.ndarray): O buffer (uint8) das chaves.
+            inicios (numpy.ndarray): O início de cada chave no buffer.
+            tamanhos (numpy.ndarray): O tamanho de cada chave.
+
+        Returns:
+            numpy.ndarray: Os valores hash (uint64) de cada chave.
+        """
+        u64 = numpy.uint64
+        k0 = u64(int.from_bytes(CHAVE_SIPHASH[0:8], "little"))
+        k1 = u64(int.from_bytes(CHAVE_SIPHASH[8:16], "little"))
+        quantidade: int = len(inicios)
+        v = [
+            numpy.full(quantidade, k0 ^ u64(0x736f6d6570736575), dtype=numpy.uint64),
+            numpy.full(quantidade, k1 ^ u64(0x646f72616e646f6d), dtype=numpy.uint64),
+            numpy.full(quantidade, k0 ^ u64(0x6c7967656e657261), dtype=numpy.uint64),
+            numpy.full(quantidade, k1 ^ u64(0x7465646279746573), dtype=numpy.uint64)
+        ]
+
+        def rotl(valor, deslocamento: int):
+            return (valor << u64(deslocamento)) | (valor >> u64(64 - deslocamento))
+
+        def sipround(fim: int) -> None:
+            v0, v1, v2, v3 = (x[:fim] for x in v)
+            v0 += v1
+            v1[:] = rotl(v1, 13) ^ v0
+            v0[:] = rotl(v0, 32)
+            v2 += v3
+            v3[:] = rotl(v3, 16) ^ v2
+            v0 += v3
+            v3[:] = rotl(v3, 21) ^ v0
+            v2 += v1
+            v1[:] = rotl(v1, 17) ^ v2
+            v2[:] = rotl(v2, 32)
+
+        # Bytes extras evitam leituras fora do buffer no último bloco.
+        dados_brutos = numpy.concatenate((dados_brutos, numpy.zeros(8, dtype=numpy.uint8)))
+        pesos = u64(1) << (u64(8) * numpy.arange(0, 8, dtype=numpy.uint64))
+        blocos_completos = tamanhos // 8
+        # Processa os blocos completos de 8 bytes.
+        for b in range(0, int(blocos_completos[0]) if quantidade > 0 else 0):
+            ativos: int = int(numpy.count_nonzero(blocos_completos > b))
+            posicoes = inicios[:ativos, None] + (8 * b) + numpy.arange(0, 8)
+            bloco = (dados_brutos[posicoes].astype(numpy.uint64) * pesos).sum(axis=1, dtype=numpy.uint64)
+            v[3][:ativos] ^= bloco
+            sipround(ativos)
+            sipround(ativos)
+            v[0][:ativos] ^= bloco
+        # Último bloco: bytes restantes + tamanho da mensagem.
+        restantes = (tamanhos % 8)[:, None]
+        posicoes = (inicios + blocos_completos * 8)[:, None] + numpy.arange(0, 8)
+        bytes_restantes = numpy.where(
+            numpy.arange(0, 8) < restantes, dados_brutos[posicoes], 0
+        ).astype(numpy.uint64)
+        bloco = (bytes_restantes * pesos).sum(axis=1, dtype=numpy.uint64)
+        bloco |= (tamanhos.astype(numpy.uint64) & u64(0xff)) << u64(56)
+        v[3] ^= bloco
+        sipround(quantidade)
+        sipround(quantidade)
+        v[0] ^= bloco
+        # Finalização.
+        v[2] ^= u64(0xff)
+        for _ in range(4):
+            sipround(quantidade)
+        return v[0] ^ v[1] ^ v[2] ^ v[3]
+
+    @staticmethod
+    def hash_batch(dados: Iterable[Tupla | str], quantidade_buckets: int,
+                   estrategia: str = ESTRATEGIA_PADRAO,
+                   vetorizado: bool = True) -> List[int]:
+        """Retorna o índice do Bucket de várias Tuplas de uma só vez.
+
+        Equivalente a chamar 'hash_function()' para cada Tupla.
+
+        Args:
+            dados (Iterable[Tupla | str]): As Tuplas (ou chaves).
+            quantidade_buckets (int): A qntd. de Buckets.
+            estrategia (str, optional): O nome da estratégia de hash.
+            Valor padrão 'ESTRATEGIA_PADRAO'.
+            vetorizado (bool, optional): Se o caminho vetorizado
+            pode ser usado.
+            Valor padrão 'True'.
+
+        Returns:
+            List[int]: Os índices dos Buckets, na mesma ordem das Tuplas.
+        """
+        buffer, deslocamentos = FuncaoHash.pack_keys(dados)
+        return FuncaoHash.hash_batch_packed(
+            buffer, deslocamentos, quantidade_buckets, estrategia, vetorizado
+        )
+
+    @staticmethod
+    def hash_batch_packed(buffer: bytes, deslocamentos: array, quantidade_buckets: int,
+                          estrategia: str = ESTRATEGIA_PADRAO,
+                          vetorizado: bool = True) -> List[int]:
+        """Retorna o índice do Bucket de todas as chaves de um buffer
+        (ver 'pack_keys()').
+
+        Args:
+            buffer (bytes): As chaves codificadas em UTF-8.
+            deslocamentos (array): Os deslocamentos de cada chave.
+            quantidade_buckets (int): A qntd. de Buckets.
+            estrategia (str, optional): O nome da estratégia de hash.
+            Valor padrão 'ESTRATEGIA_PADRAO'.
+            vetorizado (bool, optional): Se o caminho vetorizado
+            pode ser usado.
+            Valor padrão 'True'.
+
+        Returns:
+            List[int]: Os índices dos Buckets, na mesma ordem das chaves.
+        """
+        if vetorizado and numpy is not None and len(deslocamentos) > 1:
+            FuncaoHash.get_strategy(estrategia)
+            valores = FuncaoHash.__hash_values_numpy(buffer, deslocamentos, estrategia)
+            if valores is not None:
+                # A redução também é feita de forma vetorizada.
+                return (valores % numpy.uint64(quantidade_buckets)).tolist()
+        return [
+            valor % quantidade_buckets
+            for valor in FuncaoHash.hash_values_packed(buffer, deslocamentos, estrategia, False)
+        ]
@@ -0,0 +1,365 @@
+"""Representa a estrutura Hash Extensível.
+Alternativa ao BucketManager, em que um diretório
+(com profundidade global) aponta para Buckets (com
+profundidade local) que são divididos sob demanda.
+"""
+
+from math import log10
+from typing import Dict, List, Union
+
+# pylint: disable=import-error
+
+from structs.Tupla import Tupla
+from structs.Tabela import Tabela
+from structs.Bucket import Bucket
+from structs.FuncaoHash import FuncaoHash
+
+class BucketExtensivel(Bucket):
+    """Representa um Bucket do Hash Extensível."""
+    # A profundidade local do Bucket.
+    __profundidade_local: int
+    # Os bits do diretório (até a profundidade máxima) comuns a todas as
+    # Tuplas do Bucket cheio, ou 'None' se não foram verificados.
+    __bits_comuns: Union[int, None]
+
+    def __init__(self, id_bucket: int, capacidade: int, profundidade_local: int) -> None:
+        """Inicializa dados essenciais.
+
+        Args:
+            id_bucket (int): O "Id" do Bucket.
+            capacidade (int): A capacidade do Bucket.
+            profundidade_local (int): A profundidade local do Bucket.
+        """
+        super().__init__(id_bucket, capacidade)
+        self.__profundidade_local = profundidade_local
+        self.__bits_comuns = None
+
+    def get_local_depth(self) -> int:
+        """Retorna a profundidade local do Bucket.
+
+        Returns:
+            int: A profundidade local do Bucket.
+        """
+        return self.__profundidade_local
+
+    def get_shared_bits(self) -> Union[int, None]:
+        """Retorna os bits do diretório comuns a todas as Tuplas.
+
+        Returns:
+            Union[int, None]: Os bits ou 'None' se não foram verificados.
+        """
+        return self.__bits_comuns
+
+    def set_shared_bits(self, bits_comuns: int) -> None:
+        """Define os bits do diretório comuns a todas as Tuplas.
+
+        Args:
+            bits_comuns (int): Os bits comuns.
+        """
+        self.__bits_comuns = bits_comuns
+
+
+class HashExtensivel:
+    """Responsável por manipular os Buckets de um Hash Extensível."""
+    # A capacidade dos Buckets.
+    __capacidade_buckets: int
+    # A estratégia de hash usada para endereçar os Buckets.
+    __estrategia_hash: str
+    # O diretório, indexado pelos 'profundidade global' bits menos significativos.
+    __diretorio: List[BucketExtensivel]
+    # A profundidade global do diretório e a máxima permitida.
+    __profundidade_global: int
+    __profundidade_maxima: int
+    # Estatísticas de divisões de Buckets e duplicações do diretório.
+    __quantidade_splits: int
+    __quantidade_duplicacoes: int
+
+    def __init__(self, quantidade_tuplas: int,
+                 estrategia_hash: str = "fnv1a",
+                 profundidade_maxima: int = 16) -> None:
+        """Inicializa o Hash Extensível com um único Bucket, cuja
+        capacidade é baseada na qntd. de Tuplas (como no BucketManager).
+
+        Args:
+            quantidade_tuplas (int): A qntd. de Tuplas em uma Tabela.
+            estrategia_hash (str, optional): O nome da estratégia de hash.
+            O diretório usa os bits menos significativos, que na estratégia
+            'soma' se repetem em anagramas, por isso não é a padrão aqui.
+            Valor padrão 'fnv1a'.
+            profundidade_maxima (int, optional): A profundidade global
+            máxima, a partir dela os Buckets cheios usam Overflows.
+            Valor padrão '16'.
+        """
+        FuncaoHash.get_strategy(estrategia_hash)
+        self.__estrategia_hash = estrategia_hash
+        self.__profundidade_maxima = profundidade_maxima
+        # A capacidade é a potência de 10 usada pelo BucketManager.
+        quantidade_digitos: int = int(log10(max(quantidade_tuplas, 1)) + 1) // 2
+        self.__capacidade_buckets = max(pow(10, quantidade_digitos), 1)
+        self.__profundidade_global = 0
+        self.__diretorio = [BucketExtensivel(0, self.__capacidade_buckets, 0)]
+        self.__quantidade_splits = 0
+        self.__quantidade_duplicacoes = 0
+
+    def insert_data_from_table(self, tabela: Tabela) -> None:
+        """Insere TODAS as Tuplas de uma Tabela qualquer.
+
+        Args:
+            tabela (Tabela): A Tabela a ser inserido as Tuplas
+            nos Buckets.
+        """
+        if tabela is not None:
+            tuplas: List[Tupla] = tabela.get_tuples()
+            # Calcula os valores hash de todas as Tuplas de uma só vez.
+            valores: List[int] = FuncaoHash.hash_values_packed(
+                *tabela.get_packed_keys(), self.__estrategia_hash
+            )
+            for tupla, valor in zip(tuplas, valores):
+                self.__insert_data_with_hash(tupla, valor)
+
+    def insert_data(self, dado: Tupla) -> None:
+        """Insere uma Tupla no Bucket apontado pelo diretório,
+        dividindo-o caso esteja cheio.
+
+        Args:
+            dado (Tupla): A Tupla a ser inserida.
+        """
+        self.__insert_data_with_hash(dado, FuncaoHash.hash_value(dado, self.__estrategia_hash))
+
+    def __insert_data_with_hash(self, dado: Tupla, valor_hash: int) -> None:
+        """Insere uma Tupla cujo valor hash já é conhecido.
+
+        Enquanto o Bucket alvo estiver cheio ele é dividido (dobrando
+        o diretório se necessário), ao atingir a profundidade máxima,
+        ou se nenhuma divisão separaria as Tuplas (ex.: chaves repetidas),
+        a Tupla vai para um Bucket (Overflow).
+
+        Args:
+            dado (Tupla): A Tupla a ser inserida.
+            valor_hash (int): O valor hash da Tupla.
+        """
+        while True:
+            bucket_alvo: BucketExtensivel = self.__diretorio[self.__get_directory_index(valor_hash)]
+            if not bucket_alvo.is_bucket_full() or self.__is_saturated(bucket_alvo, valor_hash):
+                break
+            if bucket_alvo.get_local_depth() == self.__profundidade_global:
+                if self.__profundidade_global >= self.__profundidade_maxima:
+                    break
+                self.__double_directory()
+            self.__split_bucket(bucket_alvo)
+        bucket_alvo.insert_data(dado)
+
+    def __is_saturated(self, bucket_alvo: BucketExtensivel, valor_hash: int) -> bool:
+        """Verifica se todas as Tuplas de um Bucket cheio (e a nova)
+        possuem os mesmos bits do diretório até a profundidade máxima
+        (ex.: chaves repetidas), então nenhuma divisão as separaria.
+
+        Os bits comuns são guardados no Bucket, então somente a primeira
+        verificação de um Bucket calcula os valores hash das suas Tuplas.
+
+        Args:
+            bucket_alvo (BucketExtensivel): O Bucket cheio.
+            valor_hash (int): O valor hash da nova Tupla.
+
+        Returns:
+            bool: Se a nova Tupla deve ir direto para um Overflow.
+        """
+        mascara: int = (1 << self.__profundidade_maxima) - 1
+        bits_comuns: Union[int, None] = bucket_alvo.get_shared_bits()
+        if bits_comuns is None:
+            valores: set = {
+                FuncaoHash.hash_value(tupla, self.__estrategia_hash) & mascara
+                for tupla in bucket_alvo.get_data() if tupla is not None
+            }
+            if len(valores) != 1:
+                return False
+            bits_comuns = valores.pop()
+            bucket_alvo.set_shared_bits(bits_comuns)
+        return bits_comuns == valor_hash & mascara
+
+    def __get_directory_index(self, valor_hash: int) -> int:
+        """Retorna a entrada do diretório de um valor hash.
+
+        Args:
+            valor_hash (int): O valor hash de uma chave.
+
+        Returns:
+            int: O índice no diretório.
+        """
+        return valor_hash & ((1 << self.__profundidade_global) - 1)
+
+    def __double_directory(self) -> None:
+        """Dobra o diretório, a nova metade aponta para os mesmos Buckets."""
+        self.__diretorio = self.__diretorio + self.__diretorio
+        self.__profundidade_global += 1
+        self.__quantidade_duplicacoes += 1
+
+    def __split_bucket(self, bucket_alvo: BucketExtensivel) -> None:
+        """Divide um Bucket em dois, com profundidade local + 1,
+        redistribuindo as Tuplas pelo próximo bit do valor hash.
+
+        Args:
+            bucket_alvo (BucketExtensivel): O Bucket a ser dividido.
+        """
+        profundidade: int = bucket_alvo.get_local_depth()
+        buckets_novos: List[BucketExtensivel] = [
+            BucketExtensivel(0, self.__capacidade_buckets, profundidade + 1),
+            BucketExtensivel(0, self.__capacidade_buckets, profundidade + 1)
+        ]
+        # Atualiza todas as entradas do diretório que apontavam para o Bucket.
+        for indice, bucket in enumerate(self.__diretorio):
+            if bucket is bucket_alvo:
+                self.__diretorio[indice] = buckets_novos[(indice >> profundidade) & 1]
+        # As Tuplas com bits comuns vão todas para o mesmo novo Bucket.
+        bits_comuns: Union[int, None] = bucket_alvo.get_shared_bits()
+        if bits_comuns is not None:
+            buckets_novos[(bits_comuns >> profundidade) & 1].set_shared_bits(bits_comuns)
+        # Redistribui as Tuplas (incluindo as dos Overflows).
+        while bucket_alvo is not None:
+            for tupla in bucket_alvo.get_data():
+                if tupla is None:
+                    continue
+                valor: int = FuncaoHash.hash_value(tupla, self.__estrategia_hash)
+                buckets_novos[(valor >> profundidade) & 1].insert_data(tupla)
+            bucket_alvo = bucket_alvo.get_next_bucket()
+        self.__quantidade_splits += 1
+
+    def search_data(self, dado: Tupla | str) -> Union[Union[Tupla, None], int]:
+        """Procura por uma Tupla, lendo uma entrada do diretório
+        e o Bucket apontado por ela.
+
+        Args:
+            dado (Tupla | str): A Tupla a ser procurada nos Buckets.
+
+        Returns:
+            Union[Union[Tupla, None], int]: Retorna a Tupla se ela
+            for encontrada ou 'None' caso contrário e, também o índice
+            do diretório em que ela foi encontrada ou '-1' caso contrário.
+        """
+        indice: int = self.__get_directory_index(
+            FuncaoHash.hash_value(dado, self.__estrategia_hash)
+        )
+        bucket_alvo: Bucket = self.__diretorio[indice]
+        while bucket_alvo is not None:
+            dado_alvo: Tupla | None = bucket_alvo.search_data(dado)
+            if dado_alvo is not None:
+                return dado_alvo, indice
+            bucket_alvo = bucket_alvo.get_next_bucket()
+        return None, -1
+
+    def get_bucket_by_id(self, id_bucket: int) -> BucketExtensivel:
+        """Retorna o Bucket de uma entrada do diretório.
+
+        Args:
+            id_bucket (int): O índice no diretório.
+
+        Returns:
+            BucketExtensivel: O Bucket apontado pela entrada.
+        """
+        return self.__diretorio[id_bucket]
+
+    def get_bucket_count(self) -> int:
+        """Retorna a quantidade de Buckets distintos.
+
+        Returns:
+            int: A qntd. de Buckets.
+        """
+        return len({id(bucket) for bucket in self.__diretorio})
+
+    def get_bucket_capacity(self) -> int:
+        """Retorna a capacidade dos Buckets.
+
+        Returns:
+            int: A capacidade dos Buckets.
+        """
+        return self.__capacidade_buckets
+
+    def get_hash_strategy(self) -> str:
+        """Retorna o nome da estratégia de hash usada.
+
+        Returns:
+            str: O nome da estratégia de hash.
+        """
+        return self.__estrategia_hash
+
+    def get_directory_size(self) -> int:
+        """Retorna a quantidade de entradas do diretório.
+
+        Returns:
+            int: A qntd. de entradas do diretório.
+        """
+        return len(self.__diretorio)
+
+    def get_global_depth(self) -> int:
+        """Retorna a profundidade global do diretório.
+
+        Returns:
+            int: A profundidade global.
+        """
+        return self.__profundidade_global
+
+    def get_local_depth(self, id_bucket: int) -> int:
+        """Retorna a profundidade local do Bucket de uma entrada.
+
+        Args:
+            id_bucket (int): O índice no diretório.
+
+        Returns:
+            int: A profundidade local do Bucket.
+        """
+        return self.get_bucket_by_id(id_bucket).get_local_depth()
+
+    def get_split_count(self) -> int:
+        """Retorna a quantidade de divisões de Buckets.
+
+        Returns:
+            int: A qntd. de divisões.
+        """
+        return self.__quantidade_splits
+
+    def get_directory_doubling_count(self) -> int:
+        """Retorna a quantidade de vezes que o diretório foi dobrado.
+
+        Returns:
+            int: A qntd. de duplicações do diretório.
+        """
+        return self.__quantidade_duplicacoes
+
+    def get_collision_count(self, id_bucket: int) -> int:
+        """Retorna a taxa de colisão do Bucket de uma entrada, ou seja,
+        quantas Tuplas estão em Overflows (somente após a profundidade
+        máxima ser atingida).
+
+        Args:
+            id_bucket (int): O índice no diretório.
+
+        Returns:
+            int: A taxa de colisão do Bucket.
+        """
+        bucket_alvo: Bucket = self.get_bucket_by_id(id_bucket)
+        return bucket_alvo.get_chain_size() - bucket_alvo.get_data_size()
+
+    def get_overflow_count(self, id_bucket: int) -> int:
+        """Retorna a quantidade de overflow do Bucket de uma entrada.
+
+        Args:
+            id_bucket (int): O índice no diretório.
+
+        Returns:
+            int: A qntd. de overflow do Bucket.
+        """
+        return self.get_bucket_by_id(id_bucket).get_chain_length() - 1
+
+    def get_dispersion_percentage(self) -> float:
+        """Retorna a porcentagem de dispersão nos Buckets distintos.
+
+        Returns:
+            float: A porcentagem de dispersão nos Buckets.
+        """
+        taxa_colisao: int = 0
+        vistos: Dict[int, bool] = {}
+        for indice, bucket in enumerate(self.__diretorio):
+            if id(bucket) not in vistos:
+                vistos[id(bucket)] = True
+                taxa_colisao += self.get_collision_count(indice)
+        return (taxa_colisao * 100) / (self.get_bucket_capacity() * self.get_bucket_count())
@@ -0,0 +1,369 @@
+"""Representa um Arquivo de Índice.
+Grava um índice hash já construído (BucketManager) em um
+arquivo binário versionado, com checksum, que é reaberto
+via 'mmap' e responde às buscas diretamente do arquivo,
+evitando reconstruir o índice a cada inicialização.
+
+Formato do arquivo (little-endian, seções alinhadas em 8 bytes):
+    Cabeçalho: assinatura, versão, estratégia de hash, qntd. e
+    capacidade dos Buckets, estado do Hash Linear, qntd. de
+    registros e de linhas, tamanho e data de modificação do
+    arquivo de origem e o CRC32 de todo o restante do arquivo.
+    Início de cada Bucket ('Q', qntd. de Buckets + 1).
+    Linhas dos registros, agrupadas por Bucket e na ordem das
+    cadeias, os Overflows são intervalos ('I').
+    Deslocamentos das chaves ('Q', qntd. de linhas + 1).
+    Índice da Pagina de cada linha ('I', qntd. de linhas).
+    Chaves (UTF-8).
+"""
+
+import mmap
+import os
+import zlib
+from array import array
+from struct import Struct
+from typing import Dict, Sequence, Tuple, Union
+
+# pylint: disable=import-error
+
+from structs.Tupla import Tupla
+from structs.Bucket import Bucket, BucketManager
+from structs.FuncaoHash import FuncaoHash
+from structs.TabelaColunar import TabelaColunar
+from structs.Instrumentacao import Instrumentacao
+
+class IndiceArquivo:
+    """Representa um Arquivo de Índice."""
+    # Assinatura e versão do formato.
+    ASSINATURA: bytes = b"IHIX"
+    VERSAO: int = 3
+    # Estrutura binária do cabeçalho.
+    CABECALHO: Struct = Struct("<4sH16sIIIIIIIQQI")
+
+    # O arquivo e o seu mapeamento em memória.
+    __arquivo: object
+    __mapa: mmap.mmap
+    # Informações do cabeçalho.
+    __estrategia_hash: str
+    __quantidade_buckets: int
+    __capacidade_buckets: int
+    __quantidade_inicial: int
+    __nivel: int
+    __proximo_split: int
+    __quantidade_registros: int
+    __quantidade_linhas: int
+    # Visões (sem cópia) das seções do arquivo.
+    __inicios: memoryview
+    __registros: memoryview
+    __deslocamentos: memoryview
+    __indices_pagina: memoryview
+    __chaves: memoryview
+    # A Tabela reconstruída a partir das chaves, caso já tenha sido pedida.
+    __tabela: Union[TabelaColunar, None]
+
+    def __init__(self, caminho: str, verificar: bool = True) -> None:
+        """Abre (via 'mmap') um Arquivo de Índice.
+
+        Args:
+            caminho (str): O caminho do arquivo.
+            verificar (bool, optional): Se o checksum deve ser verificado.
+            Valor padrão 'True'.
+
+        Raises:
+            ValueError: Caso o arquivo seja inválido ou esteja corrompido.
+        """
+        # pylint: disable=consider-using-with
+        self.__arquivo = open(caminho, "rb")
+        try:
+            self.__mapa = mmap.mmap(self.__arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as erro:
+            # Arquivo vazio.
+            self.__arquivo.close()
+            raise ValueError(f"'{caminho}' não é um Arquivo de Índice válido.") from erro
+        self.__tabela = None
+        try:
+            assinatura, versao, estrategia, self.__quantidade_buckets, \
+                self.__capacidade_buckets, self.__quantidade_inicial, self.__nivel, \
+                self.__proximo_split, self.__quantidade_registros, \
+                self.__quantidade_linhas, _, _, checksum = \
+                self.CABECALHO.unpack_from(self.__mapa, 0)
+        except Exception as erro:
+            self.__close_file()
+            raise ValueError(f"'{caminho}' não é um Arquivo de Índice válido.") from erro
+        if assinatura != self.ASSINATURA or versao != self.VERSAO:
+            self.__close_file()
+            raise ValueError(f"'{caminho}' não é um Arquivo de Índice válido.")
+        self.__estrategia_hash = estrategia.rstrip(b"\0").decode("ASCII")
+
+        # Limites das seções: início de cada Bucket, registros,
+        # deslocamentos, índices das Paginas e chaves.
+        limites: list = [self.__align(self.CABECALHO.size)]
+        for tamanho in (8 * (self.__quantidade_buckets + 1), 4 * self.__quantidade_registros,
+                        8 * (self.__quantidade_linhas + 1), 4 * self.__quantidade_linhas):
+            limites.append(self.__align(limites[-1] + tamanho))
+        visao: memoryview = memoryview(self.__mapa)
+        # O tamanho é sempre verificado, um arquivo truncado não pode ser mapeado.
+        if limites[-1] > len(visao) or (verificar and zlib.crc32(visao[limites[0]:]) != checksum):
+            visao.release()
+            self.__close_file()
+            raise ValueError(f"O Arquivo de Índice '{caminho}' está corrompido.")
+        # Mapeia as seções.
+        self.__inicios = visao[limites[0]:limites[0] + 8 * (self.__quantidade_buckets + 1)].cast("Q")
+        self.__registros = visao[limites[1]:limites[1] + 4 * self.__quantidade_registros].cast("I")
+        self.__deslocamentos = \
+            visao[limites[2]:limites[2] + 8 * (self.__quantidade_linhas + 1)].cast("Q")
+        self.__indices_pagina = visao[limites[3]:limites[3] + 4 * self.__quantidade_linhas].cast("I")
+        self.__chaves = visao[limites[4]:limites[4] + self.__deslocamentos[-1]]
+        visao.release()
+        if limites[4] + self.__deslocamentos[-1] > len(self.__mapa):
+            self.close()
+            raise ValueError(f"O Arquivo de Índice '{caminho}' está corrompido.")
+
+    @staticmethod
+    def __align(posicao: int) -> int:
+        """Alinha uma posição em 8 bytes.
+
+        Args:
+            posicao (int): A posição.
+
+        Returns:
+            int: A posição alinhada.
+        """
+        return (posicao + 7) & ~7
+
+    @staticmethod
+    def write(caminho: str, bucket: BucketManager, tabela: TabelaColunar,
+              caminho_origem: str = None) -> None:
+        """Grava um índice hash construído em um Arquivo de Índice.
+
+        As linhas removidas da Tabela não são gravadas, então as linhas
+        do arquivo são as posições das linhas não removidas.
+
+        Args:
+            caminho (str): O caminho do Arquivo de Índice.
+            bucket (BucketManager): O índice com as Tuplas da Tabela.
+            tabela (TabelaColunar): A Tabela indexada.
+            caminho_origem (str, optional): O arquivo de onde a Tabela foi
+            lida, o seu tamanho e data de modificação são gravados para
+            detectar mudanças (ver 'is_up_to_date()').
+            Valor padrão 'None'.
+
+        Raises:
+            ValueError: Caso a Tabela não seja colunar ou alguma Tupla
+            dos Buckets não seja uma linha da Tabela.
+        """
+        if not isinstance(tabela, TabelaColunar):
+            raise ValueError("O Arquivo de Índice precisa de uma Tabela Colunar.")
+        # Mapeia a linha de cada Tupla (na Tabela) à sua linha no arquivo.
+        linhas_tabela: Sequence[int] = tabela.get_rows()
+        posicoes: Union[Dict[int, int], None] = None
+        if not isinstance(linhas_tabela, range):
+            posicoes = {linha: posicao for posicao, linha in enumerate(linhas_tabela)}
+        inicios: array = array("Q", [0])
+        registros: array = array("I")
+        try:
+            for id_bucket in range(0, bucket.get_bucket_count()):
+                bucket_alvo: Union[Bucket, None] = bucket.get_bucket_by_id(id_bucket)
+                while bucket_alvo is not None:
+                    linhas = (tupla.get_row() for tupla in bucket_alvo.get_data() if tupla is not None)
+                    registros.extend(linhas if posicoes is None else map(posicoes.__getitem__, linhas))
+                    bucket_alvo = bucket_alvo.get_next_bucket()
+                inicios.append(len(registros))
+        except (AttributeError, KeyError) as erro:
+            raise ValueError("Os Buckets possuem Tuplas que não são linhas da Tabela.") from erro
+        chaves, deslocamentos = tabela.get_packed_keys()
+        if not isinstance(deslocamentos, array) or deslocamentos.typecode != "Q":
+            deslocamentos = array("Q", deslocamentos)
+        indices_pagina: array = array("I", map(tabela.get_page_index, linhas_tabela))
+
+        tamanho_origem: int = 0
+        modificacao_origem: int = 0
+        if caminho_origem is not None:
+            estado = os.stat(caminho_origem)
+            tamanho_origem, modificacao_origem = estado.st_size, estado.st_mtime_ns
+
+        # Monta o corpo (seções alinhadas) e calcula o checksum.
+        corpo: bytearray = bytearray()
+        for secao in (inicios.tobytes(), registros.tobytes(), deslocamentos.tobytes(),
+                      indices_pagina.tobytes(), bytes(chaves)):
+            corpo += secao
+            corpo += bytes(IndiceArquivo.__align(len(corpo)) - len(corpo))
+        quantidade_inicial, nivel, proximo_split = bucket.get_linear_state()
+        cabecalho: bytes = IndiceArquivo.CABECALHO.pack(
+            IndiceArquivo.ASSINATURA, IndiceArquivo.VERSAO,
+            bucket.get_hash_strategy().encode("ASCII"),
+            bucket.get_bucket_count(), bucket.get_bucket_capacity(),
+            quantidade_inicial, nivel, proximo_split, len(registros), len(indices_pagina),
+            tamanho_origem, modificacao_origem, zlib.crc32(corpo)
+        )
+        cabecalho += bytes(IndiceArquivo.__align(len(cabecalho)) - len(cabecalho))
+        with open(caminho, "wb") as arquivo:
+            arquivo.write(cabecalho)
+            arquivo.write(corpo)
+
+    @staticmethod
+    def is_up_to_date(caminho: str, caminho_origem: str) -> bool:
+        """Verifica se um Arquivo de Índice existe e foi construído a
+        partir da versão atual (tamanho e data de modificação) do
+        arquivo de origem.
+
+        Args:
+            caminho (str): O caminho do Arquivo de Índice.
+            caminho_origem (str): O caminho do arquivo de origem.
+
+        Returns:
+            bool: Se o índice pode ser usado sem reconstrução.
+        """
+        if not os.path.exists(caminho) or not os.path.exists(caminho_origem):
+            return False
+        with open(caminho, "rb") as arquivo:
+            dados: bytes = arquivo.read(IndiceArquivo.CABECALHO.size)
+        if len(dados) < IndiceArquivo.CABECALHO.size:
+            return False
+        campos = IndiceArquivo.CABECALHO.unpack(dados)
+        estado = os.stat(caminho_origem)
+        return campos[0] == IndiceArquivo.ASSINATURA and campos[1] == IndiceArquivo.VERSAO \
+            and campos[10] == estado.st_size and campos[11] == estado.st_mtime_ns
+
+    def __get_bucket_id(self, chave: str) -> int:
+        """Retorna o índice do Bucket de uma chave, com o mesmo
+        endereçamento (incluindo o Hash Linear) do BucketManager.
+
+        Args:
+            chave (str): A chave.
+
+        Returns:
+            int: O índice do Bucket.
+        """
+        valor: int = FuncaoHash.hash_value(chave, self.__estrategia_hash)
+        id_bucket: int = valor % (self.__quantidade_inicial << self.__nivel)
+        if id_bucket < self.__proximo_split:
+            id_bucket = valor % (self.__quantidade_inicial << (self.__nivel + 1))
+        return id_bucket
+
+    def search_row(self, dado: Tupla | str) -> Tuple[int, int]:
+        """Procura por uma chave diretamente no arquivo mapeado.
+
+        Args:
+            dado (Tupla | str): A Tupla (ou chave) a ser procurada.
+
+        Returns:
+            Tuple[int, int]: A linha da Tupla na Tabela e o índice do
+            Bucket, ou '-1' e '-1' caso não seja encontrada.
+        """
+        chave: str = dado.get_data() if isinstance(dado, Tupla) else dado
+        chave_bytes: bytes = chave.encode("UTF-8")
+        id_bucket: int = self.__get_bucket_id(chave)
+        for posicao in range(self.__inicios[id_bucket], self.__inicios[id_bucket + 1]):
+            linha: int = self.__registros[posicao]
+            if self.__chaves[self.__deslocamentos[linha]:self.__deslocamentos[linha + 1]] == chave_bytes:
+                return linha, id_bucket
+        return -1, -1
+
+    @Instrumentacao.traced("busca_indice")
+    def search_data(self, dado: Tupla | str) -> Union[Union[Tupla, None], int]:
+        """Procura por uma Tupla diretamente no arquivo mapeado.
+
+        Args:
+            dado (Tupla | str): A Tupla a ser procurada nos Buckets.
+
+        Returns:
+            Union[Union[Tupla, None], int]: Retorna a Tupla (da Tabela
+            retornada por 'get_table()') se ela for encontrada ou 'None'
+            caso contrário e, também o índice do bucket em que ela foi
+            encontrada ou '-1' caso contrário.
+        """
+        linha, id_bucket = self.search_row(dado)
+        if linha == -1:
+            return None, -1
+        return self.get_table().get_tuple(linha), id_bucket
+
+    def get_table(self) -> TabelaColunar:
+        """Retorna a Tabela (colunar) reconstruída a partir das
+        chaves e dos índices das Paginas gravados, sem precisar
+        ler o arquivo de origem.
+
+        Returns:
+            TabelaColunar: A Tabela indexada.
+        """
+        if self.__tabela is None:
+            self.__tabela = TabelaColunar.from_packed_keys(
+                self.__chaves, self.__deslocamentos.cast("B"), self.__indices_pagina.cast("B")
+            )
+        return self.__tabela
+
+    def get_bucket_count(self) -> int:
+        """Retorna a quantidade de Buckets.
+
+        Returns:
+            int: A qntd. de Buckets.
+        """
+        return self.__quantidade_buckets
+
+    def get_bucket_capacity(self) -> int:
+        """Retorna a capacidade dos Buckets.
+
+        Returns:
+            int: A capacidade dos Buckets.
+        """
+        return self.__capacidade_buckets
+
+    def get_hash_strategy(self) -> str:
+        """Retorna o nome da estratégia de hash usada.
+
+        Returns:
+            str: O nome da estratégia de hash.
+        """
+        return self.__estrategia_hash
+
+    def get_collision_count(self, id_bucket: int) -> int:
+        """Retorna a taxa de colisão de um Bucket, ou seja,
+        quantas Tuplas estão nos seus Overflows.
+
+        Args:
+            id_bucket (int): O índice do Bucket.
+
+        Returns:
+            int: A taxa de colisão de um Bucket.
+        """
+        tamanho: int = self.__inicios[id_bucket + 1] - self.__inicios[id_bucket]
+        return max(tamanho - self.__capacidade_buckets, 0)
+
+    def get_overflow_count(self, id_bucket: int) -> int:
+        """Retorna a quantidade de overflow de um Bucket.
+
+        Args:
+            id_bucket (int): O índice do Bucket.
+
+        Returns:
+            int: A qntd. de overflow de um Bucket.
+        """
+        tamanho: int = self.__inicios[id_bucket + 1] - self.__inicios[id_bucket]
+        return max(-(-tamanho // self.__capacidade_buckets) - 1, 0)
+
+    def get_dispersion_percentage(self) -> float:
+        """Retorna a porcentagem de dispersão nos Buckets.
+
+        Returns:
+            float: A porcentagem de dispersão nos Buckets.
+        """
+        taxa_colisao: int = 0
+        for i in range(0, self.get_bucket_count()):
+            taxa_colisao += self.get_collision_count(i)
+        return (taxa_colisao * 100) / (self.get_bucket_capacity() * self.get_bucket_count())
+
+    def __close_file(self) -> None:
+        """Fecha o mapeamento e o arquivo."""
+        self.__mapa.close()
+        self.__arquivo.close()
+
+    def close(self) -> None:
+        """Libera as visões do arquivo mapeado e fecha-o.
+
+        As Tuplas de 'get_table()' continuam válidas, pois a
+        Tabela é uma cópia das chaves.
+        """
+        for visao in (self.__inicios, self.__registros, self.__deslocamentos,
+                      self.__indices_pagina, self.__chaves):
+            visao.release()
+        self.__close_file()
@@ -0,0 +1,206 @@
+"""Representa o Índice de Prefixos.
+Índice secundário, ordenado pelas chaves, que responde buscas
+por prefixo, a contagem de Tuplas por prefixo e o autocompletar
+com buscas binárias, sem percorrer a Tabela.
+
+Armazena as mesmas Tuplas (referências) dos Buckets.
+
+As inserções ficam pendentes e são intercaladas ('heapq.merge()')
+com as chaves já ordenadas na próxima consulta, em O(n + k log k)
+para 'k' inserções, em vez de um 'list.insert()' (O(n)) para cada.
+"""
+
+from bisect import bisect_left, bisect_right
+from heapq import merge
+from operator import itemgetter
+from typing import List, Sequence, Tuple
+
+# pylint: disable=import-error
+
+from structs.Tupla import Tupla
+
+class IndicePrefixo:
+    """Representa o Índice de Prefixos (vetor ordenado de chaves)."""
+    # As chaves, em ordem (com repetições).
+    __chaves: List[str]
+    # As Tuplas de cada chave, na mesma ordem (e, para chaves
+    # iguais, na ordem de inserção).
+    __tuplas: List[Tupla]
+    # Abaixo de 1 pendente para cada 'PROPORCAO_INTERCALACAO' chaves, cada
+    # pendente é posicionada com 'list.insert()' (um 'memmove'), mais barato
+    # que percorrer todas as chaves em Python na intercalação.
+    PROPORCAO_INTERCALACAO: int = 1024
+
+    # As inserções (chave e Tupla) ainda não intercaladas, em ordem de inserção.
+    __pendentes: List[Tuple[str, Tupla]]
+
+    def __init__(self) -> None:
+        """Inicializa o Índice vazio."""
+        self.__chaves = []
+        self.__tuplas = []
+        self.__pendentes = []
+
+    def get_size(self) -> int:
+        """Retorna a quantidade de Tuplas no Índice.
+
+        Returns:
+            int: A qntd. de Tuplas.
+        """
+        return len(self.__tuplas) + len(self.__pendentes)
+
+    def insert(self, tupla: Tupla) -> None:
+        """Insere uma Tupla no Índice, em O(1): ela fica pendente
+        até a próxima consulta (ver 'insert_many()').
+
+        Args:
+            tupla (Tupla): A Tupla a ser inserida.
+        """
+        self.__pendentes.append((tupla.get_data(), tupla))
+
+    def insert_many(self, tuplas: Sequence[Tupla]) -> None:
+        """Insere várias Tuplas, que ficam pendentes até a próxima
+        consulta, quando são ordenadas e intercaladas de uma só vez.
+
+        Args:
+            tuplas (Sequence[Tupla]): As Tuplas a serem inseridas.
+        """
+        self.__pendentes.extend((tupla.get_data(), tupla) for tupla in tuplas)
+
+    def __merge_pending(self) -> None:
+        """Ordena as inserções pendentes e as intercala com as chaves
+        já ordenadas, em O(n + k log k) para 'k' pendentes.
+
+        Ambas as ordenações são estáveis, então chaves iguais continuam
+        na ordem de inserção. Poucas pendentes (ver 'PROPORCAO_INTERCALACAO')
+        são posicionadas uma a uma, por busca binária.
+        """
+        if not self.__pendentes:
+            return
+        pendentes: List[Tuple[str, Tupla]] = sorted(self.__pendentes, key=itemgetter(0))
+        self.__pendentes = []
+        if len(pendentes) * self.PROPORCAO_INTERCALACAO < len(self.__chaves):
+            for chave, tupla in pendentes:
+                posicao: int = bisect_right(self.__chaves, chave)
+                self.__chaves.insert(posicao, chave)
+                self.__tuplas.insert(posicao, tupla)
+            return
+        if not self.__chaves:
+            self.__chaves = [chave for chave, _ in pendentes]
+            self.__tuplas = [tupla for _, tupla in pendentes]
+            return
+        mescladas: List[Tuple[str, Tupla]] = list(merge(
+            zip(self.__chaves, self.__tuplas), pendentes, key=itemgetter(0)
+        ))
+        self.__chaves = [chave for chave, _ in mescladas]
+        self.__tuplas = [tupla for _, tupla in mescladas]
+
+    def delete(self, tupla: Tupla) -> bool:
+        """Remove uma Tupla do Índice, pela sua chave atual.
+
+        Args:
+            tupla (Tupla): A Tupla a ser removida.
+
+        Returns:
+            bool: Se a Tupla estava no Índice.
+        """
+        self.__merge_pending()
+        chave: str = tupla.get_data()
+        inicio: int = bisect_left(self.__chaves, chave)
+        fim: int = bisect_right(self.__chaves, chave, inicio)
+        for posicao in range(inicio, fim):
+            if self.__tuplas[posicao] is tupla or self.__tuplas[posicao] == tupla:
+                del self.__chaves[posicao]
+                del self.__tuplas[posicao]
+                return True
+        return False
+
+    def clear(self) -> None:
+        """Remove todas as Tuplas do Índice."""
+        self.__chaves.clear()
+        self.__tuplas.clear()
+        self.__pendentes.clear()
+
+    @staticmethod
+    def get_successor(prefixo: str) -> str:
+        """Retorna a menor chave maior que todas as chaves com o prefixo.
+
+        Args:
+            prefixo (str): O prefixo.
+
+        Returns:
+            str: O sucessor do prefixo ou '' caso não exista
+            (prefixo vazio ou somente com o maior caractere).
+        """
+        prefixo = prefixo.rstrip(chr(0x10FFFF))
+        if not prefixo:
+            return ""
+        return prefixo[:-1] + chr(ord(prefixo[-1]) + 1)
+
+    def get_range(self, prefixo: str) -> Tuple[int, int]:
+        """Retorna o intervalo (no Índice) das chaves com o prefixo.
+
+        Args:
+            prefixo (str): O prefixo.
+
+        Returns:
+            Tuple[int, int]: O início e o fim (exclusivo) do intervalo.
+        """
+        self.__merge_pending()
+        inicio: int = bisect_left(self.__chaves, prefixo)
+        sucessor: str = IndicePrefixo.get_successor(prefixo)
+        if not sucessor:
+            return inicio, len(self.__chaves)
+        return inicio, bisect_left(self.__chaves, sucessor, inicio)
+
+    def search_prefix(self, prefixo: str, limite: int = None) -> List[Tupla]:
+        """Procura as Tuplas cujas chaves começam com o prefixo.
+
+        Args:
+            prefixo (str): O prefixo.
+            limite (int, optional): A qntd. máxima de Tuplas retornadas.
+            Valor padrão 'None' (sem limite).
+
+        Returns:
+            List[Tupla]: As Tuplas, em ordem alfabética das chaves.
+        """
+        inicio, fim = self.get_range(prefixo)
+        if limite is not None:
+            fim = min(fim, inicio + max(limite, 0))
+        return self.__tuplas[inicio:fim]
+
+    def count_prefix(self, prefixo: str) -> int:
+        """Conta as Tuplas cujas chaves começam com o prefixo.
+
+        Args:
+            prefixo (str): O prefixo.
+
+        Returns:
+            int: A qntd. de Tuplas.
+        """
+        inicio, fim = self.get_range(prefixo)
+        return fim - inicio
+
+    def get_completions(self, prefixo: str, quantidade: int = 10) -> List[Tuple[str, int]]:
+        """Retorna as primeiras chaves distintas (em ordem alfabética)
+        que completam o prefixo, saltando as repetições por busca binária.
+
+        Não são as chaves mais frequentes (top-k): o Índice é ordenado
+        somente pelas chaves, então as 'quantidade' primeiras em ordem
+        alfabética são retornadas, cada uma com a sua contagem.
+
+        Args:
+            prefixo (str): O prefixo.
+            quantidade (int, optional): A qntd. máxima de chaves.
+            Valor padrão '10'.
+
+        Returns:
+            List[Tuple[str, int]]: Cada chave e a sua qntd. de Tuplas.
+        """
+        posicao, fim = self.get_range(prefixo)
+        completacoes: List[Tuple[str, int]] = []
+        while posicao < fim and len(completacoes) < quantidade:
+            chave: str = self.__chaves[posicao]
+            proxima: int = bisect_right(self.__chaves, chave, posicao, fim)
+            completacoes.append((chave, proxima - posicao))
+            posicao = proxima
+        return completacoes
@@ -0,0 +1,354 @@
+"""Representa a camada de Instrumentação.
+Registra a latência de cada operação (e de cada etapa de
+uma operação) em Histogramas log-lineares (estilo HDR) e
+contadores de sondagens e comparações, podendo ser ativada
+e desativada em tempo de execução.
+
+Desativada, o custo nas operações é somente o de verificar
+'Instrumentacao.ativa'.
+"""
+
+import json
+from functools import wraps
+from threading import Lock
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, List
+
+class Histograma:
+    """Representa um Histograma log-linear de latências (nanossegundos).
+
+    Cada potência de dois é dividida em '2 ** PRECISAO' intervalos,
+    então o erro relativo de um valor é de no máximo '1 / 2 ** PRECISAO'.
+    """
+    # Bits de precisão (16 intervalos por potência de dois, ~6% de erro).
+    PRECISAO: int = 4
+
+    # A qntd. de valores em cada intervalo.
+    __contagens: List[int]
+    # A qntd. de valores, a soma, o menor e o maior valor.
+    __quantidade: int
+    __soma: int
+    __minimo: int
+    __maximo: int
+
+    def __init__(self) -> None:
+        """Inicializa o Histograma vazio."""
+        self.__contagens = []
+        self.__quantidade = 0
+        self.__soma = 0
+        self.__minimo = 0
+        self.__maximo = 0
+
+    @staticmethod
+    def get_index(valor: int) -> int:
+        """Retorna o índice do intervalo de um valor.
+
+        Args:
+            valor (int): O valor (não negativo).
+
+        Returns:
+            int: O índice do intervalo.
+        """
+        deslocamento: int = valor.bit_length() - (Histograma.PRECISAO + 1)
+        if deslocamento <= 0:
+            return valor
+        return (deslocamento << Histograma.PRECISAO) + (valor >> deslocamento)
+
+    @staticmethod
+    def get_upper_bound(indice: int) -> int:
+        """Retorna o maior valor de um intervalo.
+
+        Args:
+            indice (int): O índice do intervalo.
+
+        Returns:
+            int: O maior valor do intervalo.
+        """
+        deslocamento: int = (indice >> Histograma.PRECISAO) - 1
+        if deslocamento <= 0:
+            return indice
+        mantissa: int = indice - (deslocamento << Histograma.PRECISAO)
+        return ((mantissa + 1) << deslocamento) - 1
+
+    def record(self, valor: int) -> None:
+        """Registra um valor.
+
+        Args:
+            valor (int): O valor (não negativo).
+        """
+        valor = max(valor, 0)
+        indice: int = Histograma.get_index(valor)
+        if indice >= len(self.__contagens):
+            self.__contagens.extend([0] * (indice + 1 - len(self.__contagens)))
+        self.__contagens[indice] += 1
+        if self.__quantidade == 0 or valor < self.__minimo:
+            self.__minimo = valor
+        if valor > self.__maximo:
+            self.__maximo = valor
+        self.__quantidade += 1
+        self.__soma += valor
+
+    def get_count(self) -> int:
+        """Retorna a quantidade de valores registrados.
+
+        Returns:
+            int: A qntd. de valores.
+        """
+        return self.__quantidade
+
+    def get_sum(self) -> int:
+        """Retorna a soma dos valores registrados.
+
+        Returns:
+            int: A soma dos valores.
+        """
+        return self.__soma
+
+    def get_mean(self) -> float:
+        """Retorna a média dos valores registrados.
+
+        Returns:
+            float: A média ou '0.0' se não houver valores.
+        """
+        return self.__soma / self.__quantidade if self.__quantidade else 0.0
+
+    def get_percentile(self, percentil: float) -> int:
+        """Retorna um percentil (o maior valor do seu intervalo,
+        limitado pelo maior valor registrado).
+
+        Args:
+            percentil (float): O percentil (entre 0 e 100).
+
+        Returns:
+            int: O valor do percentil ou '0' se não houver valores.
+        """
+        if self.__quantidade == 0:
+            return 0
+        alvo: int = max(-(-self.__quantidade * percentil // 100), 1)
+        acumulado: int = 0
+        for indice, contagem in enumerate(self.__contagens):
+            acumulado += contagem
+            if acumulado >= alvo:
+                return min(Histograma.get_upper_bound(indice), self.__maximo)
+        return self.__maximo
+
+    def get_buckets(self) -> List[tuple]:
+        """Retorna os intervalos não vazios, com as contagens acumuladas.
+
+        Returns:
+            List[tuple]: O maior valor de cada intervalo e a qntd.
+            acumulada de valores até ele.
+        """
+        intervalos: List[tuple] = []
+        acumulado: int = 0
+        for indice, contagem in enumerate(self.__contagens):
+            if contagem:
+                acumulado += contagem
+                intervalos.append((Histograma.get_upper_bound(indice), acumulado))
+        return intervalos
+
+    def to_dict(self) -> Dict[str, float]:
+        """Resume o Histograma.
+
+        Returns:
+            Dict[str, float]: A qntd., a média, o mínimo, o máximo e os
+            percentis 50, 90, 99 e 99.9 (em nanossegundos).
+        """
+        return {
+            "quantidade": self.__quantidade,
+            "media": self.get_mean(),
+            "minimo": self.__minimo,
+            "p50": self.get_percentile(50),
+            "p90": self.get_percentile(90),
+            "p99": self.get_percentile(99),
+            "p999": self.get_percentile(99.9),
+            "maximo": self.__maximo
+        }
+
+class Instrumentacao:
+    """Representa a camada de Instrumentação (estado global).
+
+    As operações são nomeadas como 'operacao' e as suas etapas
+    como 'operacao.etapa' (ex.: 'busca' e 'busca.hash').
+    """
+    # Se a Instrumentação está ativa.
+    ativa: bool = False
+    # Os Histogramas de latência, pelo nome da operação ou etapa.
+    __histogramas: Dict[str, Histograma] = {}
+    # Os contadores (ex.: sondagens e comparações), pelo nome.
+    __contadores: Dict[str, int] = {}
+    # Protege os Histogramas e contadores, os registros podem vir de várias
+    # threads. Sempre usada: só é adquirida com a Instrumentação ativa (ou ao
+    # exportar), em que o custo de uma Trava livre é pequeno perto do registro.
+    __trava: Lock = Lock()
+
+    @staticmethod
+    def enable() -> None:
+        """Ativa a Instrumentação."""
+        Instrumentacao.ativa = True
+
+    @staticmethod
+    def disable() -> None:
+        """Desativa a Instrumentação (os registros são mantidos)."""
+        Instrumentacao.ativa = False
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Retorna se a Instrumentação está ativa.
+
+        Returns:
+            bool: Se a Instrumentação está ativa.
+        """
+        return Instrumentacao.ativa
+
+    @staticmethod
+    def reset() -> None:
+        """Descarta todos os Histogramas e contadores."""
+        with Instrumentacao.__trava:
+            Instrumentacao.__histogramas.clear()
+            Instrumentacao.__contadores.clear()
+
+    @staticmethod
+    def record(nome: str, nanossegundos: int) -> None:
+        """Registra a latência de uma operação ou etapa.
+
+        Args:
+            nome (str): O nome da operação ou etapa.
+            nanossegundos (int): A latência.
+        """
+        with Instrumentacao.__trava:
+            histograma: Histograma = Instrumentacao.__histogramas.get(nome)
+            if histograma is None:
+                histograma = Instrumentacao.__histogramas.setdefault(nome, Histograma())
+            histograma.record(nanossegundos)
+
+    @staticmethod
+    def increment(nome: str, valor: int = 1) -> None:
+        """Incrementa um contador.
+
+        Args:
+            nome (str): O nome do contador.
+            valor (int, optional): O incremento.
+            Valor padrão '1'.
+        """
+        with Instrumentacao.__trava:
+            Instrumentacao.__contadores[nome] = Instrumentacao.__contadores.get(nome, 0) + valor
+
+    @staticmethod
+    def traced(nome: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """Decorador que registra a latência de uma função,
+        somente quando a Instrumentação está ativa.
+
+        Args:
+            nome (str): O nome da operação.
+
+        Returns:
+            Callable[[Callable[..., Any]], Callable[..., Any]]: O decorador.
+        """
+        def decorator(funcao: Callable[..., Any]) -> Callable[..., Any]:
+            @wraps(funcao)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not Instrumentacao.ativa:
+                    return funcao(*args, **kwargs)
+                inicio: int = perf_counter_ns()
+                try:
+                    return funcao(*args, **kwargs)
+                finally:
+                    Instrumentacao.record(nome, perf_counter_ns() - inicio)
+            return wrapper
+        return decorator
+
+    @staticmethod
+    def get_histogram(nome: str) -> Histograma:
+        """Retorna o Histograma de uma operação ou etapa.
+
+        Args:
+            nome (str): O nome da operação ou etapa.
+
+        Returns:
+            Histograma: O Histograma (vazio caso não haja registros).
+        """
+        return Instrumentacao.__histogramas.get(nome, Histograma())
+
+    @staticmethod
+    def get_counter(nome: str) -> int:
+        """Retorna o valor de um contador.
+
+        Args:
+            nome (str): O nome do contador.
+
+        Returns:
+            int: O valor do contador.
+        """
+        return Instrumentacao.__contadores.get(nome, 0)
+
+    @staticmethod
+    def to_dict() -> Dict[str, Any]:
+        """Resume todos os Histogramas e contadores.
+
+        Returns:
+            Dict[str, Any]: Se está ativa ('ativa'), o resumo de cada
+            Histograma ('latencias_ns') e os contadores ('contadores').
+        """
+        with Instrumentacao.__trava:
+            return {
+                "ativa": Instrumentacao.ativa,
+                "latencias_ns": {
+                    nome: histograma.to_dict()
+                    for nome, histograma in sorted(Instrumentacao.__histogramas.items())
+                },
+                "contadores": dict(sorted(Instrumentacao.__contadores.items()))
+            }
+
+    @staticmethod
+    def to_json() -> str:
+        """Exporta os Histogramas e contadores em JSON.
+
+        Returns:
+            str: O JSON (ver 'to_dict()').
+        """
+        return json.dumps(Instrumentacao.to_dict(), indent=2)
+
+    @staticmethod
+    def to_prometheus(prefixo: str = "indice_hash") -> str:
+        """Exporta os Histogramas e contadores no formato texto do Prometheus.
+
+        Args:
+            prefixo (str, optional): O prefixo das métricas.
+            Valor padrão 'indice_hash'.
+
+        Returns:
+            str: As métricas.
+        """
+        linhas: List[str] = [
+            f"# HELP {prefixo}_latencia_segundos Latência das operações e etapas.",
+            f"# TYPE {prefixo}_latencia_segundos histogram"
+        ]
+        with Instrumentacao.__trava:
+            histogramas: List[tuple] = [
+                (nome, histograma.get_buckets(), histograma.get_count(), histograma.get_sum())
+                for nome, histograma in sorted(Instrumentacao.__histogramas.items())
+            ]
+            contadores: List[tuple] = sorted(Instrumentacao.__contadores.items())
+        for nome, intervalos, quantidade, soma in histogramas:
+            for limite, acumulado in intervalos:
+                linhas.append(
+                    f'{prefixo}_latencia_segundos_bucket{{operacao="{nome}",'
+                    f'le="{limite / 1e9:.9g}"}} {acumulado}'
+                )
+            linhas.append(
+                f'{prefixo}_latencia_segundos_bucket{{operacao="{nome}",le="+Inf"}} '
+                f"{quantidade}"
+            )
+            linhas.append(
+                f'{prefixo}_latencia_segundos_sum{{operacao="{nome}"}} '
+                f"{soma / 1e9:.9g}"
+            )
+            linhas.append(
+                f'{prefixo}_latencia_segundos_count{{operacao="{nome}"}} {quantidade}'
+            )
+        for nome, valor in contadores:
+            metrica: str = f"{prefixo}_{nome.replace('.', '_')}_total"
+            linhas.append(f"# TYPE {metrica} counter")
+            linhas.append(f"{metrica} {valor}")
+        return "\n".join(linhas) + "\n"
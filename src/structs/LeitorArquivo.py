@@ -0,0 +1,153 @@
+"""Representa um Leitor de Arquivo.
+Lê um arquivo de entrada via 'mmap', em lotes de
+linhas (bytes), alimentando a Tabela, as Paginas e
+os Buckets enquanto o arquivo ainda está sendo lido.
+"""
+
+import mmap
+from os import path as os_path
+from queue import Empty, Queue
+from threading import Event, Thread
+from typing import Iterator, List, Union
+
+# pylint: disable=import-error
+
+from structs.Pagina import Pagina
+from structs.Bucket import BucketManager
+from structs.TabelaColunar import TabelaColunar, TuplaColunar
+
+class LeitorArquivo:
+    """Representa um Leitor de Arquivo."""
+    # Tamanho (em bytes) aproximado de cada bloco lido do arquivo.
+    TAMANHO_BLOCO_PADRAO: int = 1 << 20
+    # Qntd. máxima de lotes lidos aguardando processamento.
+    LOTES_EM_ESPERA: int = 4
+
+    # O caminho do arquivo.
+    __caminho: str
+    # Tamanho (em bytes) aproximado de cada lote.
+    __tamanho_bloco: int
+
+    def __init__(self, caminho: str, tamanho_bloco: int = TAMANHO_BLOCO_PADRAO) -> None:
+        """Inicializa o leitor de um arquivo.
+
+        Args:
+            caminho (str): O caminho do arquivo.
+            tamanho_bloco (int, optional): Tamanho (em bytes) aproximado
+            de cada lote de linhas.
+            Valor padrão 'TAMANHO_BLOCO_PADRAO' (1 MiB).
+        """
+        self.__caminho = caminho
+        self.__tamanho_bloco = max(tamanho_bloco, 1)
+
+    def read_batches(self) -> Iterator[List[bytes]]:
+        """Lê o arquivo em lotes de linhas, sem decodificá-las.
+
+        Cada lote cobre aproximadamente 'tamanho_bloco' bytes, sempre
+        terminando no final de uma linha. As linhas são retornadas
+        sem os espaços (ASCII) do começo e do final.
+
+        Yields:
+            Iterator[List[bytes]]: Os lotes de linhas.
+        """
+        with open(self.__caminho, "rb") as arquivo:
+            tamanho: int = os_path.getsize(self.__caminho)
+            if tamanho == 0:
+                return
+            with mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+                inicio: int = 0
+                while inicio < tamanho:
+                    # Estende o bloco até o final da linha.
+                    fim: int = mapa.find(b"\n", min(inicio + self.__tamanho_bloco, tamanho) - 1)
+                    fim = tamanho if fim == -1 else fim + 1
+                    yield [linha.strip() for linha in mapa[inicio:fim].splitlines()]
+                    inicio = fim
+
+    def count_lines(self) -> int:
+        """Conta as linhas do arquivo (as mesmas de 'read_batches()'),
+        sem decodificá-las, para dimensionar os Buckets antes da leitura.
+
+        Returns:
+            int: A qntd. de linhas.
+        """
+        quebras: int = 0
+        anterior: bytes = b""
+        with open(self.__caminho, "rb") as arquivo:
+            bloco: bytes = arquivo.read(self.__tamanho_bloco)
+            while bloco:
+                # Quebras '\n', '\r' e '\r\n' (contada uma única vez, mesmo
+                # dividida entre dois blocos), como em 'bytes.splitlines()'.
+                quebras += bloco.count(b"\n") + bloco.count(b"\r") - bloco.count(b"\r\n")
+                if anterior == b"\r" and bloco[:1] == b"\n":
+                    quebras -= 1
+                anterior = bloco[-1:]
+                bloco = arquivo.read(self.__tamanho_bloco)
+        if anterior == b"":
+            return 0
+        return quebras + (anterior not in (b"\n", b"\r"))
+
+    def load(self, tabela: TabelaColunar, pagina: Pagina = None,
+             bucket: BucketManager = None) -> TabelaColunar:
+        """Carrega o arquivo em uma Tabela, em lotes.
+
+        Uma thread lê os lotes (no máximo 'LOTES_EM_ESPERA' ficam em
+        memória) enquanto cada lote já lido é inserido na Tabela e,
+        se informados, nas Paginas e nos Buckets (dimensionados, por
+        exemplo, com 'count_lines()').
+
+        As Tuplas de cada lote são as das linhas ocupadas por ele, então
+        a Tabela pode já conter linhas (inclusive removidas).
+
+        Args:
+            tabela (TabelaColunar): A Tabela a ser preenchida.
+            pagina (Pagina, optional): As Paginas a serem preenchidas.
+            Valor padrão 'None'.
+            bucket (BucketManager, optional): Os Buckets a serem preenchidos.
+            Valor padrão 'None'.
+
+        Returns:
+            TabelaColunar: A Tabela preenchida.
+        """
+        lotes: Queue = Queue(maxsize=self.LOTES_EM_ESPERA)
+        erros: List[BaseException] = []
+        # Interrompe a leitura caso a inserção falhe.
+        cancelado: Event = Event()
+
+        def produzir() -> None:
+            try:
+                for lote in self.read_batches():
+                    if cancelado.is_set():
+                        break
+                    lotes.put(lote)
+            except BaseException as erro: # pylint: disable=broad-except
+                erros.append(erro)
+            finally:
+                # Sinaliza o final da leitura.
+                lotes.put(None)
+
+        leitor: Thread = Thread(target=produzir, daemon=True)
+        leitor.start()
+        try:
+            lote: Union[List[bytes], None] = lotes.get()
+            while lote is not None:
+                linhas: range = tabela.insert_keys(lote)
+                if pagina is not None or bucket is not None:
+                    tuplas: List[TuplaColunar] = list(map(tabela.get_tuple, linhas))
+                    if pagina is not None:
+                        pagina.insert_tuples(tuplas)
+                    if bucket is not None:
+                        bucket.insert_data_batch(tuplas, lote)
+                lote = lotes.get()
+        finally:
+            # Esvazia a fila até a thread terminar, ela pode estar
+            # bloqueada na fila cheia caso a inserção tenha falhado.
+            cancelado.set()
+            while leitor.is_alive():
+                try:
+                    lotes.get(timeout=0.05)
+                except Empty:
+                    pass
+            leitor.join()
+        if erros:
+            raise erros[0]
+        return tabela
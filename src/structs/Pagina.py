@@ -3,21 +3,30 @@ Estrutura de dados que representa a divisão
 e alocação física da tabela na mídia de armazenamento.
 """
 
-from typing import Dict, List, Union
+from typing import Dict, Iterable, List, Union
 
 # pylint: disable=import-error
 
 from structs.Tupla import Tupla
 from structs.Tabela import Tabela
+from structs.BufferPool import BufferPool
+from structs.Instrumentacao import Instrumentacao
+from structs.ArquivoPaginas import ArquivoPaginas
 
 class Pagina:
     """Representa a estrutura Pagina."""
-    # Tabelas contidas na Pagina.
-    __paginas: Dict[int, List[Tupla]] = {}
+    # Tabelas contidas na Pagina, 'None' marca uma Tupla removida (lápide).
+    __paginas: Dict[int, List[Union[Tupla, None]]] = {}
+    # As Paginas com lápides e a qntd. de lápides de cada uma.
+    __lapides: Dict[int, int]
     # Índice das Paginas, por padrão a primeira é 0.
     __indice_pagina_atual: int = 0
     # Tamanho fixo da Pagina.
     __tamanho_pagina: int
+    # O arquivo em disco com as Paginas, caso tenham sido gravadas.
+    __arquivo: Union[ArquivoPaginas, None]
+    # O Buffer Pool na frente do arquivo, caso exista.
+    __buffer_pool: Union[BufferPool, None]
 
     def __init__(self, tamanho_pagina: int) -> None:
         """Inicializa uma Pagina com tamanho fixo.
@@ -30,6 +39,9 @@ class Pagina:
         # Inicializa a primeira Pagina.
         self.__paginas = {}
         self.__paginas[self.__indice_pagina_atual] = []
+        self.__lapides = {}
+        self.__arquivo = None
+        self.__buffer_pool = None
 
     def get_page_fixed_size(self) -> int:
         """Retorna o tamanho fixo das Paginas.
@@ -56,7 +68,15 @@ class Pagina:
         Returns:
             int: A qntd. de Tuplas na Pagina.
         """
-        return len(self.__paginas[indice_pagina])
+        return len(self.__paginas[indice_pagina]) - self.__lapides.get(indice_pagina, 0)
+
+    def get_tombstone_count(self) -> int:
+        """Retorna a quantidade de lápides em todas as Paginas.
+
+        Returns:
+            int: A qntd. de lápides.
+        """
+        return sum(self.__lapides.values())
 
     def get_page_by_index(self, indice_pagina: int) -> List[Tupla]:
         """Busca uma Pagina pelo seu índice e retorna-a.
@@ -65,7 +85,8 @@ class Pagina:
             indice_pagina (int): O índice da Pagina.
 
         Returns:
-            List[Tupla]: O conteúdo (Tuplas) na Pagina.
+            List[Tupla]: O conteúdo (Tuplas) na Pagina, as Tuplas
+            removidas aparecem como 'None' (lápides).
         """
         return self.__paginas[indice_pagina]
 
@@ -79,7 +100,18 @@ class Pagina:
             tabela (Tabela): A Tabela a ser obtido
             as tuplas para inserção nas Paginas.
         """
-        for tupla in tabela.get_tuples():
+        self.insert_tuples(tabela.get_tuples())
+
+    def insert_tuples(self, tuplas: Iterable[Tupla]) -> None:
+        """Insere Tuplas, a partir da Pagina atual, em Paginas
+        separadas de tamanho fixo (ver 'insert()').
+
+        Permite preencher as Paginas aos poucos, lote por lote.
+
+        Args:
+            tuplas (Iterable[Tupla]): As Tuplas a serem inseridas.
+        """
+        for tupla in tuplas:
             # Adiciona na Página se houver espaço.
             if len(self.__paginas[self.__indice_pagina_atual]) < self.get_page_fixed_size():
                 # Adiciona uma Tupla à Pagina atual.
@@ -90,9 +122,122 @@ class Pagina:
                 self.__indice_pagina_atual += 1
                 self.__paginas[self.__indice_pagina_atual] = []
 
+    def delete(self, tupla: Tupla) -> bool:
+        """Remove uma Tupla da sua Pagina, deixando uma lápide no
+        seu slot até o próximo 'vacuum()'.
+
+        Caso as Paginas estejam em disco, a lápide também é gravada
+        no Arquivo de Paginas e a Pagina é descartada do Buffer Pool.
+
+        Args:
+            tupla (Tupla): A Tupla a ser removida.
+
+        Returns:
+            bool: Se a Tupla estava na sua Pagina.
+        """
+        indice_pagina: int = tupla.get_page_index()
+        pagina: Union[List[Union[Tupla, None]], None] = self.__paginas.get(indice_pagina)
+        if pagina is None:
+            return False
+        for posicao, tupla_pagina in enumerate(pagina):
+            if tupla_pagina is not None and tupla_pagina == tupla:
+                pagina[posicao] = None
+                self.__lapides[indice_pagina] = self.__lapides.get(indice_pagina, 0) + 1
+                if self.__arquivo is not None:
+                    self.__arquivo.write_tombstone(indice_pagina, posicao)
+                    if self.__buffer_pool is not None:
+                        self.__buffer_pool.invalidate_page(indice_pagina)
+                return True
+        return False
+
+    def vacuum(self, quantidade_paginas: int = None) -> int:
+        """Descarta as lápides das Paginas que mais as possuem, as
+        Tuplas não mudam de Pagina, o espaço livre fica no final.
+
+        Limitando a qntd. de Paginas, a limpeza pode ser feita aos
+        poucos, entre outras operações. Caso as Paginas estejam em
+        disco, somente os blocos das Paginas limpas são regravados
+        (no lugar) e descartados do Buffer Pool.
+
+        Args:
+            quantidade_paginas (int, optional): A qntd. máxima de Paginas
+            limpas nesta passada.
+            Valor padrão 'None' (todas as Paginas com lápides).
+
+        Returns:
+            int: A qntd. de lápides descartadas.
+        """
+        indices: List[int] = sorted(self.__lapides, key=self.__lapides.get, reverse=True)
+        if quantidade_paginas is not None:
+            indices = indices[:max(quantidade_paginas, 0)]
+        lapides: int = 0
+        for indice_pagina in indices:
+            self.__paginas[indice_pagina] = [
+                tupla for tupla in self.__paginas[indice_pagina] if tupla is not None
+            ]
+            lapides += self.__lapides.pop(indice_pagina)
+            # Paginas criadas após a gravação ainda não estão no arquivo.
+            if self.__arquivo is not None and indice_pagina < self.__arquivo.get_page_count():
+                self.__arquivo.write_page(indice_pagina, self.__paginas[indice_pagina])
+                if self.__buffer_pool is not None:
+                    self.__buffer_pool.invalidate_page(indice_pagina)
+        return lapides
+
+    def write_to_file(self, caminho: str, quantidade_quadros: int = None,
+                      politica: str = BufferPool.POLITICA_LRU) -> ArquivoPaginas:
+        """Grava as Paginas em um Arquivo de Paginas, a partir
+        de então as buscas leem as Paginas do disco.
+
+        Args:
+            caminho (str): O caminho do arquivo.
+            quantidade_quadros (int, optional): Caso informado, as leituras
+            passam por um Buffer Pool com essa qntd. de quadros.
+            Valor padrão 'None'.
+            politica (str, optional): A política de substituição do
+            Buffer Pool ('lru' ou 'clock').
+            Valor padrão 'lru'.
+
+        Returns:
+            ArquivoPaginas: O arquivo gravado, aberto para leitura.
+        """
+        if self.__arquivo is not None:
+            self.__arquivo.close()
+        ArquivoPaginas.write(
+            caminho,
+            [self.__paginas[i] for i in range(0, len(self.__paginas))],
+            self.get_page_fixed_size()
+        )
+        self.__arquivo = ArquivoPaginas(caminho, escrita=True)
+        self.__buffer_pool = None
+        if quantidade_quadros is not None:
+            self.__buffer_pool = BufferPool(self.__arquivo, quantidade_quadros, politica)
+        return self.__arquivo
+
+    def get_buffer_pool(self) -> Union[BufferPool, None]:
+        """Retorna o Buffer Pool, caso exista.
+
+        Returns:
+            Union[BufferPool, None]: O Buffer Pool ou 'None'.
+        """
+        return self.__buffer_pool
+
+    def get_file(self) -> Union[ArquivoPaginas, None]:
+        """Retorna o Arquivo de Paginas, caso as Paginas
+        tenham sido gravadas em disco.
+
+        Returns:
+            Union[ArquivoPaginas, None]: O arquivo ou 'None'.
+        """
+        return self.__arquivo
+
+    @Instrumentacao.traced("pagina")
     def search(self, dado: Tupla, indice_pagina: int) -> Union[Union[Tupla, None], int]:
         """Procura por uma Tupla em uma determina Pagina.
 
+        Caso as Paginas tenham sido gravadas em disco, a Pagina
+        é lida do Arquivo de Paginas (exatamente um bloco), ou do
+        Buffer Pool, se existir, em que o custo é a qntd. de faltas.
+
         Args:
             dado (Tupla): A Tupla a ser procurada
             indice_pagina (int): O índice da Pagina em que a Tupla
@@ -102,6 +247,19 @@ class Pagina:
             Union[Union[Tupla, None], int]: A Tupla caso seja encontrada, ou None
             caso contrário, juntamente com a estimativa de custo de acesso.
         """
+        if self.__buffer_pool is not None:
+            faltas: int = self.__buffer_pool.get_miss_count()
+            registros: List[str] = self.__buffer_pool.pin_page(indice_pagina)
+            encontrado: bool = dado.get_data() in registros
+            self.__buffer_pool.unpin_page(indice_pagina)
+            if encontrado:
+                return dado, self.__buffer_pool.get_miss_count() - faltas
+            return None, -1
+        if self.__arquivo is not None:
+            registro, custo = self.__arquivo.search(dado, indice_pagina)
+            if registro is not None:
+                return dado, custo
+            return None, -1
         for tupla in self.get_page_by_index(indice_pagina):
             if tupla == dado:
                 return tupla, 1
@@ -3,14 +3,57 @@ Contém todas as Tuplas construídas a partir do
 carregamento de algum arquivo de dados.
 """
 
-from typing import List, Optional, Union
+from array import array
+from collections.abc import Sequence
+from itertools import islice
+from typing import Callable, Iterator, List, Optional, Tuple, Union
 
 # pylint: disable=import-error
 
 from structs.Tupla import Tupla
+from structs.FuncaoHash import FuncaoHash
+from structs.Instrumentacao import Instrumentacao
+
+class IntervaloTuplas(Sequence):
+    """Sequência (somente leitura) das primeiras Tuplas de uma
+    sequência, sem copiá-las (ex.: o resultado do Table Scan).
+    """
+    # A sequência de origem.
+    __tuplas: Sequence[Tupla]
+    # A qntd. de Tuplas do intervalo.
+    __quantidade: int
+
+    def __init__(self, tuplas: Sequence[Tupla], quantidade: int) -> None:
+        """Cria o intervalo com as 'quantidade' primeiras Tuplas.
+
+        Args:
+            tuplas (Sequence[Tupla]): A sequência de origem.
+            quantidade (int): A qntd. de Tuplas do intervalo.
+        """
+        self.__tuplas = tuplas
+        self.__quantidade = quantidade
+
+    def __len__(self) -> int:
+        return self.__quantidade
+
+    def __getitem__(self, indice: Union[int, slice]) -> Union[Tupla, List[Tupla]]:
+        if isinstance(indice, slice):
+            return [self.__tuplas[i] for i in range(*indice.indices(self.__quantidade))]
+        if not -self.__quantidade <= indice < self.__quantidade:
+            raise IndexError("Índice fora do intervalo.")
+        return self.__tuplas[indice % self.__quantidade]
+
+    def __iter__(self) -> Iterator[Tupla]:
+        return islice(self.__tuplas, self.__quantidade)
+
 
 class Tabela:
     """Representa a estrutura Tabela."""
+    # Modos de comparação do 'scan()'.
+    SCAN_EXATO: str = "exato"
+    SCAN_PREFIXO: str = "prefixo"
+    SCAN_SUBSTRING: str = "substring"
+
     # Responsável pelo armazenamento das tuplas.
     __tuplas: List[Tupla] = []
 
@@ -33,6 +76,16 @@ class Tabela:
         """
         return self.__tuplas
 
+    def get_packed_keys(self) -> Tuple[bytes, array]:
+        """Retorna todas as chaves codificadas em um único buffer,
+        juntamente com os deslocamentos de cada chave
+        (ver 'FuncaoHash.pack_keys()').
+
+        Returns:
+            Tuple[bytes, array]: O buffer e os deslocamentos.
+        """
+        return FuncaoHash.pack_keys(self.get_tuples())
+
     def insert(self, tupla: Tupla) -> None:
         """Insere uma Tupla na Tabela.
 
@@ -42,7 +95,88 @@ class Tabela:
         """
         self.__tuplas.append(tupla)
 
-    def table_scan(self, dado: str, quantidade_busca: Optional[int] = None) -> Union[Tupla, None]:
+    def delete(self, tupla: Tupla) -> bool:
+        """Remove uma Tupla da Tabela.
+
+        Args:
+            tupla (Tupla): A Tupla a ser removida.
+
+        Returns:
+            bool: Se a Tupla estava na Tabela.
+        """
+        try:
+            self.__tuplas.remove(tupla)
+        except ValueError:
+            return False
+        return True
+
+    def update(self, tupla: Tupla, dado: str) -> None:
+        """Substitui o dado de uma Tupla da Tabela, a Tupla
+        continua na mesma posição (e na mesma Pagina).
+
+        Args:
+            tupla (Tupla): A Tupla a ser atualizada.
+            dado (str): O novo dado.
+        """
+        tupla.set_data(dado)
+
+    @staticmethod
+    def get_scan_predicate(dado: str, modo: str = SCAN_EXATO) -> Callable[[str], bool]:
+        """Retorna a comparação de uma chave com o dado procurado.
+
+        Args:
+            dado (str): O dado procurado.
+            modo (str, optional): 'exato', 'prefixo' ou 'substring'.
+            Valor padrão 'exato'.
+
+        Returns:
+            Callable[[str], bool]: Se uma chave corresponde ao dado.
+
+        Raises:
+            ValueError: Caso o modo não exista.
+        """
+        if modo == Tabela.SCAN_EXATO:
+            return dado.__eq__
+        if modo == Tabela.SCAN_PREFIXO:
+            return lambda chave: chave.startswith(dado)
+        if modo == Tabela.SCAN_SUBSTRING:
+            return lambda chave: dado in chave
+        raise ValueError(f"Modo de Table Scan '{modo}' inexistente.")
+
+    def scan(self, dado: str, modo: str = SCAN_EXATO, limite: Optional[int] = None,
+             quantidade_busca: Optional[int] = None) -> Iterator[Tupla]:
+        """Percorre a Tabela sob demanda (gerador), retornando as Tuplas
+        cujas chaves correspondem ao dado, sem copiar a Tabela.
+
+        Args:
+            dado (str): O dado procurado.
+            modo (str, optional): 'exato', 'prefixo' ou 'substring'.
+            Valor padrão 'exato'.
+            limite (int, optional): A qntd. máxima de Tuplas retornadas,
+            a busca para ao atingi-la.
+            Valor padrão 'None' (sem limite).
+            quantidade_busca (int, optional): A qntd. de Tuplas percorridas.
+            Valor padrão é o tamanho da Tabela: get_size().
+
+        Yields:
+            Iterator[Tupla]: As Tuplas encontradas, na ordem da Tabela.
+
+        Raises:
+            ValueError: Caso o modo não exista.
+        """
+        corresponde: Callable[[str], bool] = Tabela.get_scan_predicate(dado, modo)
+        if limite is not None and limite <= 0:
+            return
+        encontradas: int = 0
+        for tupla in islice(self.get_tuples(), quantidade_busca):
+            if corresponde(tupla.get_data()):
+                yield tupla
+                encontradas += 1
+                if encontradas == limite:
+                    return
+
+    @Instrumentacao.traced("table_scan")
+    def table_scan(self, dado: str, quantidade_busca: Optional[int] = None) -> Union[Sequence, None]:
         """Realiza uma busca (Table Scan) de um dado.
 
         Args:
@@ -53,7 +187,8 @@ class Tabela:
             Valor padrão é o tamanho da Tabela: get_size().
 
         Returns:
-            Union[Tupla, None]: Retorna o dado, caso seja encontrado ou nada.
+            Union[Sequence, None]: Retorna as Tuplas até o dado (sem
+            copiá-las, ver 'IntervaloTuplas'), caso seja encontrado ou nada.
         """
         # Qntd. de busca será a qntd. de Tuplas se nenhum valor for informado.
         if quantidade_busca is None:
@@ -66,5 +201,5 @@ class Tabela:
         for i in range(0, quantidade_busca, 1):
             tupla_atual = self.__tuplas[i]
             if tupla_atual.get_data() == dado:
-                return self.get_tuples()[0:i+1]
+                return IntervaloTuplas(self.get_tuples(), i + 1)
         return None
@@ -0,0 +1,655 @@
+"""Representa a estrutura Tabela Colunar.
+Mesma interface da Tabela, mas as chaves ficam em um
+único buffer UTF-8 com um vetor de deslocamentos e os
+índices de Pagina em outro vetor, as Tuplas são criadas
+somente quando acessadas.
+
+As linhas removidas são somente marcadas, assim as linhas
+(e as Tuplas que apontam para elas) nunca mudam.
+
+A economia de memória vale somente dentro da Tabela: o índice
+(BucketManager) ainda guarda uma TuplaColunar por linha inserida
+nos Buckets.
+
+O Table Scan procura as chaves com 'bytes.find()' em uma cópia
+do buffer com as chaves separadas por '\\n' (criada no primeiro
+Table Scan após uma alteração), convertendo a posição encontrada
+na linha por busca binária nos deslocamentos.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from itertools import accumulate, compress, repeat
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+# pylint: disable=import-error
+
+from structs.Tupla import Tupla
+from structs.Tabela import Tabela, IntervaloTuplas
+from structs.Instrumentacao import Instrumentacao
+
+# NumPy é opcional, usado para deslocar os deslocamentos em 'set_key()'
+# e para montar o buffer do Table Scan.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class TuplaColunar(Tupla):
+    """Representa uma Tupla de uma Tabela Colunar.
+
+    Não armazena nada além da Tabela e da sua linha, o dado
+    e o índice da Pagina são lidos (e escritos) nas colunas.
+    """
+    __slots__ = ("__tabela", "__linha")
+
+    # A Tabela de origem.
+    __tabela: 'TabelaColunar'
+    # A linha da Tupla na Tabela.
+    __linha: int
+
+    # pylint: disable=super-init-not-called
+    def __init__(self, tabela: 'TabelaColunar', linha: int) -> None:
+        """Cria uma Tupla ligada a uma linha de uma Tabela Colunar.
+
+        Args:
+            tabela (TabelaColunar): A Tabela de origem.
+            linha (int): A linha da Tupla na Tabela.
+        """
+        self.__tabela = tabela
+        self.__linha = linha
+
+    def get_row(self) -> int:
+        """Retorna a linha da Tupla na Tabela.
+
+        Returns:
+            int: A linha da Tupla.
+        """
+        return self.__linha
+
+    def get_data(self) -> str:
+        """Retorna o dado contido em uma Tupla.
+
+        Returns:
+            str: O dado contido na Tupla.
+        """
+        return self.__tabela.get_key(self.__linha)
+
+    def has_key(self, chave: str, chave_bytes: bytes = None) -> bool:
+        """Verifica se a Tupla possui uma chave, comparando os bytes
+        no buffer da Tabela, sem decodificar a chave da Tupla.
+
+        Args:
+            chave (str): A chave.
+            chave_bytes (bytes, optional): A chave codificada em UTF-8.
+            Valor padrão 'None' (codificada aqui).
+
+        Returns:
+            bool: Se o dado da Tupla é a chave.
+        """
+        if chave_bytes is None:
+            chave_bytes = chave.encode("UTF-8")
+        return self.__tabela.has_key(self.__linha, chave_bytes)
+
+    def set_data(self, dado: str) -> None:
+        """Substitui o dado contido em uma Tupla.
+
+        Args:
+            dado (str): O novo dado da Tupla.
+        """
+        self.__tabela.set_key(self.__linha, dado)
+
+    def get_page_index(self) -> int:
+        """Retorna o índice da Pagina associada
+        nesta Tupla.
+
+        Returns:
+            int: O índice da Pagina associada a
+            esta Tupla.
+        """
+        return self.__tabela.get_page_index(self.__linha)
+
+    def set_page_index(self, indice_pagina: int) -> None:
+        """Define a referência ao índice de uma Pagina.
+
+        Args:
+            indice_pagina (int): O índice de uma Pagina.
+        """
+        self.__tabela.set_page_index(self.__linha, indice_pagina)
+
+    def __eq__(self, outra: object) -> bool:
+        """Duas Tuplas Colunares são iguais se apontam para a
+        mesma linha da mesma Tabela.
+
+        Args:
+            outra (object): A outra Tupla.
+
+        Returns:
+            bool: Se são a mesma Tupla.
+        """
+        if not isinstance(outra, TuplaColunar):
+            return NotImplemented
+        return self.__tabela is outra.__tabela and self.__linha == outra.__linha
+
+    def __hash__(self) -> int:
+        return hash((id(self.__tabela), self.__linha))
+
+
+class TuplasColunares(Sequence):
+    """Sequência (somente leitura) das Tuplas de uma Tabela
+    Colunar, criando cada Tupla somente quando acessada.
+    """
+    # A Tabela de origem.
+    __tabela: 'TabelaColunar'
+    # As linhas (não removidas) da Tabela.
+    __linhas: Sequence[int]
+
+    def __init__(self, tabela: 'TabelaColunar', linhas: Sequence[int]) -> None:
+        """Cria a sequência de Tuplas de uma Tabela Colunar.
+
+        Args:
+            tabela (TabelaColunar): A Tabela de origem.
+            linhas (Sequence[int]): As linhas (não removidas) da Tabela.
+        """
+        self.__tabela = tabela
+        self.__linhas = linhas
+
+    def __len__(self) -> int:
+        return len(self.__linhas)
+
+    def __getitem__(self, indice: Union[int, slice]) -> Union[TuplaColunar, List[TuplaColunar]]:
+        if isinstance(indice, slice):
+            return [TuplaColunar(self.__tabela, i) for i in self.__linhas[indice]]
+        if not -len(self.__linhas) <= indice < len(self.__linhas):
+            raise IndexError("Índice fora da Tabela.")
+        return TuplaColunar(self.__tabela, self.__linhas[indice])
+
+    def __iter__(self) -> Iterator[TuplaColunar]:
+        return map(TuplaColunar, repeat(self.__tabela), self.__linhas)
+
+
+class TabelaColunar(Tabela):
+    """Representa a estrutura Tabela Colunar.
+
+    Somente as colunas ficam na Tabela, as Tuplas indexadas pelo
+    BucketManager continuam sendo uma TuplaColunar por linha.
+    """
+    # Troca as marcas de remoção (0 e 1), ver 'get_rows()'.
+    INVERTE_MARCAS: bytes = bytes([1, 0]) + bytes(254)
+
+    # As chaves de todas as Tuplas, codificadas em UTF-8.
+    __chaves: bytearray
+    # A chave 'i' ocupa 'chaves[deslocamentos[i]:deslocamentos[i + 1]]' ('Q',
+    # o buffer pode passar de 4 GiB).
+    __deslocamentos: array
+    # O índice da Pagina de cada Tupla.
+    __indices_pagina: array
+    # Marca (1) as linhas removidas e a qntd. de linhas marcadas.
+    __removidas: bytearray
+    __quantidade_removidas: int
+    # As linhas não removidas, em ordem, ou 'None' se precisam ser montadas
+    # (somente quando há linhas removidas, ver 'get_rows()').
+    __linhas: Union[array, None]
+    # As chaves separadas (e envolvidas) por '\n', ou 'None' se precisa ser
+    # montado. A chave 'i' começa na posição 'deslocamentos[i] + i + 1'.
+    __buffer_busca: Union[bytes, None]
+
+    # pylint: disable=super-init-not-called
+    def __init__(self) -> None:
+        """Inicializa as colunas vazias."""
+        self.__chaves = bytearray()
+        self.__deslocamentos = array("Q", [0])
+        self.__indices_pagina = array("I")
+        self.__removidas = bytearray()
+        self.__quantidade_removidas = 0
+        self.__linhas = None
+        self.__buffer_busca = None
+
+    @staticmethod
+    def from_packed_keys(chaves: bytes, deslocamentos: bytes,
+                         indices_pagina: bytes = None) -> 'TabelaColunar':
+        """Cria uma Tabela a partir de um buffer de chaves e dos
+        bytes de um vetor de deslocamentos ('Q').
+
+        Args:
+            chaves (bytes): As chaves codificadas em UTF-8.
+            deslocamentos (bytes): Os bytes do vetor de deslocamentos.
+            indices_pagina (bytes, optional): Os bytes do vetor ('I')
+            com o índice da Pagina de cada linha.
+            Valor padrão 'None' (todas na Pagina 0).
+
+        Returns:
+            TabelaColunar: A Tabela com as chaves.
+        """
+        tabela: TabelaColunar = TabelaColunar()
+        tabela.__chaves = bytearray(chaves)
+        tabela.__deslocamentos = array("Q")
+        tabela.__deslocamentos.frombytes(deslocamentos)
+        if indices_pagina is None:
+            indices_pagina = bytes(4 * (len(tabela.__deslocamentos) - 1))
+        tabela.__indices_pagina = array("I")
+        tabela.__indices_pagina.frombytes(indices_pagina)
+        tabela.__removidas = bytearray(len(tabela.__indices_pagina))
+        return tabela
+
+    def get_size(self) -> int:
+        """Retorna a quantidade de Tuplas na
+        Tabela.
+
+        Returns:
+            int: A qntd. de Tuplas na Tabela
+        """
+        return len(self.__indices_pagina) - self.__quantidade_removidas
+
+    def get_rows(self) -> Sequence[int]:
+        """Retorna as linhas não removidas, em ordem.
+
+        Após remoções, as linhas são montadas (O(n), a partir das marcas)
+        somente na primeira chamada, as inserções seguintes as atualizam.
+
+        Returns:
+            Sequence[int]: As linhas não removidas.
+        """
+        if self.__quantidade_removidas == 0:
+            return range(0, len(self.__indices_pagina))
+        if self.__linhas is None:
+            self.__linhas = array("I", compress(
+                range(0, len(self.__removidas)), self.__removidas.translate(self.INVERTE_MARCAS)
+            ))
+        return self.__linhas
+
+    def get_tuples(self) -> Sequence[Tupla]:
+        """Retorna TODAS as Tuplas (não removidas) armazenadas
+        nesta Tabela, criadas somente quando acessadas.
+
+        Returns:
+            Sequence[Tupla]: As Tuplas armazenadas
+            nesta Tabela.
+        """
+        return TuplasColunares(self, self.get_rows())
+
+    def get_tuple(self, linha: int) -> TuplaColunar:
+        """Retorna a Tupla de uma linha.
+
+        Args:
+            linha (int): A linha da Tupla.
+
+        Returns:
+            TuplaColunar: A Tupla da linha.
+        """
+        return TuplaColunar(self, linha)
+
+    def get_key(self, linha: int) -> str:
+        """Retorna a chave de uma linha.
+
+        Args:
+            linha (int): A linha da Tupla.
+
+        Returns:
+            str: A chave da Tupla.
+        """
+        return self.__chaves[self.__deslocamentos[linha]:self.__deslocamentos[linha + 1]]\
+            .decode("UTF-8")
+
+    def has_key(self, linha: int, chave: bytes) -> bool:
+        """Verifica se a chave de uma linha é igual a uma chave,
+        comparando dentro dos limites da linha, sem copiá-la.
+
+        Args:
+            linha (int): A linha da Tupla.
+            chave (bytes): A chave codificada em UTF-8.
+
+        Returns:
+            bool: Se as chaves são iguais.
+        """
+        inicio: int = self.__deslocamentos[linha]
+        return self.__deslocamentos[linha + 1] - inicio == len(chave) \
+            and self.__chaves.startswith(chave, inicio)
+
+    def get_page_index(self, linha: int) -> int:
+        """Retorna o índice da Pagina de uma linha.
+
+        Args:
+            linha (int): A linha da Tupla.
+
+        Returns:
+            int: O índice da Pagina.
+        """
+        return self.__indices_pagina[linha]
+
+    def set_page_index(self, linha: int, indice_pagina: int) -> None:
+        """Define o índice da Pagina de uma linha.
+
+        Args:
+            linha (int): A linha da Tupla.
+            indice_pagina (int): O índice da Pagina.
+        """
+        self.__indices_pagina[linha] = indice_pagina
+
+    def set_key(self, linha: int, chave: str | bytes) -> None:
+        """Substitui a chave de uma linha, deslocando as chaves
+        seguintes no buffer caso o tamanho mude.
+
+        Args:
+            linha (int): A linha da Tupla.
+            chave (str | bytes): A nova chave (ou seus bytes UTF-8).
+        """
+        if isinstance(chave, str):
+            chave = chave.encode("UTF-8")
+        inicio: int = self.__deslocamentos[linha]
+        fim: int = self.__deslocamentos[linha + 1]
+        self.__chaves[inicio:fim] = chave
+        self.__buffer_busca = None
+        diferenca: int = len(chave) - (fim - inicio)
+        if diferenca == 0:
+            return
+        if numpy is not None:
+            # Os deslocamentos nunca chegam a 2 ** 63, então cabem em 'int64'.
+            deslocamentos = numpy.frombuffer(self.__deslocamentos, dtype=numpy.int64)
+            deslocamentos[linha + 1:] += diferenca
+            return
+        self.__deslocamentos[linha + 1:] = array(
+            "Q", [deslocamento + diferenca for deslocamento in self.__deslocamentos[linha + 1:]]
+        )
+
+    def is_deleted(self, linha: int) -> bool:
+        """Verifica se uma linha foi removida.
+
+        Args:
+            linha (int): A linha da Tupla.
+
+        Returns:
+            bool: Se a linha foi removida.
+        """
+        return self.__removidas[linha] == 1
+
+    def get_packed_keys(self) -> Tuple[bytes, array]:
+        """Retorna o buffer das chaves e os deslocamentos, sem cópias
+        (ou uma cópia somente com as linhas não removidas).
+
+        Returns:
+            Tuple[bytes, array]: O buffer e os deslocamentos.
+        """
+        if self.__quantidade_removidas == 0:
+            return self.__chaves, self.__deslocamentos
+        chaves: List[bytes] = [
+            self.__chaves[self.__deslocamentos[i]:self.__deslocamentos[i + 1]]
+            for i in self.get_rows()
+        ]
+        deslocamentos: array = array("Q", [0])
+        deslocamentos.extend(accumulate(map(len, chaves)))
+        return b"".join(chaves), deslocamentos
+
+    def insert(self, tupla: Tupla) -> None:
+        """Insere uma Tupla na Tabela, copiando o seu dado
+        e o seu índice de Pagina para as colunas.
+
+        Args:
+            tupla (Tupla): A Tupla a ser inserida
+            na Tabela.
+        """
+        self.insert_key(tupla.get_data(), tupla.get_page_index())
+
+    def insert_key(self, chave: str | bytes, indice_pagina: int = 0) -> None:
+        """Insere uma chave na Tabela, sem criar uma Tupla.
+
+        Args:
+            chave (str | bytes): A chave (ou seus bytes UTF-8).
+            indice_pagina (int, optional): O índice da Pagina.
+            Valor padrão '0'.
+        """
+        if isinstance(chave, str):
+            chave = chave.encode("UTF-8")
+        self.__chaves += chave
+        self.__deslocamentos.append(len(self.__chaves))
+        self.__buffer_busca = None
+        self.__indices_pagina.append(indice_pagina)
+        self.__removidas.append(0)
+        if self.__linhas is not None:
+            self.__linhas.append(len(self.__indices_pagina) - 1)
+
+    def insert_keys(self, chaves: Iterable[bytes]) -> range:
+        """Insere várias chaves (bytes UTF-8) na Tabela de uma só vez.
+
+        Args:
+            chaves (Iterable[bytes]): As chaves a serem inseridas.
+
+        Returns:
+            range: As linhas ocupadas pelas novas chaves.
+        """
+        primeira_linha: int = len(self.__indices_pagina)
+        tamanho: int = len(self.__chaves)
+        self.__buffer_busca = None
+        for chave in chaves:
+            tamanho += len(chave)
+            self.__deslocamentos.append(tamanho)
+            self.__chaves += chave
+        quantidade: int = len(self.__deslocamentos) - 1 - primeira_linha
+        self.__indices_pagina.frombytes(bytes(4 * quantidade))
+        self.__removidas += bytes(quantidade)
+        if self.__linhas is not None:
+            self.__linhas.extend(range(primeira_linha, primeira_linha + quantidade))
+        return range(primeira_linha, primeira_linha + quantidade)
+
+    def delete(self, tupla: Tupla) -> bool:
+        """Remove (marca) a linha de uma Tupla da Tabela, em O(1): as
+        linhas não removidas são montadas depois, sob demanda.
+
+        Args:
+            tupla (Tupla): A Tupla (desta Tabela) a ser removida.
+
+        Returns:
+            bool: Se a Tupla estava na Tabela.
+        """
+        if not isinstance(tupla, TuplaColunar) or tupla != self.get_tuple(tupla.get_row()):
+            return False
+        linha: int = tupla.get_row()
+        if self.__removidas[linha] == 1:
+            return False
+        self.__removidas[linha] = 1
+        self.__quantidade_removidas += 1
+        self.__linhas = None
+        return True
+
+    def get_scan_buffer(self) -> bytes:
+        """Retorna as chaves separadas (e envolvidas) por '\\n',
+        montando o buffer caso alguma chave tenha sido alterada.
+
+        Returns:
+            bytes: O buffer, a chave 'i' começa na posição
+            'deslocamentos[i] + i + 1'.
+        """
+        if self.__buffer_busca is not None:
+            return self.__buffer_busca
+        quantidade: int = len(self.__indices_pagina)
+        if numpy is not None and quantidade > 0:
+            deslocamentos = numpy.frombuffer(self.__deslocamentos, dtype=numpy.int64)
+            # Cada byte da linha 'i' é deslocado 'i + 1' posições no buffer.
+            linhas = numpy.repeat(
+                numpy.arange(1, quantidade + 1, dtype=numpy.int64), numpy.diff(deslocamentos)
+            )
+            buffer = numpy.full(len(self.__chaves) + quantidade + 1, ord("\n"), numpy.uint8)
+            buffer[numpy.arange(len(self.__chaves), dtype=numpy.int64) + linhas] = \
+                numpy.frombuffer(self.__chaves, dtype=numpy.uint8)
+            self.__buffer_busca = buffer.tobytes()
+        else:
+            self.__buffer_busca = b"\n" + b"".join(
+                self.__chaves[self.__deslocamentos[i]:self.__deslocamentos[i + 1]] + b"\n"
+                for i in range(0, quantidade)
+            )
+        return self.__buffer_busca
+
+    def __get_row_at(self, posicao: int) -> int:
+        """Retorna a linha que contém uma posição do buffer do Table Scan.
+
+        Args:
+            posicao (int): A posição no buffer (ver 'get_scan_buffer()').
+
+        Returns:
+            int: A linha.
+        """
+        deslocamentos: array = self.__deslocamentos
+        linha: int = bisect_right(
+            range(0, len(self.__indices_pagina)), posicao,
+            key=lambda i: deslocamentos[i] + i + 1
+        ) - 1
+        return max(linha, 0)
+
+    def __matches(self, linha: int, chave: bytes, modo: str) -> bool:
+        """Verifica se a chave de uma linha corresponde ao dado procurado,
+        comparando dentro dos limites da linha, sem copiar a chave.
+
+        Args:
+            linha (int): A linha.
+            chave (bytes): O dado procurado (bytes UTF-8).
+            modo (str): 'exato', 'prefixo' ou 'substring'.
+
+        Returns:
+            bool: Se a chave corresponde.
+        """
+        if modo == Tabela.SCAN_EXATO:
+            return self.has_key(linha, chave)
+        inicio: int = self.__deslocamentos[linha]
+        fim: int = self.__deslocamentos[linha + 1]
+        if modo == Tabela.SCAN_PREFIXO:
+            return self.__chaves.startswith(chave, inicio, fim)
+        return self.__chaves.find(chave, inicio, fim) != -1
+
+    def __find_rows(self, chave: bytes, modo: str) -> Iterator[int]:
+        """Procura (com 'bytes.find()' no buffer do Table Scan) as
+        linhas não removidas cujas chaves correspondem ao dado.
+
+        Args:
+            chave (bytes): O dado procurado (bytes UTF-8).
+            modo (str): 'exato', 'prefixo' ou 'substring'.
+
+        Yields:
+            Iterator[int]: As linhas encontradas, em ordem.
+        """
+        quantidade: int = len(self.__indices_pagina)
+        if quantidade == 0:
+            return
+        buffer: bytes = self.get_scan_buffer()
+        if modo == Tabela.SCAN_EXATO:
+            padrao: bytes = b"\n" + chave + b"\n"
+        elif modo == Tabela.SCAN_PREFIXO:
+            padrao = b"\n" + chave
+        else:
+            padrao = chave
+        # Posição da chave dentro do padrão.
+        ajuste: int = 0 if modo == Tabela.SCAN_SUBSTRING else 1
+        # A próxima linha que pode ser retornada.
+        proxima: int = 0
+        posicao: int = buffer.find(padrao)
+        while posicao != -1:
+            linha: int = self.__get_row_at(posicao + ajuste)
+            if linha >= quantidade:
+                return
+            # A linha é verificada, pois as chaves podem conter '\n'.
+            if linha >= proxima and self.__removidas[linha] == 0 \
+                and self.__matches(linha, chave, modo):
+                yield linha
+                proxima = linha + 1
+                # Continua a partir do '\n' que antecede a próxima linha.
+                posicao = buffer.find(padrao, self.__deslocamentos[linha + 1] + linha + 1)
+            else:
+                posicao = buffer.find(padrao, posicao + 1)
+
+    def __get_position(self, linha: int) -> int:
+        """Retorna a posição de uma linha entre as linhas não removidas.
+
+        Args:
+            linha (int): A linha (não removida).
+
+        Returns:
+            int: A posição da linha.
+        """
+        if self.__quantidade_removidas == 0:
+            return linha
+        return bisect_left(self.get_rows(), linha)
+
+    def search_row(self, dado: str, modo: str = Tabela.SCAN_EXATO) -> Tuple[int, int]:
+        """Procura a primeira linha (não removida) que corresponde a um
+        dado, com 'bytes.find()' no buffer do Table Scan.
+
+        Args:
+            dado (str): O dado procurado.
+            modo (str, optional): 'exato', 'prefixo' ou 'substring'.
+            Valor padrão 'exato'.
+
+        Returns:
+            Tuple[int, int]: A linha e o índice da sua Pagina,
+            ou '(-1, -1)' caso não seja encontrado.
+
+        Raises:
+            ValueError: Caso o modo não exista.
+        """
+        if modo not in (Tabela.SCAN_EXATO, Tabela.SCAN_PREFIXO, Tabela.SCAN_SUBSTRING):
+            raise ValueError(f"Modo de Table Scan '{modo}' inexistente.")
+        for linha in self.__find_rows(dado.encode("UTF-8"), modo):
+            return linha, self.__indices_pagina[linha]
+        return -1, -1
+
+    @Instrumentacao.traced("table_scan")
+    def table_scan(self, dado: str, quantidade_busca: Optional[int] = None) -> Union[Sequence, None]:
+        """Realiza uma busca (Table Scan) de um dado, com 'bytes.find()'
+        no buffer do Table Scan (ver 'get_scan_buffer()').
+
+        Args:
+            dado (str): O dado a ser procurado na Tabela.
+            quantidade_busca (int, optional): A quantidade de Tuplas
+            a serem procuradas na Tabela, caso esse valor seja ultrapassado
+            a busca para.
+            Valor padrão é o tamanho da Tabela: get_size().
+
+        Returns:
+            Union[Sequence, None]: Retorna as Tuplas até o dado (sem
+            copiá-las, ver 'IntervaloTuplas'), caso seja encontrado ou nada.
+        """
+        # Qntd. de busca será a qntd. de Tuplas se nenhum valor for informado.
+        if quantidade_busca is None:
+            quantidade_busca = self.get_size()
+        # Qntd. inválida. (valores menores que 0 ou maiores que a qntd. de tuplas)
+        if 0 > quantidade_busca > self.get_size():
+            raise ValueError("Qntd. de busca inválido no Table Scan.")
+        linha, _ = self.search_row(dado)
+        if linha == -1:
+            return None
+        posicao: int = self.__get_position(linha)
+        if posicao >= quantidade_busca:
+            return None
+        return IntervaloTuplas(self.get_tuples(), posicao + 1)
+
+    def scan(self, dado: str, modo: str = Tabela.SCAN_EXATO, limite: Optional[int] = None,
+             quantidade_busca: Optional[int] = None) -> Iterator[Tupla]:
+        """Percorre a Tabela sob demanda (gerador), com 'bytes.find()'
+        no buffer do Table Scan (ver 'Tabela.scan()').
+
+        Args:
+            dado (str): O dado procurado.
+            modo (str, optional): 'exato', 'prefixo' ou 'substring'.
+            Valor padrão 'exato'.
+            limite (int, optional): A qntd. máxima de Tuplas retornadas.
+            Valor padrão 'None' (sem limite).
+            quantidade_busca (int, optional): A qntd. de Tuplas percorridas.
+            Valor padrão é o tamanho da Tabela: get_size().
+
+        Yields:
+            Iterator[Tupla]: As Tuplas encontradas, na ordem da Tabela.
+
+        Raises:
+            ValueError: Caso o modo não exista.
+        """
+        if modo not in (Tabela.SCAN_EXATO, Tabela.SCAN_PREFIXO, Tabela.SCAN_SUBSTRING):
+            raise ValueError(f"Modo de Table Scan '{modo}' inexistente.")
+        if limite is not None and limite <= 0:
+            return
+        encontradas: int = 0
+        for linha in self.__find_rows(dado.encode("UTF-8"), modo):
+            if quantidade_busca is not None and self.__get_position(linha) >= quantidade_busca:
+                return
+            yield TuplaColunar(self, linha)
+            encontradas += 1
+            if encontradas == limite:
+                return
@@ -0,0 +1,107 @@
+"""Representa uma Trava de Leitura e Escrita.
+Permite vários leitores simultâneos ou um único escritor,
+com preferência ao escritor (um escritor esperando impede
+novos leitores, evitando que ele espere para sempre).
+
+O escritor pode readquirir a Trava (para leitura ou escrita)
+dentro da própria escrita, permitindo compor operações.
+"""
+
+from contextlib import contextmanager
+from threading import Condition, Lock, get_ident
+from typing import Iterator
+
+class TravaLeituraEscrita:
+    """Representa uma Trava de Leitura e Escrita."""
+    # Condição usada por leitores e escritores.
+    __condicao: Condition
+    # A qntd. de leitores ativos.
+    __leitores: int
+    # Se há um escritor ativo e a qntd. de escritores esperando.
+    __escritor_ativo: bool
+    __escritores_esperando: int
+    # A thread do escritor ativo e quantas vezes ele readquiriu a Trava.
+    __dono: int
+    __profundidade: int
+
+    def __init__(self) -> None:
+        """Inicializa a Trava, sem leitores nem escritores."""
+        self.__condicao = Condition(Lock())
+        self.__leitores = 0
+        self.__escritor_ativo = False
+        self.__escritores_esperando = 0
+        self.__dono = 0
+        self.__profundidade = 0
+
+    def acquire_read(self) -> None:
+        """Adquire a Trava para leitura, esperando enquanto houver
+        um escritor ativo ou esperando.
+        """
+        if self.__dono == get_ident():
+            self.__profundidade += 1
+            return
+        with self.__condicao:
+            while self.__escritor_ativo or self.__escritores_esperando > 0:
+                self.__condicao.wait()
+            self.__leitores += 1
+
+    def release_read(self) -> None:
+        """Libera a Trava de leitura."""
+        if self.__dono == get_ident():
+            self.__profundidade -= 1
+            return
+        with self.__condicao:
+            self.__leitores -= 1
+            if self.__leitores == 0:
+                self.__condicao.notify_all()
+
+    def acquire_write(self) -> None:
+        """Adquire a Trava para escrita, esperando enquanto houver
+        leitores ou outro escritor ativos.
+        """
+        if self.__dono == get_ident():
+            self.__profundidade += 1
+            return
+        with self.__condicao:
+            self.__escritores_esperando += 1
+            while self.__escritor_ativo or self.__leitores > 0:
+                self.__condicao.wait()
+            self.__escritores_esperando -= 1
+            self.__escritor_ativo = True
+            self.__dono = get_ident()
+
+    def release_write(self) -> None:
+        """Libera a Trava de escrita."""
+        if self.__profundidade > 0:
+            self.__profundidade -= 1
+            return
+        with self.__condicao:
+            self.__dono = 0
+            self.__escritor_ativo = False
+            self.__condicao.notify_all()
+
+    @contextmanager
+    def read_lock(self) -> Iterator[None]:
+        """Adquire a Trava para leitura dentro de um bloco 'with'.
+
+        Yields:
+            Iterator[None]: Nada, a Trava é liberada ao sair do bloco.
+        """
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_lock(self) -> Iterator[None]:
+        """Adquire a Trava para escrita dentro de um bloco 'with'.
+
+        Yields:
+            Iterator[None]: Nada, a Trava é liberada ao sair do bloco.
+        """
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
@@ -7,10 +7,13 @@ from typing import Any
 
 class Tupla:
     """Representa a estrutura Tupla."""
+    # Sem '__dict__', reduzindo a memória de cada Tupla (e das subclasses).
+    __slots__ = ("__dado", "__indice_pagina")
+
     # Responsável pelo armazenamento dos registros.
     __dado: str
     # Aponta para o índice da Tabela na Pagina.
-    __indice_pagina: int = 0
+    __indice_pagina: int
 
     def __init__(self, dado: Any) -> None:
         """Cria uma Tupla com um dado qualquer.
@@ -19,6 +22,7 @@ class Tupla:
             dado (Any): O dado a ser armazenado na Tupla.
         """
         self.__dado = str(dado)
+        self.__indice_pagina = 0
 
     def get_data(self) -> str:
         """Retorna o dado contido em uma Tupla.
@@ -28,6 +32,28 @@ class Tupla:
         """
         return self.__dado
 
+    def has_key(self, chave: str, chave_bytes: bytes = None) -> bool:
+        """Verifica se a Tupla possui uma chave.
+
+        Args:
+            chave (str): A chave.
+            chave_bytes (bytes, optional): A chave codificada em UTF-8,
+            usada pelas Tuplas que armazenam somente os bytes.
+            Valor padrão 'None'.
+
+        Returns:
+            bool: Se o dado da Tupla é a chave.
+        """
+        return self.__dado == chave
+
+    def set_data(self, dado: Any) -> None:
+        """Substitui o dado contido em uma Tupla.
+
+        Args:
+            dado (Any): O novo dado da Tupla.
+        """
+        self.__dado = str(dado)
+
     def get_page_index(self) -> int:
         """Retorna o índice da Pagina associada
         nesta Tupla.
@@ -0,0 +1,8 @@
+"""Configuração dos testes: os módulos são importados a partir de 'src'
+(ex.: 'structs.Bucket'), da mesma forma que em 'Main.py'.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
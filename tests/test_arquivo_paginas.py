@@ -0,0 +1,67 @@
+"""Testes do Arquivo de Paginas (Slotted Pages em disco)."""
+
+from typing import List, Union
+
+import pytest
+
+# pylint: disable=import-error
+
+from structs.ArquivoPaginas import ArquivoPaginas
+from structs.Pagina import Pagina
+from structs.Tupla import Tupla
+
+def test_round_trip_reads_one_block_per_page(tmp_path) -> None:
+    """As Paginas gravadas (com lápides e chaves não ASCII) são lidas
+    de volta, um bloco por leitura.
+    """
+    paginas: List[List[Union[Tupla, None]]] = [
+        [Tupla("a"), None, Tupla("ção")], [], [Tupla("x" * 5000)]
+    ]
+    caminho = str(tmp_path / "paginas.bin")
+    ArquivoPaginas.write(caminho, paginas, 3)
+    arquivo = ArquivoPaginas(caminho)
+    try:
+        assert arquivo.get_page_count() == 3 and arquivo.get_page_fixed_size() == 3
+        # O bloco é o menor múltiplo de 4096 em que a maior Pagina cabe.
+        assert arquivo.get_block_size() == 8192
+        assert [arquivo.read_page(i) for i in range(0, 3)] == [["a", "ção"], [], ["x" * 5000]]
+        assert arquivo.get_read_count() == 3
+        assert arquivo.search("ção", 0) == ("ção", 1)
+        assert arquivo.search(Tupla("b"), 0) == (None, 1)
+        with pytest.raises(IndexError):
+            arquivo.read_block(3)
+    finally:
+        arquivo.close()
+
+def test_tombstones_and_invalid_files(tmp_path) -> None:
+    """Lápides exigem o arquivo aberto para escrita e um arquivo sem a
+    assinatura não é aceito.
+    """
+    caminho = str(tmp_path / "paginas.bin")
+    ArquivoPaginas.write(caminho, [[Tupla("a"), Tupla("b")]], 2)
+    arquivo = ArquivoPaginas(caminho)
+    with pytest.raises(ValueError):
+        arquivo.write_tombstone(0, 0)
+    arquivo.close()
+    arquivo = ArquivoPaginas(caminho, escrita=True)
+    arquivo.write_tombstone(0, 0)
+    with pytest.raises(IndexError):
+        arquivo.write_tombstone(0, 2)
+    assert arquivo.read_page(0) == ["b"]
+    arquivo.close()
+    invalido = tmp_path / "invalido.bin"
+    invalido.write_bytes(bytes(4096))
+    with pytest.raises(ValueError):
+        ArquivoPaginas(str(invalido))
+
+def test_pagina_search_reads_from_file(tmp_path) -> None:
+    """Após a gravação, as buscas da Pagina leem o Arquivo de Paginas."""
+    pagina = Pagina(10)
+    tuplas: List[Tupla] = [Tupla(f"k{i}") for i in range(0, 95)]
+    pagina.insert_tuples(tuplas)
+    arquivo = pagina.write_to_file(str(tmp_path / "paginas.bin"))
+    assert arquivo.get_page_count() == pagina.get_page_count() + 1
+    leituras: int = arquivo.get_read_count()
+    assert pagina.search(tuplas[57], tuplas[57].get_page_index()) == (tuplas[57], 1)
+    assert pagina.search(Tupla("ausente"), 0) == (None, -1)
+    assert arquivo.get_read_count() == leituras + 2
@@ -0,0 +1,394 @@
+"""Testes do BucketManager: Hash Linear, modo concorrente,
+estatísticas incrementais e busca em lote.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import random
+import threading
+from typing import Dict, List
+
+import pytest
+
+# pylint: disable=import-error
+
+from structs.Bucket import Bucket, BucketManager
+from structs.Instrumentacao import Instrumentacao
+from structs.TabelaColunar import TabelaColunar
+from structs.Tupla import Tupla
+
+def recount(gerenciador: BucketManager) -> Dict[str, object]:
+    """Recalcula as estatísticas percorrendo todas as cadeias.
+
+    Args:
+        gerenciador (BucketManager): Os Buckets.
+
+    Returns:
+        Dict[str, object]: As chaves, as colisões, os Overflows e o
+        histograma do comprimento das cadeias.
+    """
+    chaves: List[str] = []
+    histograma: Dict[int, int] = {}
+    for id_bucket in range(0, gerenciador.get_bucket_count()):
+        bucket = gerenciador.get_bucket_by_id(id_bucket)
+        comprimento: int = gerenciador.get_chain_length(id_bucket)
+        histograma[comprimento] = histograma.get(comprimento, 0) + 1
+        while bucket is not None:
+            chaves.extend(tupla.get_data() for tupla in bucket.get_data() if tupla is not None)
+            bucket = bucket.get_next_bucket()
+    quantidade: int = gerenciador.get_bucket_count()
+    return {
+        "chaves": chaves,
+        "colisoes": sum(gerenciador.get_collision_count(i) for i in range(0, quantidade)),
+        "overflows": sum(gerenciador.get_overflow_count(i) for i in range(0, quantidade)),
+        "histograma_cadeias": histograma
+    }
+
+def assert_statistics(gerenciador: BucketManager, esperadas: set) -> None:
+    """Compara as estatísticas incrementais com a recontagem.
+
+    Args:
+        gerenciador (BucketManager): Os Buckets.
+        esperadas (set): As chaves que devem estar nos Buckets.
+    """
+    contagem: Dict[str, object] = recount(gerenciador)
+    estatisticas: Dict[str, object] = gerenciador.get_statistics()
+    assert sorted(contagem["chaves"]) == sorted(esperadas)
+    assert estatisticas["tuplas"] == len(esperadas)
+    assert estatisticas["colisoes"] == contagem["colisoes"]
+    assert estatisticas["overflows"] == contagem["overflows"]
+    assert estatisticas["histograma_cadeias"] == contagem["histograma_cadeias"]
+
+@pytest.mark.parametrize("opcoes", [
+    {},
+    {"modo_linear": True},
+    {"filtro_bloom": BucketManager.FILTRO_GLOBAL},
+    {"filtro_bloom": BucketManager.FILTRO_POR_BUCKET, "indice_prefixo": True}
+])
+def test_concurrent_mixed_operations(opcoes: dict) -> None:
+    """Inserções, remoções, buscas e compactações simultâneas mantêm
+    as contagens e as estatísticas iguais às de uma recontagem.
+    """
+    gerenciador = BucketManager(2000, estrategia_hash="soma", concorrente=True, **opcoes)
+    quantidade_threads: int = 4
+    restantes: List[set] = [set() for _ in range(0, quantidade_threads)]
+    erros: List[str] = []
+
+    def worker(indice: int) -> None:
+        aleatorio = random.Random(indice)
+        try:
+            chaves: List[str] = [f"k{indice}_{i}" for i in range(0, 3000)]
+            for chave in chaves:
+                gerenciador.insert_data(Tupla(chave))
+            for chave in chaves[::2]:
+                assert gerenciador.delete_data(chave) is not None
+            for chave in chaves:
+                tupla, id_bucket = gerenciador.search_data(chave)
+                removida: bool = int(chave.rsplit("_", 1)[1]) % 2 == 0
+                assert (tupla is None) == removida and (id_bucket == -1) == removida
+            gerenciador.compact_chain(aleatorio.randrange(gerenciador.get_bucket_count()))
+            if indice == 0:
+                gerenciador.vacuum(8)
+            restantes[indice].update(chaves[1::2])
+        except Exception as erro:  # pylint: disable=broad-except
+            erros.append(repr(erro))
+
+    threads: List[threading.Thread] = [
+        threading.Thread(target=worker, args=(i,)) for i in range(0, quantidade_threads)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not erros
+    esperadas: set = set().union(*restantes)
+    assert_statistics(gerenciador, esperadas)
+    gerenciador.vacuum()
+    assert_statistics(gerenciador, esperadas)
+
+@pytest.mark.parametrize("concorrente", [True, False])
+def test_concurrent_tracing_counts(concorrente: bool) -> None:
+    """Com a Instrumentação ativa, nenhuma busca simultânea se perde,
+    mesmo sem nenhum BucketManager concorrente (a Trava da Instrumentação
+    não depende de um estado global ligado pelos Buckets).
+    """
+    gerenciador = BucketManager(1000, concorrente=concorrente)
+    for i in range(0, 1000):
+        gerenciador.insert_data(Tupla(f"k{i}"))
+    Instrumentacao.reset()
+    Instrumentacao.enable()
+    try:
+        def worker(indice: int) -> None:
+            for i in range(0, 1000):
+                gerenciador.search_data(f"k{(i + indice) % 1500}")
+        threads: List[threading.Thread] = [
+            threading.Thread(target=worker, args=(i,)) for i in range(0, 4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        Instrumentacao.disable()
+    assert Instrumentacao.get_histogram("busca").get_count() == 4000
+    assert Instrumentacao.get_counter("busca.sucessos") \
+        + Instrumentacao.get_counter("busca.falhas") == 4000
+    Instrumentacao.reset()
+
+@pytest.mark.parametrize("opcoes", [
+    {},
+    {"modo_linear": True},
+    {"filtro_bloom": BucketManager.FILTRO_GLOBAL},
+    {"filtro_bloom": BucketManager.FILTRO_POR_BUCKET}
+])
+def test_search_many_matches_search_data(opcoes: dict) -> None:
+    """A busca em lote retorna o mesmo que buscas individuais."""
+    tabela = TabelaColunar()
+    for i in range(0, 5000):
+        tabela.insert_key(f"chave{i}", i // 100)
+    gerenciador = BucketManager(tabela.get_size(), **opcoes)
+    gerenciador.insert_data_from_table(tabela)
+    for i in range(0, 5000, 7):
+        gerenciador.delete_data(tabela.get_key(i))
+    chaves: List[str] = [f"chave{i}" for i in range(0, 5500, 3)] + ["", "chave1"]
+    resultados = gerenciador.search_many(chaves)
+    assert len(resultados) == len(chaves)
+    for chave, (tupla, id_bucket, indice_pagina) in zip(chaves, resultados):
+        esperada, id_esperado = gerenciador.search_data(chave)
+        assert tupla == esperada and id_bucket == id_esperado
+        assert indice_pagina == (esperada.get_page_index() if esperada is not None else -1)
+
+def test_linear_hashing_grows_one_bucket_at_a_time() -> None:
+    """No Hash Linear cada split acrescenta um único Bucket, o fator de
+    carga nunca passa do máximo e cada Tupla fica no Bucket do seu endereço.
+    """
+    gerenciador = BucketManager(100, modo_linear=True, fator_carga_maximo=0.75)
+    inicial, _, _ = gerenciador.get_linear_state()
+    quantidade_anterior: int = gerenciador.get_bucket_count()
+    for i in range(0, 3000):
+        gerenciador.insert_data(Tupla(f"k{i}"))
+        assert gerenciador.get_load_factor() <= 0.75
+        assert gerenciador.get_bucket_count() - quantidade_anterior in (0, 1)
+        quantidade_anterior = gerenciador.get_bucket_count()
+    _, nivel, proximo_split = gerenciador.get_linear_state()
+    assert nivel > 0
+    assert gerenciador.get_bucket_count() == (inicial << nivel) + proximo_split
+    for id_bucket in range(0, gerenciador.get_bucket_count()):
+        bucket = gerenciador.get_bucket_by_id(id_bucket)
+        while bucket is not None:
+            for tupla in bucket.get_data():
+                if tupla is not None:
+                    assert gerenciador.get_bucket_id(tupla) == id_bucket
+            bucket = bucket.get_next_bucket()
+    assert_statistics(gerenciador, {f"k{i}" for i in range(0, 3000)})
+
+def test_linear_bulk_load_matches_single_inserts() -> None:
+    """A carga em massa no Hash Linear resulta nos mesmos Buckets que
+    a inserção uma a uma.
+    """
+    tabela = TabelaColunar()
+    tabela.insert_keys(f"k{i}".encode("UTF-8") for i in range(0, 2000))
+    em_massa = BucketManager(10, modo_linear=True)
+    em_massa.insert_data_from_table(tabela)
+    uma_a_uma = BucketManager(10, modo_linear=True)
+    for tupla in tabela.get_tuples():
+        uma_a_uma.insert_data(tupla)
+    assert em_massa.get_linear_state() == uma_a_uma.get_linear_state()
+    for id_bucket in range(0, em_massa.get_bucket_count()):
+        assert em_massa.get_chain_length(id_bucket) == uma_a_uma.get_chain_length(id_bucket)
+        linhas: List[List[int]] = [
+            [tupla.get_row() for tupla in gerenciador.get_bucket_by_id(id_bucket).get_data()
+             if tupla is not None]
+            for gerenciador in (em_massa, uma_a_uma)
+        ]
+        assert linhas[0] == linhas[1]
+    assert em_massa.get_statistics() == uma_a_uma.get_statistics()
+
+@pytest.mark.parametrize("com_numpy", [True, False])
+def test_partition_by_bucket_is_stable_counting_sort(monkeypatch, com_numpy: bool) -> None:
+    """O particionamento (com ou sem NumPy) agrupa as posições por Bucket,
+    mantendo a ordem original dentro de cada Bucket.
+    """
+    if not com_numpy:
+        monkeypatch.setattr("structs.Bucket.numpy", None)
+    else:
+        pytest.importorskip("numpy")
+    aleatorio = random.Random(3)
+    ids: List[int] = [aleatorio.randrange(50) for _ in range(0, 4000)]
+    inicios, registros = BucketManager.partition_by_bucket(ids, 60)
+    assert len(inicios) == 61 and inicios[-1] == len(ids)
+    for id_bucket in range(0, 60):
+        esperados: List[int] = [i for i, valor in enumerate(ids) if valor == id_bucket]
+        assert list(registros[inicios[id_bucket]:inicios[id_bucket + 1]]) == esperados
+    vazios = BucketManager.partition_by_bucket([], 4)
+    assert list(vazios[0]) == [0] * 5 and len(vazios[1]) == 0
+
+@pytest.mark.parametrize("com_numpy", [True, False])
+def test_bulk_load_matches_single_inserts(monkeypatch, com_numpy: bool) -> None:
+    """A carga em massa particionada resulta nas mesmas cadeias (mesma
+    ordem e mesmos Overflows) que a inserção uma a uma.
+    """
+    if not com_numpy:
+        monkeypatch.setattr("structs.Bucket.numpy", None)
+    tabela = TabelaColunar()
+    tabela.insert_keys(f"chave{i}".encode("UTF-8") for i in range(0, 3000))
+    em_massa = BucketManager(tabela.get_size())
+    em_massa.insert_data_from_table(tabela)
+    uma_a_uma = BucketManager(tabela.get_size())
+    for tupla in tabela.get_tuples():
+        uma_a_uma.insert_data(tupla)
+    for id_bucket in range(0, em_massa.get_bucket_count()):
+        linhas: List[List[int]] = []
+        for gerenciador in (em_massa, uma_a_uma):
+            bucket = gerenciador.get_bucket_by_id(id_bucket)
+            linhas.append([])
+            while bucket is not None:
+                linhas[-1].append([tupla.get_row() for tupla in bucket.get_data()])
+                bucket = bucket.get_next_bucket()
+        assert linhas[0] == linhas[1]
+    assert em_massa.get_statistics() == uma_a_uma.get_statistics()
+    assert_statistics(em_massa, {f"chave{i}" for i in range(0, 3000)})
+
+def walk_chain(bucket: Bucket) -> List[Bucket]:
+    """Percorre a cadeia a partir do seu primeiro Bucket.
+
+    Args:
+        bucket (Bucket): O primeiro Bucket da cadeia.
+
+    Returns:
+        List[Bucket]: Os Buckets da cadeia, em ordem.
+    """
+    cadeia: List[Bucket] = []
+    while bucket is not None:
+        cadeia.append(bucket)
+        bucket = bucket.get_next_bucket()
+    return cadeia
+
+def test_chain_tail_pointer_and_counters() -> None:
+    """O ponteiro para o último Bucket e os contadores da cadeia
+    acompanham inserções avulsas, em massa e remoções.
+    """
+    bucket = Bucket(0, 4)
+    tuplas: List[Tupla] = [Tupla(f"k{i}") for i in range(0, 23)]
+    for tupla in tuplas[:6]:
+        bucket.insert_data(tupla)
+    bucket.insert_data_bulk(tuplas[6:])
+    cadeia: List[Bucket] = walk_chain(bucket)
+    assert bucket.get_last_bucket() is cadeia[-1]
+    assert bucket.get_chain_length() == len(cadeia) == 6
+    assert [len(b.get_data()) for b in cadeia] == [4, 4, 4, 4, 4, 3]
+    assert [t for b in cadeia for t in b.get_data()] == tuplas
+    assert bucket.remove_data("k5") is tuplas[5]
+    assert bucket.remove_data("ausente") is None
+    assert bucket.get_chain_size() == 22 and bucket.get_tombstone_count() == 1
+    assert bucket.get_wasted_bucket_count() == 0
+
+def test_compact_frees_overflows_and_keeps_order() -> None:
+    """A compactação descarta as lápides, mantém a ordem das Tuplas e
+    libera os Buckets (Overflow) desnecessários.
+    """
+    bucket = Bucket(0, 4)
+    bucket.insert_data_bulk([Tupla(f"k{i}") for i in range(0, 20)])
+    for i in range(0, 20, 2):
+        bucket.remove_data(f"k{i}")
+    assert bucket.get_wasted_bucket_count() == 2
+    assert bucket.compact() == 2
+    cadeia: List[Bucket] = walk_chain(bucket)
+    assert bucket.get_last_bucket() is cadeia[-1] and bucket.get_chain_length() == 3
+    assert [t.get_data() for b in cadeia for t in b.get_data()] == [f"k{i}" for i in range(1, 20, 2)]
+    assert bucket.get_tombstone_count() == 0 and bucket.compact() == 0
+    bucket.insert_data(Tupla("nova"))
+    assert bucket.get_last_bucket().get_data()[-1].get_data() == "nova"
+
+def test_compact_chain_and_rebalance_update_statistics() -> None:
+    """Compactar uma cadeia ou rebalancear as piores mantém as
+    estatísticas iguais às de uma recontagem e as buscas corretas.
+    """
+    gerenciador = BucketManager(2000, estrategia_hash="soma")
+    chaves: List[str] = [f"k{i}" for i in range(0, 2000)]
+    for chave in chaves:
+        gerenciador.insert_data(Tupla(chave))
+    for chave in chaves[::3]:
+        gerenciador.delete_data(chave)
+    restantes: set = set(chaves) - set(chaves[::3])
+    pior: int = max(range(0, gerenciador.get_bucket_count()),
+                    key=lambda i: gerenciador.get_bucket_by_id(i).get_wasted_bucket_count())
+    desperdicio: int = gerenciador.get_bucket_by_id(pior).get_wasted_bucket_count()
+    assert desperdicio > 0
+    assert gerenciador.compact_chain(pior) == desperdicio
+    assert_statistics(gerenciador, restantes)
+    assert gerenciador.rebalance(0) == 0
+    assert gerenciador.rebalance() > 0
+    assert all(gerenciador.get_bucket_by_id(i).get_wasted_bucket_count() == 0
+               for i in range(0, gerenciador.get_bucket_count()))
+    assert_statistics(gerenciador, restantes)
+    for chave in chaves[::7]:
+        assert (gerenciador.search_data(chave)[0] is None) == (chave not in restantes)
+
+def test_match_chain_finds_first_occurrence() -> None:
+    """Cada chave procurada recebe a posição da sua primeira ocorrência
+    na cadeia, inclusive quando repetida na consulta.
+    """
+    cadeia: List[str] = ["a", "b", "a", "c"]
+    assert BucketManager.match_chain(cadeia, ["a", "c", "x", "a", "b"]) == [0, 3, -1, 0, 1]
+    assert BucketManager.match_chain([], ["a"]) == [-1]
+    assert BucketManager.match_chain(cadeia, []) == []
+
+@pytest.mark.parametrize("executor_tipo", [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_search_many_with_executor_matches_serial(executor_tipo: type) -> None:
+    """Distribuir os grupos de Buckets em um pool retorna o mesmo que a
+    busca em série, na ordem de entrada e com chaves repetidas.
+    """
+    gerenciador = BucketManager(3000, estrategia_hash="soma")
+    for i in range(0, 3000):
+        gerenciador.insert_data(Tupla(f"k{i}"))
+    chaves: List[str] = [f"k{i}" for i in range(0, 4000, 5)] + ["k10", "k10", "ausente"]
+    em_serie = gerenciador.search_many(chaves)
+    with executor_tipo(max_workers=2) as executor:
+        assert gerenciador.search_many(chaves, executor) == em_serie
+    assert em_serie[-3][0] is em_serie[-2][0] is gerenciador.search_data("k10")[0]
+    assert em_serie[-1] == (None, -1, -1)
+    assert gerenciador.search_many([]) == []
+
+@pytest.mark.parametrize("opcoes", [
+    {"estrategia_hash": "soma"},
+    {"estrategia_hash": "soma", "modo_linear": True}
+])
+def test_incremental_statistics_follow_every_operation(opcoes: dict) -> None:
+    """As estatísticas mantidas a cada operação (inserções, cargas em
+    massa, remoções, atualizações, limpezas, compactações e splits)
+    são iguais às de uma recontagem, inclusive os piores Buckets.
+    """
+    aleatorio = random.Random(11)
+    gerenciador = BucketManager(500, **opcoes)
+    esperadas: set = set()
+    for rodada in range(0, 8):
+        tabela = TabelaColunar()
+        tabela.insert_keys(f"r{rodada}_{i}".encode("UTF-8") for i in range(0, 300))
+        gerenciador.insert_data_from_table(tabela)
+        for i in range(0, 100):
+            gerenciador.insert_data(Tupla(f"a{rodada}_{i}"))
+        esperadas.update(f"r{rodada}_{i}" for i in range(0, 300))
+        esperadas.update(f"a{rodada}_{i}" for i in range(0, 100))
+        for chave in aleatorio.sample(sorted(esperadas), 120):
+            assert gerenciador.delete_data(chave) is not None
+            esperadas.remove(chave)
+        for chave in aleatorio.sample(sorted(esperadas), 20):
+            gerenciador.update_data(chave, f"{chave}_novo")
+            esperadas.remove(chave)
+            esperadas.add(f"{chave}_novo")
+        assert gerenciador.delete_data("ausente") is None
+        if rodada % 2 == 0:
+            gerenciador.vacuum(5)
+        else:
+            gerenciador.compact_chain(aleatorio.randrange(gerenciador.get_bucket_count()))
+        assert_statistics(gerenciador, esperadas)
+    contagem: Dict[str, object] = recount(gerenciador)
+    assert gerenciador.get_total_collision_count() == contagem["colisoes"]
+    assert gerenciador.get_total_overflow_count() == contagem["overflows"]
+    comprimentos: List[int] = sorted(
+        (gerenciador.get_chain_length(i) for i in range(0, gerenciador.get_bucket_count())),
+        reverse=True
+    )
+    assert [pior[1] for pior in gerenciador.get_worst_buckets(5)] == comprimentos[:5]
+    gerenciador.vacuum()
+    assert_statistics(gerenciador, esperadas)
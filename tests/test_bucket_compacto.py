@@ -0,0 +1,63 @@
+"""Testes dos Buckets Compactos (vetor contíguo)."""
+
+from typing import List
+
+# pylint: disable=import-error
+
+from structs.Bucket import BucketManager
+from structs.BucketCompacto import BucketCompacto
+from structs.TabelaColunar import TabelaColunar
+from structs.Tupla import Tupla
+
+def build(quantidade: int) -> TabelaColunar:
+    """Cria uma Tabela com 'quantidade' chaves."""
+    tabela = TabelaColunar()
+    tabela.insert_keys(f"chave{i}".encode("UTF-8") for i in range(0, quantidade))
+    return tabela
+
+def test_layout_matches_bucket_manager() -> None:
+    """Os Buckets Compactos têm a mesma distribuição (qntd. de Tuplas
+    e de Overflows por Bucket) que o BucketManager.
+    """
+    tabela: TabelaColunar = build(5000)
+    compacto = BucketCompacto(tabela.get_size())
+    compacto.insert_data_from_table(tabela)
+    gerenciador = BucketManager(tabela.get_size())
+    gerenciador.insert_data_from_table(tabela)
+    assert compacto.get_bucket_count() == gerenciador.get_bucket_count()
+    for id_bucket in range(0, compacto.get_bucket_count()):
+        assert compacto.get_overflow_count(id_bucket) == gerenciador.get_overflow_count(id_bucket)
+        assert compacto.get_collision_count(id_bucket) == gerenciador.get_collision_count(id_bucket)
+    assert compacto.get_dispersion_percentage() == gerenciador.get_dispersion_percentage()
+
+def test_ranges_and_pages_cover_every_record() -> None:
+    """Os intervalos dos Buckets são contíguos e as páginas de cada
+    Bucket cobrem o seu intervalo.
+    """
+    tabela: TabelaColunar = build(3000)
+    compacto = BucketCompacto(tabela.get_size())
+    compacto.insert_data_from_table(tabela)
+    fim_anterior: int = 0
+    for id_bucket in range(0, compacto.get_bucket_count()):
+        inicio, fim = compacto.get_range(id_bucket)
+        assert inicio == fim_anterior
+        paginas: List[tuple] = [
+            compacto.get_page_range(id_bucket, i) for i in range(0, compacto.get_chain_length(id_bucket))
+        ]
+        assert paginas[0][0] == inicio and paginas[-1][1] == fim
+        assert all(pagina[1] - pagina[0] <= compacto.get_bucket_capacity() for pagina in paginas)
+        fim_anterior = fim
+    assert fim_anterior == tabela.get_size()
+
+def test_pending_inserts_until_compact() -> None:
+    """As inserções avulsas são encontradas antes e depois da compactação."""
+    tabela: TabelaColunar = build(100)
+    compacto = BucketCompacto(tabela.get_size())
+    compacto.insert_data_from_table(tabela)
+    compacto.insert_data(Tupla("nova"))
+    tupla, id_bucket = compacto.search_data("nova")
+    assert tupla.get_data() == "nova"
+    compacto.compact()
+    assert compacto.search_data(Tupla("nova")) == (tupla, id_bucket)
+    assert compacto.search_data("chave42")[0].get_data() == "chave42"
+    assert compacto.search_data("ausente") == (None, -1)
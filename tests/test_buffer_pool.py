@@ -0,0 +1,90 @@
+"""Testes do Buffer Pool (políticas LRU e Clock)."""
+
+from typing import List
+
+import pytest
+
+# pylint: disable=import-error
+
+from structs.ArquivoPaginas import ArquivoPaginas
+from structs.BufferPool import BufferPool
+from structs.Tupla import Tupla
+
+@pytest.fixture(name="arquivo")
+def fixture_arquivo(tmp_path):
+    """Um Arquivo de Paginas com 6 Paginas de 2 registros."""
+    caminho = str(tmp_path / "paginas.bin")
+    ArquivoPaginas.write(
+        caminho, [[Tupla(f"p{i}a"), Tupla(f"p{i}b")] for i in range(0, 6)], 2
+    )
+    arquivo = ArquivoPaginas(caminho, escrita=True)
+    yield arquivo
+    arquivo.close()
+
+def access(buffer_pool: BufferPool, indices: List[int]) -> None:
+    """Fixa e libera cada Pagina, na ordem."""
+    for indice_pagina in indices:
+        buffer_pool.pin_page(indice_pagina)
+        buffer_pool.unpin_page(indice_pagina)
+
+def test_lru_evicts_least_recently_used(arquivo: ArquivoPaginas) -> None:
+    """O LRU substitui a Pagina usada há mais tempo."""
+    buffer_pool = BufferPool(arquivo, 3, BufferPool.POLITICA_LRU)
+    access(buffer_pool, [0, 1, 2, 0, 3])
+    assert buffer_pool.get_miss_count() == 4 and buffer_pool.get_hit_count() == 1
+    assert buffer_pool.get_eviction_count() == 1
+    leituras: int = arquivo.get_read_count()
+    # A Pagina 1 foi substituída, a 0 continua em memória.
+    access(buffer_pool, [0])
+    assert arquivo.get_read_count() == leituras
+    access(buffer_pool, [1])
+    assert arquivo.get_read_count() == leituras + 1
+
+def test_clock_gives_second_chance(arquivo: ArquivoPaginas) -> None:
+    """O Clock poupa as Paginas referenciadas desde a última passada."""
+    buffer_pool = BufferPool(arquivo, 3, BufferPool.POLITICA_CLOCK)
+    access(buffer_pool, [0, 1, 2, 3])
+    # Todos referenciados: o ponteiro dá a volta e substitui a Pagina 0.
+    leituras: int = arquivo.get_read_count()
+    access(buffer_pool, [1, 2, 3])
+    assert arquivo.get_read_count() == leituras
+    access(buffer_pool, [0])
+    assert arquivo.get_read_count() == leituras + 1
+    assert buffer_pool.get_hit_ratio() == pytest.approx(3 / 8)
+
+@pytest.mark.parametrize("politica", [BufferPool.POLITICA_LRU, BufferPool.POLITICA_CLOCK])
+def test_pinned_pages_are_never_evicted(arquivo: ArquivoPaginas, politica: str) -> None:
+    """Paginas fixadas não são substituídas nem descartadas, e uma
+    leitura que falha não altera os quadros.
+    """
+    buffer_pool = BufferPool(arquivo, 2, politica)
+    assert buffer_pool.pin_page(0) == ["p0a", "p0b"]
+    buffer_pool.pin_page(1)
+    with pytest.raises(RuntimeError):
+        buffer_pool.pin_page(2)
+    with pytest.raises(ValueError):
+        buffer_pool.invalidate_page(0)
+    buffer_pool.unpin_page(1)
+    with pytest.raises(IndexError):
+        buffer_pool.pin_page(99)
+    access(buffer_pool, [2])
+    assert buffer_pool.pin_page(0) == ["p0a", "p0b"]
+    assert buffer_pool.get_hit_count() == 1
+    with pytest.raises(ValueError):
+        buffer_pool.unpin_page(5)
+
+def test_invalidate_rereads_after_write(arquivo: ArquivoPaginas) -> None:
+    """Após uma escrita no arquivo, a Pagina descartada é relida."""
+    buffer_pool = BufferPool(arquivo, 2)
+    access(buffer_pool, [0])
+    arquivo.write_tombstone(0, 0)
+    assert buffer_pool.invalidate_page(0)
+    assert not buffer_pool.invalidate_page(0)
+    assert buffer_pool.pin_page(0) == ["p0b"]
+
+def test_invalid_configuration(arquivo: ArquivoPaginas) -> None:
+    """Qntd. de quadros ou política inválidas geram ValueError."""
+    with pytest.raises(ValueError):
+        BufferPool(arquivo, 0)
+    with pytest.raises(ValueError):
+        BufferPool(arquivo, 2, "fifo")
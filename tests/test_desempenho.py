@@ -0,0 +1,38 @@
+"""Testes do Benchmark de desempenho (execução reduzida)."""
+
+from typing import Any, Dict, List
+
+import pytest
+
+# pylint: disable=import-error
+
+from benchmarks.Desempenho import COLUNAS_RESUMO, format_summary, run_suite
+from benchmarks.Geradores import GERADORES
+
+@pytest.mark.parametrize("gerador", list(GERADORES))
+def test_generators_are_deterministic(gerador: str) -> None:
+    """Cada gerador retorna a qntd. pedida de chaves e a mesma
+    sequência para a mesma semente.
+    """
+    chaves: List[str] = GERADORES[gerador](500, 1)
+    assert len(chaves) == 500
+    assert GERADORES[gerador](500, 1) == chaves
+
+def test_suite_reports_every_summary_column() -> None:
+    """Uma execução pequena de todos os geradores preenche as colunas
+    da tabela resumo, com uma linha por configuração.
+    """
+    resultados: List[Dict[str, Any]] = run_suite(
+        list(GERADORES), [300], consultas=50, varreduras=4, tamanho_pagina=16
+    )
+    assert [resultado["gerador"] for resultado in resultados] == list(GERADORES)
+    for resultado in resultados:
+        assert all(chave in resultado for _, chave, _, _ in COLUNAS_RESUMO)
+        assert resultado["construcao_total"] >= resultado["construcao_buckets"] > 0
+        assert resultado["maior_cadeia"] >= 1
+    assert len(format_summary(resultados).splitlines()) == len(resultados) + 1
+
+def test_unknown_generator_raises() -> None:
+    """Um gerador inexistente gera ValueError."""
+    with pytest.raises(ValueError):
+        run_suite(["inexistente"], [10])
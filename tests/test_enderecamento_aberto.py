@@ -0,0 +1,81 @@
+"""Testes do Endereçamento Aberto (Robin Hood e Cuckoo)."""
+
+import pytest
+
+# pylint: disable=import-error
+
+from structs.EnderecamentoAberto import EnderecamentoAberto
+from structs.Tupla import Tupla
+
+@pytest.mark.parametrize("modo", [EnderecamentoAberto.MODO_ROBIN_HOOD, EnderecamentoAberto.MODO_CUCKOO])
+def test_insert_and_search(modo: str) -> None:
+    """Todas as chaves inseridas são encontradas, as demais não."""
+    tabela = EnderecamentoAberto(100, modo=modo)
+    for i in range(0, 2000):
+        tabela.insert_data(Tupla(f"k{i}"))
+    assert tabela.get_data_size() == 2000
+    for i in range(0, 2000):
+        assert tabela.search_data(f"k{i}")[0].get_data() == f"k{i}"
+    assert tabela.search_data("ausente") == (None, -1)
+
+def test_cuckoo_duplicate_keys_terminate() -> None:
+    """Chaves repetidas no Cuckoo vão para o estoque em vez de
+    deslocar entradas para sempre.
+    """
+    tabela = EnderecamentoAberto(10, modo=EnderecamentoAberto.MODO_CUCKOO)
+    for _ in range(0, 1000):
+        tabela.insert_data(Tupla("repetida"))
+    assert tabela.get_data_size() == 1000
+    assert tabela.get_stash_size() == 998
+    assert tabela.search_data("repetida")[0].get_data() == "repetida"
+    tabela.insert_data(Tupla("outra"))
+    assert tabela.search_data("outra")[0].get_data() == "outra"
+
+def test_cuckoo_requires_two_strategies() -> None:
+    """O Cuckoo não aceita a mesma estratégia duas vezes."""
+    with pytest.raises(ValueError):
+        EnderecamentoAberto(10, estrategia_hash="fnv1a", modo=EnderecamentoAberto.MODO_CUCKOO,
+                            estrategia_secundaria="fnv1a")
+
+def test_cuckoo_stash_hits_have_positions_and_probe_lengths() -> None:
+    """As entradas do estoque têm posições após as da tabela e
+    entram na distribuição do comprimento de sondagem.
+    """
+    tabela = EnderecamentoAberto(10, modo=EnderecamentoAberto.MODO_CUCKOO)
+    for _ in range(0, 5):
+        tabela.insert_data(Tupla("repetida"))
+    tabela.insert_data(Tupla("outra"))
+    assert tabela.get_stash_size() == 3
+    tupla, posicao = tabela.search_data(Tupla("repetida"))
+    assert tupla.get_data() == "repetida" and 0 <= posicao < tabela.get_slot_count()
+    distribuicao = tabela.get_probe_length_distribution()
+    assert sum(distribuicao.values()) == tabela.get_data_size() == 6
+    assert {3, 4, 5} <= set(distribuicao)
+
+def test_cuckoo_stash_position_after_table() -> None:
+    """Uma chave que ficou somente no estoque (três chaves com as
+    mesmas duas posições) retorna a posição 'get_slot_count() + i'.
+    """
+    tabela = EnderecamentoAberto(10, modo=EnderecamentoAberto.MODO_CUCKOO)
+    chaves = ["c22", "c109", "c114"]
+    for chave in chaves:
+        tabela.insert_data(Tupla(chave))
+    assert tabela.get_stash_size() == 1
+    posicoes = [tabela.search_data(chave)[1] for chave in chaves]
+    assert sorted(posicoes)[-1] == tabela.get_slot_count()
+    assert all(0 <= posicao < tabela.get_slot_count() for posicao in sorted(posicoes)[:2])
+    assert tabela.get_probe_length_distribution() == {1: 1, 2: 1, 3: 1}
+
+@pytest.mark.parametrize("modo", [EnderecamentoAberto.MODO_ROBIN_HOOD, EnderecamentoAberto.MODO_CUCKOO])
+def test_resize_keeps_every_entry(modo: str) -> None:
+    """Crescer a tabela (inclusive repetidamente) reposiciona todas as
+    entradas, sem perder nem duplicar nenhuma.
+    """
+    tabela = EnderecamentoAberto(1, modo=modo)
+    for i in range(0, 5000):
+        tabela.insert_data(Tupla(f"k{i % 2500}"))
+    assert tabela.get_data_size() == 5000
+    assert sum(tabela.get_probe_length_distribution().values()) == 5000
+    assert tabela.get_load_factor() <= 0.85
+    for i in range(0, 2500):
+        assert tabela.search_data(f"k{i}")[0].get_data() == f"k{i}"
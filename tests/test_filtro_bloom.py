@@ -0,0 +1,84 @@
+"""Testes do Filtro de Bloom, isolado e na frente dos Buckets."""
+
+import threading
+from typing import List
+
+import pytest
+
+# pylint: disable=import-error
+
+from structs.Bucket import BucketManager
+from structs.FiltroBloom import FiltroBloom
+from structs.Tupla import Tupla
+
+def test_no_false_negatives_and_rate() -> None:
+    """Nenhum elemento inserido é descartado e a taxa de falsos
+    positivos fica próxima da desejada.
+    """
+    filtro = FiltroBloom(10000, 0.01)
+    for i in range(0, 10000):
+        filtro.add(f"k{i}")
+    assert all(filtro.might_contain(f"k{i}") for i in range(0, 10000))
+    falsos: int = sum(filtro.might_contain(f"ausente{i}") for i in range(0, 20000))
+    assert falsos / 20000 < 0.02
+    assert not filtro.is_full()
+
+def test_resize_after_capacity() -> None:
+    """O Filtro reporta quando passa da capacidade e volta a ter
+    espaço após o redimensionamento.
+    """
+    filtro = FiltroBloom(100, 0.01)
+    for i in range(0, 101):
+        filtro.add(f"k{i}")
+    assert filtro.is_full()
+    filtro.resize(1000)
+    assert filtro.get_capacity() == 1000 and filtro.get_insert_count() == 0
+    assert not filtro.is_full()
+
+def test_invalid_rate() -> None:
+    """A taxa de falsos positivos deve estar entre 0 e 1."""
+    with pytest.raises(ValueError):
+        FiltroBloom(10, 1.0)
+
+@pytest.mark.parametrize("modo", [BucketManager.FILTRO_GLOBAL, BucketManager.FILTRO_POR_BUCKET])
+def test_bucket_filter_grows_with_inserts(modo: str) -> None:
+    """Inserindo muito além da qntd. informada, o(s) Filtro(s) crescem:
+    nenhuma chave é perdida e os falsos positivos continuam raros.
+    """
+    gerenciador = BucketManager(100, filtro_bloom=modo)
+    for i in range(0, 20000):
+        gerenciador.insert_data(Tupla(f"k{i}"))
+    assert all(gerenciador.search_data(f"k{i}")[0] is not None for i in range(0, 20000))
+    for i in range(0, 20000):
+        assert gerenciador.search_data(f"ausente{i}") == (None, -1)
+    estatisticas = gerenciador.get_bloom_filter_stats()
+    assert estatisticas["falsos_positivos"] / 20000 < 0.02
+
+def test_concurrent_rebuilds_keep_keys_and_counts() -> None:
+    """Buscas simultâneas às reconstruções dos Filtros por Bucket nunca
+    perdem uma chave já inserida nem contagens de consultas.
+    """
+    gerenciador = BucketManager(50, filtro_bloom=BucketManager.FILTRO_POR_BUCKET,
+                                concorrente=True)
+    for i in range(0, 200):
+        gerenciador.insert_data(Tupla(f"base{i}"))
+    erros: List[str] = []
+
+    def reader() -> None:
+        for _ in range(0, 20):
+            for i in range(0, 200):
+                if gerenciador.search_data(f"base{i}")[0] is None:
+                    erros.append(f"base{i}")
+
+    def writer() -> None:
+        for i in range(0, 5000):
+            gerenciador.insert_data(Tupla(f"nova{i}"))
+
+    threads: List[threading.Thread] = [threading.Thread(target=reader) for _ in range(0, 3)]
+    threads.append(threading.Thread(target=writer))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not erros
+    assert gerenciador.get_bloom_filter_stats()["consultas"] == 3 * 20 * 200
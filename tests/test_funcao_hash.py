@@ -0,0 +1,70 @@
+"""Testes da Função Hash (estratégias e cálculo em lote)."""
+
+from array import array
+from typing import List
+
+import pytest
+
+# pylint: disable=import-error
+
+from structs.FuncaoHash import FuncaoHash
+from structs.Tupla import Tupla
+
+@pytest.mark.parametrize("chave, esperado", [
+    ("", 0xcbf29ce484222325),
+    ("a", 0xaf63dc4c8601ec8c),
+    ("foobar", 0x85944171f73967e8)
+])
+def test_fnv1a_reference_vectors(chave: str, esperado: int) -> None:
+    """FNV-1a (64 bits) segue os vetores de referência."""
+    assert FuncaoHash.fnv1a(chave) == esperado
+
+@pytest.mark.parametrize("tamanho, esperado", [
+    (0, 0x726fdb47dd0e0e31),
+    (1, 0x74f839c593dc67fd),
+    (8, 0x93f5f5799a932462),
+    (15, 0xa129ca6149be45e5)
+])
+def test_siphash_reference_vectors(tamanho: int, esperado: int) -> None:
+    """SipHash-2-4 (chave 00..0f, mensagem 00..tamanho-1) segue os
+    vetores de referência.
+    """
+    assert FuncaoHash.siphash("".join(map(chr, range(0, tamanho)))) == esperado
+
+def test_strategies_by_name() -> None:
+    """As estratégias são selecionadas pelo nome, um nome inexistente
+    gera ValueError e a estratégia padrão continua sendo a 'soma'.
+    """
+    assert set(FuncaoHash.get_strategies()) >= {"soma", "fnv1a", "polinomial", "siphash"}
+    assert FuncaoHash.hash_value(Tupla("abc")) == ord("a") + ord("b") + ord("c")
+    with pytest.raises(ValueError):
+        FuncaoHash.get_strategy("inexistente")
+    for estrategia in FuncaoHash.get_strategies():
+        valor: int = FuncaoHash.hash_value("chave", estrategia)
+        assert 0 <= valor < 1 << 64
+        assert FuncaoHash.hash_function("chave", 97, estrategia) == valor % 97
+
+CHAVES: List[str] = ["", "a", "ab", "chave", "ção", "日本語", "x" * 40, "anagrama", "amargana"]
+
+@pytest.mark.parametrize("estrategia", FuncaoHash.get_strategies())
+def test_batch_matches_single_values(estrategia: str) -> None:
+    """O cálculo em lote (vetorizado ou não) produz os mesmos valores
+    e índices que o cálculo chave a chave, inclusive com chaves vazias,
+    não ASCII e de tamanhos diferentes.
+    """
+    buffer, deslocamentos = FuncaoHash.pack_keys([Tupla(chave) for chave in CHAVES])
+    esperados: List[int] = [FuncaoHash.hash_value(chave, estrategia) for chave in CHAVES]
+    for vetorizado in (True, False):
+        assert FuncaoHash.hash_values_packed(buffer, deslocamentos, estrategia, vetorizado) \
+            == esperados
+        assert FuncaoHash.hash_batch(CHAVES, 13, estrategia, vetorizado) \
+            == [valor % 13 for valor in esperados]
+    # Deslocamentos de 32 bits (ex.: de uma Tabela) também são aceitos.
+    assert FuncaoHash.hash_values_packed(buffer, array("I", deslocamentos), estrategia) \
+        == esperados
+
+def test_pack_keys_offsets() -> None:
+    """Os deslocamentos são em bytes UTF-8, não em caracteres."""
+    buffer, deslocamentos = FuncaoHash.pack_keys(["a", "ção", ""])
+    assert buffer == "ação".encode("UTF-8")
+    assert list(deslocamentos) == [0, 1, 6, 6]
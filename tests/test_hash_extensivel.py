@@ -0,0 +1,72 @@
+"""Testes do Hash Extensível (divisões e diretório)."""
+
+from typing import List
+
+import pytest
+
+# pylint: disable=import-error
+
+from benchmarks.Geradores import anagram_keys
+from structs.HashExtensivel import HashExtensivel
+from structs.Tupla import Tupla
+
+def assert_directory(indice_hash: HashExtensivel) -> None:
+    """Cada entrada do diretório aponta para um Bucket cuja profundidade
+    local é no máximo a global, e as entradas que compartilham os bits
+    da profundidade local apontam para o mesmo Bucket.
+    """
+    profundidade_global: int = indice_hash.get_global_depth()
+    assert indice_hash.get_directory_size() == 1 << profundidade_global
+    for indice in range(0, indice_hash.get_directory_size()):
+        profundidade: int = indice_hash.get_local_depth(indice)
+        assert profundidade <= profundidade_global
+        base: int = indice & ((1 << profundidade) - 1)
+        assert indice_hash.get_bucket_by_id(indice) is indice_hash.get_bucket_by_id(base)
+
+@pytest.mark.parametrize("estrategia", ["soma", "fnv1a"])
+def test_insert_splits_and_search(estrategia: str) -> None:
+    """As divisões mantêm o diretório consistente e todas as chaves
+    continuam encontradas.
+    """
+    chaves: List[str] = [f"chave{i}" for i in range(0, 5000)]
+    indice_hash = HashExtensivel(len(chaves), estrategia)
+    for chave in chaves:
+        indice_hash.insert_data(Tupla(chave))
+    assert indice_hash.get_split_count() > 0
+    assert indice_hash.get_directory_doubling_count() == indice_hash.get_global_depth()
+    assert_directory(indice_hash)
+    for chave in chaves:
+        assert indice_hash.search_data(chave)[0].get_data() == chave
+    assert indice_hash.search_data("ausente") == (None, -1)
+
+def test_duplicates_go_to_overflow_without_doubling() -> None:
+    """Chaves repetidas nunca seriam separadas, vão para Overflows
+    sem dividir Buckets nem dobrar o diretório.
+    """
+    indice_hash = HashExtensivel(100)
+    for _ in range(0, 1000):
+        indice_hash.insert_data(Tupla("repetida"))
+    assert indice_hash.get_global_depth() == 0
+    assert indice_hash.get_split_count() == 0
+    assert indice_hash.get_overflow_count(0) > 0
+    indice_hash.insert_data(Tupla("outra"))
+    assert indice_hash.search_data("outra")[0].get_data() == "outra"
+    assert indice_hash.search_data("repetida")[0].get_data() == "repetida"
+    assert_directory(indice_hash)
+
+def test_anagrams_with_sum_strategy_stay_shallow() -> None:
+    """Anagramas têm o mesmo valor hash na estratégia 'soma', o diretório
+    não chega à profundidade máxima por causa deles.
+    """
+    chaves: List[str] = anagram_keys(5000)
+    indice_hash = HashExtensivel(len(chaves), "soma")
+    for chave in chaves:
+        indice_hash.insert_data(Tupla(chave))
+    assert indice_hash.get_global_depth() < 12
+    assert_directory(indice_hash)
+    for chave in chaves[::7]:
+        assert indice_hash.search_data(chave)[0].get_data() == chave
+
+def test_default_strategy_is_fnv1a() -> None:
+    """A estratégia padrão não é a 'soma'."""
+    assert HashExtensivel(10).get_hash_strategy() == "fnv1a"
@@ -0,0 +1,86 @@
+"""Testes do Arquivo de Índice (mapeado em memória)."""
+
+from typing import List
+
+import pytest
+
+# pylint: disable=import-error
+
+from structs.Bucket import BucketManager
+from structs.IndiceArquivo import IndiceArquivo
+from structs.LeitorArquivo import LeitorArquivo
+from structs.Pagina import Pagina
+from structs.TabelaColunar import TabelaColunar
+import Main
+
+CHAVES: List[str] = [f"chave{i}" for i in range(0, 2000)]
+
+def build(tmp_path) -> tuple:
+    """Carrega as chaves em uma Tabela, Paginas e Buckets."""
+    caminho = tmp_path / "entrada.txt"
+    caminho.write_text("\n".join(CHAVES) + "\n", encoding="UTF-8")
+    leitor = LeitorArquivo(str(caminho))
+    bucket = BucketManager(leitor.count_lines())
+    tabela: TabelaColunar = leitor.load(TabelaColunar(), Pagina(64), bucket)
+    return str(caminho), bucket, tabela
+
+def test_round_trip_keeps_rows_and_page_indices(tmp_path) -> None:
+    """O índice gravado encontra as mesmas linhas e preserva os
+    índices das Paginas.
+    """
+    origem, bucket, tabela = build(tmp_path)
+    caminho = str(tmp_path / "entrada.idx")
+    IndiceArquivo.write(caminho, bucket, tabela, origem)
+    assert IndiceArquivo.is_up_to_date(caminho, origem)
+    indice = IndiceArquivo(caminho)
+    try:
+        for chave in CHAVES[::37]:
+            tupla, id_bucket = indice.search_data(chave)
+            esperada, id_esperado = bucket.search_data(chave)
+            assert tupla.get_data() == chave and id_bucket == id_esperado
+            assert tupla.get_page_index() == esperada.get_page_index()
+        assert indice.search_data("ausente") == (None, -1)
+        assert indice.get_table().get_page_index(len(CHAVES) - 1) == (len(CHAVES) - 1) // 64
+    finally:
+        indice.close()
+
+def test_write_skips_deleted_rows(tmp_path) -> None:
+    """As linhas removidas não são gravadas e as demais são mapeadas
+    pela sua linha, não pela igualdade das Tuplas.
+    """
+    tabela = TabelaColunar()
+    tabela.insert_keys([b"a", b"b", b"c", b"d"])
+    bucket = BucketManager(4)
+    bucket.insert_data_from_table(tabela)
+    removida = tabela.get_tuple(1)
+    bucket.delete_data(removida)
+    tabela.delete(removida)
+    caminho = str(tmp_path / "entrada.idx")
+    IndiceArquivo.write(caminho, bucket, tabela)
+    indice = IndiceArquivo(caminho)
+    try:
+        assert indice.get_table().get_size() == 3
+        assert [indice.search_row(chave)[0] for chave in "abcd"] == [0, -1, 1, 2]
+    finally:
+        indice.close()
+
+@pytest.mark.parametrize("corromper", [
+    lambda dados: b"",
+    lambda dados: dados[:len(dados) // 2],
+    lambda dados: dados[:-1] + bytes([dados[-1] ^ 0xFF]),
+])
+def test_corrupt_file_raises_and_open_index_rebuilds(tmp_path, corromper) -> None:
+    """Um arquivo truncado ou corrompido gera ValueError e
+    'open_index()' o reconstrói.
+    """
+    origem, bucket, tabela = build(tmp_path)
+    caminho = tmp_path / "entrada.idx"
+    IndiceArquivo.write(str(caminho), bucket, tabela, origem)
+    caminho.write_bytes(corromper(caminho.read_bytes()))
+    with pytest.raises(ValueError):
+        IndiceArquivo(str(caminho))
+    indice = Main.open_index(origem, str(caminho))
+    try:
+        assert indice.search_data(CHAVES[123])[0].get_data() == CHAVES[123]
+    finally:
+        indice.close()
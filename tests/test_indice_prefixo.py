@@ -0,0 +1,80 @@
+"""Testes do Índice de Prefixos (busca por prefixo e autocompletar)."""
+
+import random
+from typing import List, Tuple
+
+# pylint: disable=import-error
+
+from structs.Bucket import BucketManager
+from structs.IndicePrefixo import IndicePrefixo
+from structs.Tupla import Tupla
+
+def test_mixed_operations_match_sorted_model() -> None:
+    """Inserções avulsas, em lote e remoções intercaladas com consultas
+    mantêm a ordem das chaves e, entre chaves iguais, a de inserção.
+    """
+    aleatorio = random.Random(7)
+    indice = IndicePrefixo()
+    modelo: List[Tuple[str, int, Tupla]] = []
+    contador: int = 0
+    for rodada in range(0, 60):
+        lote: List[Tupla] = [
+            Tupla("".join(aleatorio.choices("abc", k=aleatorio.randint(1, 4))))
+            for _ in range(0, aleatorio.randint(0, 30))
+        ]
+        if rodada % 2 == 0:
+            indice.insert_many(lote)
+        else:
+            for tupla in lote:
+                indice.insert(tupla)
+        for tupla in lote:
+            modelo.append((tupla.get_data(), contador, tupla))
+            contador += 1
+        if modelo and rodada % 3 == 0:
+            removida = aleatorio.choice(modelo)
+            assert indice.delete(removida[2])
+            modelo.remove(removida)
+        modelo.sort(key=lambda entrada: (entrada[0], entrada[1]))
+        prefixo: str = aleatorio.choice(["", "a", "ab", "c", "ba"])
+        esperadas = [tupla for chave, _, tupla in modelo if chave.startswith(prefixo)]
+        assert indice.get_size() == len(modelo)
+        assert indice.count_prefix(prefixo) == len(esperadas)
+        assert all(a is b for a, b in zip(indice.search_prefix(prefixo), esperadas))
+        assert len(indice.search_prefix(prefixo, 3)) == min(3, len(esperadas))
+
+def test_completions_are_first_keys_alphabetically() -> None:
+    """O autocompletar retorna as primeiras chaves distintas em ordem
+    alfabética (não as mais frequentes), com a qntd. de Tuplas de cada.
+    """
+    indice = IndicePrefixo()
+    indice.insert_many([Tupla(chave) for chave in ["car", "cat", "cat", "cab", "dog"]])
+    for _ in range(0, 5):
+        indice.insert(Tupla("cz"))
+    assert indice.get_completions("c", 2) == [("cab", 1), ("car", 1)]
+    assert indice.get_completions("c") == [("cab", 1), ("car", 1), ("cat", 2), ("cz", 5)]
+    assert indice.get_completions("x") == []
+
+def test_bucket_manager_prefix_queries() -> None:
+    """O BucketManager mantém o Índice de Prefixos nas inserções,
+    cargas em massa e remoções.
+    """
+    gerenciador = BucketManager(100, indice_prefixo=True)
+    gerenciador.insert_data_batch([Tupla(f"pre{i}") for i in range(0, 50)])
+    gerenciador.insert_data(Tupla("prefixo"))
+    assert gerenciador.count_prefix("pre") == 51
+    assert gerenciador.count_prefix("pre1") == 11
+    gerenciador.delete_data("pre10")
+    assert gerenciador.count_prefix("pre1") == 10
+    assert [chave for chave, _ in gerenciador.get_completions("pre", 3)] == ["pre0", "pre1", "pre11"]
+
+def test_few_pending_on_large_index() -> None:
+    """Poucas inserções em um Índice grande (posicionadas uma a uma)
+    também ficam após as chaves iguais já indexadas.
+    """
+    indice = IndicePrefixo()
+    indice.insert_many([Tupla(f"k{i:05d}") for i in range(0, 3000)])
+    assert indice.count_prefix("k") == 3000
+    nova = Tupla("k01000")
+    indice.insert(nova)
+    assert indice.search_prefix("k01000")[-1] is nova
+    assert indice.count_prefix("k0100") == 11
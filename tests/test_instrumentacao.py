@@ -0,0 +1,91 @@
+"""Testes da Instrumentação (Histogramas, decorador e exportação)."""
+
+import random
+from typing import Iterator, List
+
+import pytest
+
+# pylint: disable=import-error
+
+from structs.Bucket import BucketManager
+from structs.Instrumentacao import Histograma, Instrumentacao
+from structs.Tupla import Tupla
+
+@pytest.fixture(autouse=True)
+def instrumentacao_limpa() -> Iterator[None]:
+    """Cada teste começa e termina com a Instrumentação desativada e vazia."""
+    Instrumentacao.disable()
+    Instrumentacao.reset()
+    yield
+    Instrumentacao.disable()
+    Instrumentacao.reset()
+
+def test_histogram_intervals_bound_relative_error() -> None:
+    """Cada valor cai em um intervalo cujo maior valor está a no
+    máximo '1 / 2 ** PRECISAO' dele, e os valores pequenos são exatos.
+    """
+    for valor in list(range(0, 200)) + [1000, 4095, 4096, 10 ** 6, 10 ** 9 + 7]:
+        limite: int = Histograma.get_upper_bound(Histograma.get_index(valor))
+        assert valor <= limite <= valor + valor / (1 << Histograma.PRECISAO)
+        if valor < 1 << (Histograma.PRECISAO + 1):
+            assert limite == valor
+
+def test_histogram_percentiles_match_sorted_values() -> None:
+    """Os percentis ficam dentro do erro relativo do valor exato e as
+    contagens acumuladas dos intervalos terminam na qntd. de valores.
+    """
+    aleatorio = random.Random(5)
+    valores: List[int] = [int(aleatorio.lognormvariate(8, 2)) for _ in range(0, 5000)]
+    histograma = Histograma()
+    for valor in valores:
+        histograma.record(valor)
+    valores.sort()
+    assert histograma.get_count() == 5000 and histograma.get_sum() == sum(valores)
+    for percentil in (50, 90, 99, 99.9):
+        exato: int = valores[int(-(-len(valores) * percentil // 100)) - 1]
+        assert exato <= histograma.get_percentile(percentil) <= exato * 1.0625
+    assert histograma.get_percentile(100) == valores[-1]
+    resumo = histograma.to_dict()
+    assert resumo["minimo"] == valores[0] and resumo["maximo"] == valores[-1]
+    assert histograma.get_buckets()[-1][1] == 5000
+    assert Histograma().get_percentile(50) == 0 and Histograma().get_mean() == 0.0
+
+def test_traced_records_only_when_enabled() -> None:
+    """O decorador só registra a latência com a Instrumentação ativa,
+    inclusive quando a função gera uma exceção.
+    """
+    @Instrumentacao.traced("teste")
+    def operacao(falhar: bool) -> int:
+        if falhar:
+            raise ValueError("falha")
+        return 1
+
+    assert operacao(False) == 1
+    assert Instrumentacao.get_histogram("teste").get_count() == 0
+    Instrumentacao.enable()
+    assert operacao(False) == 1
+    with pytest.raises(ValueError):
+        operacao(True)
+    assert Instrumentacao.get_histogram("teste").get_count() == 2
+    assert operacao.__name__ == "operacao"
+
+def test_search_stages_and_exports() -> None:
+    """As buscas registram as etapas e os contadores, exportados em
+    dicionário e no formato do Prometheus.
+    """
+    gerenciador = BucketManager(100, filtro_bloom=BucketManager.FILTRO_GLOBAL)
+    for i in range(0, 100):
+        gerenciador.insert_data(Tupla(f"k{i}"))
+    Instrumentacao.enable()
+    for chave in ("k1", "k2", "ausente"):
+        gerenciador.search_data(chave)
+    resumo = Instrumentacao.to_dict()
+    assert resumo["ativa"]
+    assert resumo["latencias_ns"]["busca"]["quantidade"] == 3
+    assert {"busca.hash", "busca.filtro"} <= set(resumo["latencias_ns"])
+    assert resumo["contadores"]["busca.sucessos"] == 2
+    assert resumo["contadores"]["busca.sucessos"] + resumo["contadores"]["busca.falhas"] == 3
+    metricas: str = Instrumentacao.to_prometheus("teste")
+    assert 'teste_latencia_segundos_count{operacao="busca"} 3' in metricas
+    assert 'teste_latencia_segundos_bucket{operacao="busca",le="+Inf"} 3' in metricas
+    assert "teste_busca_sucessos_total 2" in metricas
@@ -0,0 +1,73 @@
+"""Testes do Leitor de Arquivo (carga em lotes)."""
+
+from typing import List
+
+import pytest
+
+# pylint: disable=import-error
+
+from structs.Bucket import BucketManager
+from structs.LeitorArquivo import LeitorArquivo
+from structs.Pagina import Pagina
+from structs.TabelaColunar import TabelaColunar
+
+@pytest.mark.parametrize("conteudo", [
+    b"", b"a", b"a\n", b"a\r\nb\rc\n\nd", b"\n\n", b"x\r", b"a\r\n\r\nb", b"  b \n c"
+])
+@pytest.mark.parametrize("tamanho_bloco", [1, 2, 3, 1 << 20])
+def test_count_lines_matches_load(tmp_path, conteudo: bytes, tamanho_bloco: int) -> None:
+    """A contagem de linhas é exatamente a qntd. de Tuplas carregadas."""
+    caminho = tmp_path / "entrada.txt"
+    caminho.write_bytes(conteudo)
+    leitor = LeitorArquivo(str(caminho), tamanho_bloco)
+    tabela: TabelaColunar = leitor.load(TabelaColunar())
+    assert leitor.count_lines() == tabela.get_size()
+    assert [tabela.get_key(i) for i in range(0, tabela.get_size())] == \
+        [linha.strip().decode("UTF-8") for linha in conteudo.splitlines()]
+
+def test_load_fills_pages_and_buckets(tmp_path) -> None:
+    """A carga preenche as Paginas e os Buckets, dimensionados pela
+    contagem exata, com as mesmas estatísticas da carga em massa.
+    """
+    chaves: List[str] = [f"chave{i}" for i in range(0, 3000)]
+    caminho = tmp_path / "entrada.txt"
+    caminho.write_text("\n".join(chaves) + "\n", encoding="UTF-8")
+    leitor = LeitorArquivo(str(caminho), 1000)
+    pagina = Pagina(100)
+    bucket = BucketManager(leitor.count_lines())
+    tabela: TabelaColunar = leitor.load(TabelaColunar(), pagina, bucket)
+    serial = BucketManager(tabela.get_size())
+    serial.insert_data_from_table(tabela)
+    assert bucket.get_statistics() == serial.get_statistics()
+    assert pagina.get_page_count() == 30
+    for chave in chaves[::97]:
+        tupla, _ = bucket.search_data(chave)
+        assert tupla.get_data() == chave
+        assert pagina.search(tupla, tupla.get_page_index())[0] is not None
+
+def test_load_into_table_with_deleted_rows(tmp_path) -> None:
+    """As Tuplas de cada lote são as das novas linhas, mesmo com
+    linhas removidas antes da carga.
+    """
+    tabela = TabelaColunar()
+    tabela.insert_keys([b"x", b"y", b"z"])
+    tabela.delete(tabela.get_tuple(1))
+    caminho = tmp_path / "entrada.txt"
+    caminho.write_text("a\nb\nc\n", encoding="UTF-8")
+    bucket = BucketManager(10)
+    LeitorArquivo(str(caminho), 2).load(tabela, bucket=bucket)
+    assert [bucket.search_data(chave)[0].get_row() for chave in "abc"] == [3, 4, 5]
+    assert bucket.search_data("y") == (None, -1)
+
+def test_load_stops_reader_on_error(tmp_path) -> None:
+    """Uma falha na inserção é propagada sem deixar o leitor bloqueado."""
+    caminho = tmp_path / "entrada.txt"
+    caminho.write_text("\n".join(str(i) for i in range(0, 10000)), encoding="UTF-8")
+
+    class TabelaFalha(TabelaColunar):
+        """Tabela que falha na primeira inserção."""
+        def insert_keys(self, chaves):
+            raise RuntimeError("falha")
+
+    with pytest.raises(RuntimeError):
+        LeitorArquivo(str(caminho), 10).load(TabelaFalha())
@@ -0,0 +1,58 @@
+"""Testes das Paginas (lápides e limpeza)."""
+
+from typing import List
+
+# pylint: disable=import-error
+
+from structs.Pagina import Pagina
+from structs.TabelaColunar import TabelaColunar
+from structs.Tupla import Tupla
+
+def build(quantidade: int = 100, tamanho_pagina: int = 10) -> tuple:
+    """Cria uma Tabela com 'quantidade' chaves em Paginas."""
+    tabela = TabelaColunar()
+    tabela.insert_keys(f"k{i}".encode("UTF-8") for i in range(0, quantidade))
+    pagina = Pagina(tamanho_pagina)
+    pagina.insert(tabela)
+    return tabela, pagina
+
+def test_vacuum_rewrites_only_cleaned_blocks(tmp_path) -> None:
+    """A limpeza regrava no lugar somente os blocos das Paginas
+    limpas e descarta somente os seus quadros do Buffer Pool.
+    """
+    tabela, pagina = build()
+    arquivo = pagina.write_to_file(str(tmp_path / "paginas.bin"), 4)
+    buffer_pool = pagina.get_buffer_pool()
+    for indice_pagina in (1, 2, 5):
+        buffer_pool.pin_page(indice_pagina)
+        buffer_pool.unpin_page(indice_pagina)
+    for linha in (12, 13, 27):
+        assert pagina.delete(tabela.get_tuple(linha))
+    assert pagina.get_tombstone_count() == 3
+    blocos: List[bytes] = [arquivo.read_block(i) for i in range(0, arquivo.get_page_count())]
+    assert pagina.vacuum(1) == 2
+    # Mesmo arquivo e Buffer Pool, somente o bloco da Pagina 1 mudou.
+    assert pagina.get_file() is arquivo and pagina.get_buffer_pool() is buffer_pool
+    for indice_pagina, bloco in enumerate(blocos):
+        assert (arquivo.read_block(indice_pagina) != bloco) == (indice_pagina == 1)
+    assert arquivo.read_page(1) == [f"k{i}" for i in range(10, 20) if i not in (12, 13)]
+    acertos: int = buffer_pool.get_hit_count()
+    buffer_pool.pin_page(5)
+    buffer_pool.unpin_page(5)
+    assert buffer_pool.get_hit_count() == acertos + 1
+    assert buffer_pool.pin_page(1) == arquivo.read_page(1)
+    buffer_pool.unpin_page(1)
+    assert pagina.get_tombstone_count() == 1 and pagina.vacuum() == 1
+
+def test_vacuum_keeps_search_working(tmp_path) -> None:
+    """As Tuplas continuam nas suas Paginas após a limpeza."""
+    tabela, pagina = build()
+    pagina.write_to_file(str(tmp_path / "paginas.bin"))
+    removida = tabela.get_tuple(45)
+    pagina.delete(removida)
+    pagina.vacuum()
+    assert pagina.get_page_size(4) == 9
+    assert pagina.search(removida, 4)[0] is None
+    tupla = tabela.get_tuple(46)
+    assert pagina.search(tupla, tupla.get_page_index())[0] is not None
+    assert pagina.search(Tupla("k46"), 4)[0] is not None
@@ -0,0 +1,108 @@
+"""Testes do Servidor de Consultas (protocolo e conexões asyncio)."""
+
+import asyncio
+import json
+from typing import List
+
+# pylint: disable=import-error
+
+from server.GeradorCarga import run_load
+from server.ServidorConsultas import ServidorConsultas
+from structs.Bucket import BucketManager
+from structs.Instrumentacao import Instrumentacao
+from structs.TabelaColunar import TabelaColunar
+
+CHAVES: List[str] = [f"chave{i}" for i in range(0, 500)]
+
+def build() -> tuple:
+    """Cria o Servidor para uma Tabela com as chaves em Paginas de 10."""
+    tabela = TabelaColunar()
+    for linha, chave in enumerate(CHAVES):
+        tabela.insert_key(chave, linha // 10)
+    bucket = BucketManager(tabela.get_size())
+    bucket.insert_data_from_table(tabela)
+    return ServidorConsultas(tabela, bucket), bucket
+
+def test_execute_commands() -> None:
+    """Cada comando do protocolo responde com os campos esperados."""
+    servidor, bucket = build()
+    id_bucket: int = bucket.search_data("chave42")[1]
+    assert servidor.execute("GET\tchave42") == f"OK\t{id_bucket}\t4"
+    assert servidor.execute("get\tausente") == "NOTFOUND"
+    assert servidor.execute("MGET\tchave42\tausente") == f"OK\t{id_bucket}:4\t-"
+    assert servidor.execute("SCAN\tchave42") == "OK\t43\t4"
+    assert servidor.execute("SCAN\tchave42\t10") == "NOTFOUND"
+    assert servidor.execute(f"INFO\t{id_bucket}") == "\t".join([
+        "OK", str(bucket.get_collision_count(id_bucket)), str(bucket.get_overflow_count(id_bucket))
+    ])
+    assert servidor.execute("STATS").split("\t")[:3] == [
+        "OK", "500", str(bucket.get_bucket_count())
+    ]
+    assert servidor.get_request_count() == 7
+
+def test_execute_errors_keep_serving() -> None:
+    """Requisições inválidas respondem 'ERR' sem interromper o Servidor."""
+    servidor, _ = build()
+    for linha in ("NADA", "GET", "GET\ta\tb", "SCAN\tchave1\t-1", "SCAN\tchave1\tx",
+                  "INFO\t-1", "INFO", "TRACE\ttalvez"):
+        assert servidor.execute(linha).startswith("ERR\t")
+    assert servidor.execute("GET\tchave1").startswith("OK\t")
+
+def test_trace_and_metrics() -> None:
+    """'TRACE' liga a Instrumentação e 'METRICS' a retorna em JSON."""
+    servidor, _ = build()
+    try:
+        assert servidor.execute("TRACE\treset") == "OK\t0"
+        assert servidor.execute("TRACE\ton") == "OK\t1"
+        servidor.execute("GET\tchave1")
+        metricas = json.loads(servidor.execute("METRICS").split("\t", 1)[1])
+        assert metricas["ativa"] and metricas["latencias_ns"]["busca"]["quantidade"] == 1
+    finally:
+        assert servidor.execute("TRACE\toff") == "OK\t0"
+        Instrumentacao.reset()
+
+def test_pipelined_connection() -> None:
+    """As respostas de requisições enviadas sem esperar (pipelining)
+    chegam na ordem, inclusive a de uma linha com UTF-8 inválido e a
+    da última linha sem quebra de linha.
+    """
+    servidor, _ = build()
+
+    async def run() -> List[bytes]:
+        servidor_asyncio = await servidor.start("127.0.0.1", 0)
+        porta: int = servidor_asyncio.sockets[0].getsockname()[1]
+        try:
+            leitor, escritor = await asyncio.open_connection("127.0.0.1", porta)
+            escritor.write(b"GET\tchave1\n\xff\xfe\nGET\tausente\nGET\tchave2")
+            escritor.write_eof()
+            respostas: List[bytes] = [await leitor.readline() for _ in range(0, 4)]
+            assert await leitor.read() == b""
+            escritor.close()
+            return respostas
+        finally:
+            servidor_asyncio.close()
+            await servidor_asyncio.wait_closed()
+
+    respostas: List[bytes] = asyncio.run(run())
+    assert respostas[0].startswith(b"OK\t") and respostas[3].startswith(b"OK\t")
+    assert respostas[1].startswith(b"ERR\t") and respostas[2] == b"NOTFOUND\n"
+    assert servidor.get_connection_count() == 0
+
+def test_load_generator_against_server() -> None:
+    """O Gerador de Carga recebe uma resposta para cada requisição."""
+    servidor, _ = build()
+
+    async def run() -> dict:
+        servidor_asyncio = await servidor.start("127.0.0.1", 0)
+        porta: int = servidor_asyncio.sockets[0].getsockname()[1]
+        try:
+            return await run_load(CHAVES, 200, conexoes=2, profundidade=8,
+                                  taxa_ausentes=0.2, tamanho_lote=4, porta=porta)
+        finally:
+            servidor_asyncio.close()
+            await servidor_asyncio.wait_closed()
+
+    relatorio: dict = asyncio.run(run())
+    assert relatorio["chaves_por_segundo"] == 4 * relatorio["requisicoes_por_segundo"]
+    assert 0 < relatorio["p50"] <= relatorio["max"]
+    assert servidor.get_request_count() == 200
@@ -0,0 +1,141 @@
+"""Testes da Tabela Colunar e do seu Table Scan."""
+
+import pytest
+
+# pylint: disable=import-error
+
+from structs.Tabela import IntervaloTuplas, Tabela
+from structs.TabelaColunar import TabelaColunar
+
+MODOS = [Tabela.SCAN_EXATO, Tabela.SCAN_PREFIXO, Tabela.SCAN_SUBSTRING]
+
+@pytest.mark.parametrize("modo", MODOS)
+@pytest.mark.parametrize("chave", ["", "a"])
+def test_scan_empty_table(modo: str, chave: str) -> None:
+    """Uma Tabela vazia não encontra nada, nem com a chave vazia."""
+    tabela = TabelaColunar()
+    assert list(tabela.scan(chave, modo)) == []
+    assert tabela.search_row(chave, modo) == (-1, -1)
+
+@pytest.mark.parametrize("modo", MODOS)
+def test_scan_matches_naive(modo: str) -> None:
+    """O Table Scan encontra as mesmas linhas que uma comparação
+    linha a linha, ignorando as linhas removidas.
+    """
+    chaves = ["ab", "abc", "", "b\nab", "cab", "ab", "xyz", "a"]
+    tabela = TabelaColunar()
+    for chave in chaves:
+        tabela.insert_key(chave)
+    tabela.delete(tabela.get_tuple(5))
+    comparacoes = {
+        Tabela.SCAN_EXATO: lambda chave, dado: chave == dado,
+        Tabela.SCAN_PREFIXO: lambda chave, dado: chave.startswith(dado),
+        Tabela.SCAN_SUBSTRING: lambda chave, dado: dado in chave
+    }
+    for dado in ["ab", "", "a", "b", "zz", "\n"]:
+        esperadas = [
+            linha for linha, chave in enumerate(chaves)
+            if linha != 5 and comparacoes[modo](chave, dado)
+        ]
+        assert [tupla.get_row() for tupla in tabela.scan(dado, modo)] == esperadas
+        assert tabela.search_row(dado, modo)[0] == (esperadas[0] if esperadas else -1)
+
+def test_deletes_interleaved_with_inserts() -> None:
+    """Remoções (marcadas em O(1)) e inserções intercaladas mantêm as
+    linhas, o tamanho, as posições do Table Scan e as chaves empacotadas.
+    """
+    tabela = TabelaColunar()
+    tabela.insert_keys(f"k{i}".encode("UTF-8") for i in range(0, 1000))
+    removidas = set(range(0, 1000, 3))
+    for linha in sorted(removidas, reverse=True):
+        assert tabela.delete(tabela.get_tuple(linha))
+        assert tabela.get_size() == 1000 - len([r for r in removidas if r >= linha])
+    assert not tabela.delete(tabela.get_tuple(0))
+    tabela.insert_key("nova")
+    esperadas = [linha for linha in range(0, 1000) if linha not in removidas] + [1000]
+    assert list(tabela.get_rows()) == esperadas
+    assert [tupla.get_row() for tupla in tabela.get_tuples()] == esperadas
+    chaves, deslocamentos = tabela.get_packed_keys()
+    assert deslocamentos.typecode == "Q"
+    assert chaves[deslocamentos[-2]:deslocamentos[-1]] == b"nova"
+    assert len(deslocamentos) == len(esperadas) + 1
+    # 'k4' é a 3ª linha não removida (0 e 3 foram removidas).
+    assert len(tabela.table_scan("k4")) == 3
+    tabela.delete(tabela.get_tuple(1))
+    assert len(tabela.table_scan("k4")) == 2
+
+def test_set_key_shifts_following_offsets() -> None:
+    """Trocar uma chave por outra de tamanho diferente desloca as seguintes."""
+    tabela = TabelaColunar()
+    tabela.insert_keys([b"aa", b"bbb", b"c"])
+    tabela.set_key(0, "x")
+    tabela.set_key(1, "yyyyy")
+    assert [tabela.get_key(linha) for linha in range(0, 3)] == ["x", "yyyyy", "c"]
+    assert tabela.search_row("c")[0] == 2
+    chaves, deslocamentos = tabela.get_packed_keys()
+    copia = TabelaColunar.from_packed_keys(chaves, deslocamentos.tobytes())
+    assert [copia.get_key(linha) for linha in range(0, 3)] == ["x", "yyyyy", "c"]
+
+@pytest.mark.parametrize("modo", MODOS)
+def test_streaming_scan_limits_match_generic_scan(modo: str) -> None:
+    """O Table Scan sob demanda respeita o limite e a qntd. percorrida,
+    igual ao 'Tabela.scan()' genérico (que percorre as Tuplas).
+    """
+    tabela = TabelaColunar()
+    tabela.insert_keys(f"k{i % 7}_{i}".encode("UTF-8") for i in range(0, 200))
+    tabela.delete(tabela.get_tuple(3))
+    for limite, quantidade_busca in [(None, None), (5, None), (None, 50), (3, 20), (0, None)]:
+        colunar = [tupla.get_row() for tupla in tabela.scan("k3", modo, limite, quantidade_busca)]
+        generico = [
+            tupla.get_row() for tupla in Tabela.scan(tabela, "k3", modo, limite, quantidade_busca)
+        ]
+        assert colunar == generico
+        if limite is not None:
+            assert len(colunar) <= limite
+    varredura = tabela.scan("k1", Tabela.SCAN_PREFIXO)
+    assert next(varredura).get_row() == 1 and next(varredura).get_row() == 8
+    with pytest.raises(ValueError):
+        list(tabela.scan("k1", "inexistente"))
+
+def test_table_scan_returns_interval_without_copy() -> None:
+    """O Table Scan retorna as Tuplas até o dado como um intervalo da
+    Tabela, sem copiá-las, e respeita a qntd. percorrida.
+    """
+    tabela = TabelaColunar()
+    tabela.insert_keys(f"k{i}".encode("UTF-8") for i in range(0, 100))
+    tabela.delete(tabela.get_tuple(0))
+    intervalo = tabela.table_scan("k10")
+    assert isinstance(intervalo, IntervaloTuplas) and len(intervalo) == 10
+    assert intervalo[0].get_row() == 1 and intervalo[-1].get_data() == "k10"
+    assert [tupla.get_row() for tupla in intervalo[2:5]] == [3, 4, 5]
+    assert [tupla.get_row() for tupla in intervalo] == list(range(1, 11))
+    with pytest.raises(IndexError):
+        intervalo[10]  # pylint: disable=pointless-statement
+    assert tabela.table_scan("k10", 9) is None
+    assert len(tabela.table_scan("k10", 10)) == 10
+    assert tabela.table_scan("k0") is None
+
+@pytest.mark.parametrize("com_numpy", [True, False])
+def test_scan_buffer_with_and_without_numpy(monkeypatch, com_numpy: bool) -> None:
+    """O buffer do Table Scan (com ou sem NumPy) envolve cada chave em
+    '\\n', é remontado após 'set_key()' e encontra chaves não ASCII.
+    """
+    if com_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr("structs.TabelaColunar.numpy", None)
+    chaves = ["ação", "", "naïve", "a\nb", "日本語", "ação"]
+    tabela = TabelaColunar()
+    for chave in chaves:
+        tabela.insert_key(chave)
+    esperado: bytes = b"\n" + b"".join(chave.encode("UTF-8") + b"\n" for chave in chaves)
+    assert tabela.get_scan_buffer() == esperado
+    assert [tupla.get_row() for tupla in tabela.scan("ação")] == [0, 5]
+    assert [tupla.get_row() for tupla in tabela.scan("本", Tabela.SCAN_SUBSTRING)] == [4]
+    assert [tupla.get_row() for tupla in tabela.scan("b", Tabela.SCAN_PREFIXO)] == []
+    assert tabela.search_row("a\nb") == (3, 0)
+    assert tabela.search_row("") == (1, 0)
+    tabela.set_key(2, "ingênuo")
+    assert tabela.get_scan_buffer() == esperado.replace("naïve".encode("UTF-8"),
+                                                       "ingênuo".encode("UTF-8"))
+    assert tabela.search_row("ingênuo")[0] == 2 and tabela.search_row("naïve")[0] == -1